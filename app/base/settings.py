@@ -3,11 +3,95 @@ from pydantic_settings import BaseSettings
 
 class Settings(BaseSettings):
     DATABASE_URL: str
+    # MongoDB 커넥션 풀 설정, MONGO_COMPRESSORS 예: "zstd,snappy,zlib" (빈 값이면 압축 안 함)
+    MONGO_MAX_POOL_SIZE: int = 100
+    MONGO_MIN_POOL_SIZE: int = 10
+    MONGO_MAX_IDLE_TIME_MS: int = 60000
+    MONGO_WAIT_QUEUE_TIMEOUT_MS: int = 5000
+    MONGO_CONNECT_TIMEOUT_MS: int = 5000
+    MONGO_COMPRESSORS: str = ""
+    # 요청을 받기 전에 미리 열어둘 커넥션 수
+    MONGO_WARMUP_CONNECTIONS: int = 10
+    # MongoDB 명령 실행 시간 기록, MONGO_SLOW_QUERY_MS 이상 걸린 명령은 로그로 남김
+    MONGO_COMMAND_MONITORING: bool = False
+    MONGO_SLOW_QUERY_MS: float = 100.0
+    MONGO_COMMAND_HISTOGRAM_WINDOW_SECONDS: float = 60.0
+
+    # 단계별(bcrypt, korcen, mongo 등) 처리 시간을 Server-Timing 헤더로 응답
+    # SERVER_TIMING_LOG가 켜져 있으면 요청마다 JSON 로그 한 줄로도 남김
+    SERVER_TIMING_ENABLED: bool = True
+    SERVER_TIMING_LOG: bool = False
+
+    # MAIN 모드에서도 /metrics 라우트를 노출 (MAIN이 아니면 항상 노출)
+    METRICS_ENABLED: bool = False
+
     JWT_SECRET_KEY: str
     JWT_ALGORITHM: str
     JWT_ACCESS_TOKEN_EXPIRE_MINUTES: int
+    JWT_REFRESH_TOKEN_EXPIRE_MINUTES: int = 60 * 24 * 14
+    # /board/validate가 발급하는 칠판 이름 검증 영수증 유효 시간
+    BOARD_NAME_RECEIPT_EXPIRE_MINUTES: int = 10
     MODE: str
 
+    # bcrypt 작업 비용(2^N회), benchmarks/bcrypt_cost.py 결과를 보고 결정
+    BCRYPT_ROUNDS: int = 12
+
+    # CPU 작업(bcrypt 등) 프로세스 풀 설정, 0이면 이벤트 루프에서 바로 실행
+    CPU_POOL_WORKERS: int = 2
+    CPU_POOL_MAX_PENDING: int = 64
+    CPU_POOL_TIMEOUT_SECONDS: float = 5.0
+
+    # 칠판 조회 캐시 설정, 다른 워커의 변경은 EventBus로 무효화되고
+    # TTL은 이벤트가 유실된 경우(브로커 전송 실패 등)의 최대 지연 시간
+    BOARD_CACHE_MAX_SIZE: int = 1024
+    BOARD_CACHE_TTL_SECONDS: float = 5.0
+
+    # 사용 중인 칠판 이름 Bloom filter (중복 이름 조회 생략)
+    BOARD_NAME_FILTER_MIN_CAPACITY: int = 10000
+    BOARD_NAME_FILTER_ERROR_RATE: float = 0.01
+    BOARD_NAME_FILTER_REBUILD_SECONDS: float = 600.0
+
+    # 비속어 검사 결과 LRU 캐시 크기
+    PROFANITY_CACHE_SIZE: int = 4096
+    # POST /memo/validate/batch 한 번에 검사할 수 있는 최대 메모 수
+    MEMO_VALIDATE_BATCH_MAX_SIZE: int = 100
+
+    # 새 메모 SSE 스트림, 큐가 가득 찬 느린 연결은 끊음
+    MEMO_STREAM_QUEUE_SIZE: int = 16
+    MEMO_STREAM_HEARTBEAT_SECONDS: float = 15.0
+
+    # 메모 증분 조회, 공개 시각(published_at)은 워커마다 따로 기록되어 순서가 조금 어긋날 수 있으므로
+    # 커서보다 MEMO_SYNC_OVERLAP_SECONDS만큼 앞에서부터 다시 조회
+    MEMO_SYNC_PAGE_SIZE: int = 500
+    MEMO_SYNC_OVERLAP_SECONDS: int = 5
+
+    # 워커 간 이벤트 버스, local: Unix 도메인 소켓 / none: 현재 워커에만 전달
+    EVENT_BUS_BACKEND: str = "local"
+    # 비워두면 gunicorn.conf.py가 bind 주소별로 지정 (gunicorn 밖에서는 부모 프로세스별)
+    EVENT_BUS_SOCKET_DIR: str = ""
+
+    # True면 메모를 pending 상태로 먼저 저장하고 비속어 검사는 백그라운드에서 처리
+    MEMO_MODERATION_ASYNC: bool = False
+    MEMO_MODERATION_WORKERS: int = 2
+    MEMO_MODERATION_BATCH_SIZE: int = 32
+    MEMO_MODERATION_QUEUE_SIZE: int = 1024
+    # 검사를 맡은 워커가 이 시간 안에 끝내지 못한 pending 메모는 다른 워커가 다시 가져감
+    # (재시도 대기 시간 합계보다 길게 설정)
+    MEMO_MODERATION_LEASE_SECONDS: float = 60.0
+    # 맡은 워커가 없는 pending 메모(큐가 가득 찼거나 검사에 실패한 메모)를 찾는 주기
+    MEMO_MODERATION_SWEEP_SECONDS: float = 30.0
+    # 검사 실패 시 재시도 횟수와 첫 재시도 대기 시간 (재시도마다 2배로 늘어남)
+    MEMO_MODERATION_MAX_RETRIES: int = 3
+    MEMO_MODERATION_RETRY_BACKOFF_SECONDS: float = 1.0
+
+    # 로그인 성공한 비밀번호를 잠시 보관해 반복 로그인 시 bcrypt 생략
+    LOGIN_CACHE_ENABLED: bool = False
+    LOGIN_CACHE_MAX_SIZE: int = 4096
+    LOGIN_CACHE_TTL_SECONDS: float = 300.0
+
+    # 디코딩한 JWT를 토큰 만료 시각까지 보관하는 캐시 크기
+    JWT_DECODE_CACHE_SIZE: int = 10000
+
     class Config:
         env_file = ".env"
 
@@ -0,0 +1,13 @@
+class EventType:
+    """
+    EventBus로 워커 사이에 전달하는 이벤트 종류
+
+    BOARD_CREATED: {"board_name": str}, 칠판이 생성됨
+    BOARD_CHANGED: {"board_id": str}, 칠판 조회 결과(메모 목록 등)가 바뀜
+    MEMO_PUBLISHED: {"board_id": str, "memo_id": str, "locate_idx": int, "bg_num": int},
+        메모가 공개됨
+    """
+
+    BOARD_CREATED = "board.created"
+    BOARD_CHANGED = "board.changed"
+    MEMO_PUBLISHED = "memo.published"
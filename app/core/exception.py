@@ -162,3 +162,35 @@ class SameLocateIdxMemoException(BaseHTTPException):
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="메모 위치가 중복되었습니다.",
         )
+
+
+class NotBoardOwnerException(BaseHTTPException):
+    def __init__(self) -> None:
+        super().__init__(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="칠판 주인만 조회할 수 있습니다.",
+        )
+
+
+class InvalidCursorException(BaseHTTPException):
+    def __init__(self) -> None:
+        super().__init__(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="유효하지 않은 커서입니다.",
+        )
+
+
+class CPUPoolBusyException(BaseHTTPException):
+    def __init__(self) -> None:
+        super().__init__(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="요청이 많아 처리할 수 없습니다. 잠시 후 다시 시도해주세요.",
+        )
+
+
+class CPUPoolTimeoutException(BaseHTTPException):
+    def __init__(self) -> None:
+        super().__init__(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="요청 처리 시간이 초과되었습니다. 잠시 후 다시 시도해주세요.",
+        )
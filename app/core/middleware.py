@@ -0,0 +1,127 @@
+import json
+import logging
+import time
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.base.settings import settings
+from app.db.identity_map import IdentityMap
+from app.utils.metrics import Metrics
+from app.utils.timing import ServerTiming
+
+logger = logging.getLogger(__name__)
+
+
+class IdentityMapMiddleware:
+    """
+    HTTP 요청마다 새 identity map을 열고 요청이 끝나면 닫는 미들웨어
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        token = IdentityMap.start()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            IdentityMap.reset(token)
+
+
+class ServerTimingMiddleware:
+    """
+    HTTP 요청마다 단계별 처리 시간을 모아 Server-Timing 헤더로 응답하는 미들웨어
+
+    - 서비스 코드가 ServerTiming에 기록한 시간을 단계별로 합산해 헤더에 추가
+    - SERVER_TIMING_LOG가 켜져 있으면 요청이 끝날 때 JSON 로그 한 줄을 남김
+    - 스트리밍 응답은 헤더를 보내는 시점까지의 시간만 헤더에 포함됨
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started_at = time.perf_counter()
+        status_code = 500
+
+        async def send_with_timing(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                total_ms = (time.perf_counter() - started_at) * 1000
+                headers = MutableHeaders(scope=message)
+                headers.append("Server-Timing", ServerTiming.header(total_ms))
+            await send(message)
+
+        token = ServerTiming.start()
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            if settings.SERVER_TIMING_LOG:
+                logger.info(
+                    json.dumps(
+                        {
+                            "method": scope["method"],
+                            "path": scope["path"],
+                            "status": status_code,
+                            "total_ms": round(
+                                (time.perf_counter() - started_at) * 1000, 1
+                            ),
+                            "stages_ms": {
+                                name: round(ms, 1)
+                                for name, ms in ServerTiming.summary().items()
+                            },
+                        }
+                    )
+                )
+            ServerTiming.reset(token)
+
+
+class MetricsMiddleware:
+    """
+    HTTP 요청의 처리 시간, 상태 코드, 처리 중인 요청 수를 Prometheus 메트릭으로 기록하는 미들웨어
+
+    경로 대신 라우트 템플릿(/board/{board_id})을 라벨로 사용해 라벨 수가 늘어나지 않게 하고,
+    일치하는 라우트가 없는 요청은 "unmatched"로 기록한다.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status_code = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        in_progress = Metrics.http_requests_in_progress.labels(method)
+        in_progress.inc()
+        started_at = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            in_progress.dec()
+            # 라우터가 일치한 라우트를 scope에 기록함
+            route = scope.get("route")
+            template = getattr(route, "path_format", "unmatched")
+            Metrics.http_request_duration.labels(method, template).observe(
+                time.perf_counter() - started_at
+            )
+            Metrics.http_requests.labels(method, template, str(status_code)).inc()
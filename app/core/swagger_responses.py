@@ -21,6 +21,11 @@ from app.core.exception import (
     WrongNameOrPasswordInValidateLoginException,
     SameLocateIdxMemoException,
     BoardGraduatedException,
+    CPUPoolBusyException,
+    CPUPoolTimeoutException,
+    NotBoardOwnerException,
+    InvalidTokenException,
+    InvalidCursorException,
 )
 from app.utils.responses_creater import ResponsesCreater
 
@@ -45,6 +50,8 @@ def post_board_responses() -> Dict[Any, Any]:
             CanNotUseSpaceInPasswordException()._responses(),
             MinLengthInPasswordException()._responses(),
             ValidateDateStrException()._responses(),
+            CPUPoolBusyException()._responses(),
+            CPUPoolTimeoutException()._responses(),
         ]
     )
 
@@ -57,6 +64,19 @@ def post_board_login_responses() -> Dict[Any, Any]:
             MinLengthInPasswordException()._responses(),
             WrongNameOrPasswordInValidateLoginException()._responses(),
             WrongNameOrPasswordInValidateLoginException()._responses(),
+            CPUPoolBusyException()._responses(),
+            CPUPoolTimeoutException()._responses(),
+        ]
+    )
+
+
+def post_board_token_refresh_responses() -> Dict[Any, Any]:
+    return response_creater.responses_creater(
+        [
+            ExpiredTokenException()._responses(),
+            InvalidTokenException()._responses(),
+            InvalidTokenDataException()._responses(),
+            DoesNotExistBoardException()._responses(),
         ]
     )
 
@@ -104,6 +124,36 @@ def get_memo_momoid_responses() -> Dict[Any, Any]:
     )
 
 
+def get_board_boardid_memo_responses() -> Dict[Any, Any]:
+    return response_creater.responses_creater(
+        [
+            DoesNotExistBoardException()._responses(),
+            ExpiredTokenException()._responses(),
+            InvalidTokenException()._responses(),
+            InvalidTokenDataException()._responses(),
+            NotBoardOwnerException()._responses(),
+            BoardGraduatedException(date="YYYY-MM-DD")._responses(),
+        ]
+    )
+
+
+def get_board_boardid_memos_responses() -> Dict[Any, Any]:
+    return response_creater.responses_creater(
+        [
+            InvalidCursorException()._responses(),
+            DoesNotExistBoardException()._responses(),
+        ]
+    )
+
+
+def get_board_boardid_memo_stream_responses() -> Dict[Any, Any]:
+    return response_creater.responses_creater(
+        [
+            DoesNotExistBoardException()._responses(),
+        ]
+    )
+
+
 def get_board_boardid_responses() -> Dict[Any, Any]:
     return response_creater.responses_creater(
         [
@@ -124,3 +174,12 @@ def get_memo_validate_responses() -> Dict[Any, Any]:
             ContentLengthException()._responses(),
         ]
     )
+
+
+def post_memo_validate_batch_responses() -> Dict[Any, Any]:
+    return response_creater.responses_creater(
+        [
+            CPUPoolBusyException()._responses(),
+            CPUPoolTimeoutException()._responses(),
+        ]
+    )
@@ -1,8 +1,105 @@
-from motor.motor_asyncio import AsyncIOMotorClient
+import asyncio
+from typing import Any
+
+from motor.motor_asyncio import (
+    AsyncIOMotorClient,
+    AsyncIOMotorCollection,
+    AsyncIOMotorDatabase,
+)
+
 from app.base.settings import settings
+from app.db.monitoring import (
+    CommandMonitor,
+    MetricsCommandListener,
+    PoolMonitor,
+    TimingCommandListener,
+)
+
+
+class Database:
+    """
+    MongoDB 클라이언트를 관리하는 클래스
+
+    - lifespan에서 connect/warmup/close를 호출해 워커마다 클라이언트를 열고 닫음
+    - 커넥션 풀 크기, 타임아웃, 압축은 Settings(MONGO_*)에서 설정
+    - MONGO_COMMAND_MONITORING이 켜져 있으면 명령 실행 시간과 느린 명령을 기록
+    - 명령 실행 시간은 항상 Prometheus 메트릭(mongo_command_duration_seconds)에 기록
+    - SERVER_TIMING_ENABLED가 켜져 있으면 명령 실행 시간을 요청의 Server-Timing에 기록
+    - lifespan을 거치지 않는 경우(테스트 등) 처음 사용할 때 연결
+    """
+
+    DATABASE_NAME = "base"
+
+    _client: AsyncIOMotorClient | None = None  # type: ignore[type-arg]
+    pool_monitor = PoolMonitor(max_pool_size=settings.MONGO_MAX_POOL_SIZE)
+    command_monitor = CommandMonitor(
+        slow_query_ms=settings.MONGO_SLOW_QUERY_MS,
+        window_seconds=settings.MONGO_COMMAND_HISTOGRAM_WINDOW_SECONDS,
+    )
+
+    @classmethod
+    def connect(cls) -> None:
+        """
+        MongoDB 클라이언트를 만드는 함수 (커넥션은 사용할 때 또는 warmup에서 열림)
+        """
+        if cls._client is not None:
+            return
+
+        options: dict[str, Any] = {
+            "maxPoolSize": settings.MONGO_MAX_POOL_SIZE,
+            "minPoolSize": settings.MONGO_MIN_POOL_SIZE,
+            "maxIdleTimeMS": settings.MONGO_MAX_IDLE_TIME_MS,
+            "waitQueueTimeoutMS": settings.MONGO_WAIT_QUEUE_TIMEOUT_MS,
+            "connectTimeoutMS": settings.MONGO_CONNECT_TIMEOUT_MS,
+        }
+        if settings.MONGO_COMPRESSORS:
+            options["compressors"] = settings.MONGO_COMPRESSORS
+
+        event_listeners: list[Any] = [cls.pool_monitor, MetricsCommandListener()]
+        if settings.MONGO_COMMAND_MONITORING:
+            event_listeners.append(cls.command_monitor)
+        if settings.SERVER_TIMING_ENABLED:
+            event_listeners.append(TimingCommandListener())
+
+        cls._client = AsyncIOMotorClient(
+            settings.DATABASE_URL, event_listeners=event_listeners, **options
+        )
+
+    @classmethod
+    async def warmup(cls) -> None:
+        """
+        요청을 받기 전에 MONGO_WARMUP_CONNECTIONS개의 커넥션을 미리 여는 함수
+
+        동시에 ping을 보내 각 요청이 서로 다른 커넥션을 사용하도록 한다.
+        """
+        await asyncio.gather(
+            *(
+                cls.database().command("ping")
+                for _ in range(settings.MONGO_WARMUP_CONNECTIONS)
+            )
+        )
+
+    @classmethod
+    def close(cls) -> None:
+        client, cls._client = cls._client, None
+        if client is not None:
+            client.close()
+
+    @classmethod
+    def database(cls) -> AsyncIOMotorDatabase:  # type: ignore[type-arg]
+        if cls._client is None:
+            cls.connect()
+        assert cls._client is not None
+        return cls._client[cls.DATABASE_NAME]
+
+    @classmethod
+    def collection(cls, name: str) -> AsyncIOMotorCollection:  # type: ignore[type-arg]
+        return cls.database()[name]
 
-# MongoDB 클라이언트 설정
-client = AsyncIOMotorClient(settings.DATABASE_URL)  # type: ignore
+    @classmethod
+    def stats(cls) -> dict[str, float]:
+        return cls.pool_monitor.stats()
 
-# 필요한 MongoDB 컬렉션을 가져옵니다
-db = client["base"]
+    @classmethod
+    def command_stats(cls) -> dict[str, dict[str, Any]]:
+        return cls.command_monitor.stats()
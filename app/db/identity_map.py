@@ -0,0 +1,76 @@
+from contextvars import ContextVar, Token
+from typing import Any, Awaitable, Callable, TypeVar
+
+from app.utils.metrics import Metrics
+
+T = TypeVar("T")
+
+_identity_map: ContextVar[dict[tuple[str, str], Any] | None] = ContextVar(
+    "identity_map", default=None
+)
+
+
+class IdentityMap:
+    """
+    요청 단위로 조회한 문서를 (컬렉션 이름, id) 기준으로 보관하는 클래스
+
+    같은 요청 안에서 같은 문서를 여러 번 조회해도 MongoDB에는 한 번만 요청한다.
+    요청 밖(start가 호출되지 않은 컨텍스트)에서는 캐싱하지 않고 매번 조회한다.
+    절약한 조회 수(hit)와 실제 조회 수(miss)는 cache_lookups 메트릭으로 내보낸다.
+    """
+
+    _hit_metric = Metrics.cache_lookups.labels("identity_map", "hit")
+    _miss_metric = Metrics.cache_lookups.labels("identity_map", "miss")
+
+    @classmethod
+    def start(cls) -> Token[dict[tuple[str, str], Any] | None]:
+        """
+        새 요청의 identity map을 시작하는 함수
+        """
+        return _identity_map.set({})
+
+    @classmethod
+    def reset(cls, token: Token[dict[tuple[str, str], Any] | None]) -> None:
+        """
+        요청이 끝나면 identity map을 정리하는 함수
+        """
+        _identity_map.reset(token)
+
+    @classmethod
+    async def get_or_load(
+        cls, collection_name: str, key: str, loader: Callable[[], Awaitable[T]]
+    ) -> T:
+        """
+        요청 안에서 이미 조회한 문서가 있으면 반환하고, 없으면 조회 후 보관하는 함수
+
+        Parameters
+        ---
+        collection_name: str, 컬렉션 이름
+        key: str, 문서 id
+        loader: Callable, 실제로 문서를 조회하는 함수
+
+        Return
+        ---
+        T, 조회된 문서 (없으면 None도 그대로 보관)
+        """
+        documents = _identity_map.get()
+        if documents is None:
+            return await loader()
+
+        if (collection_name, key) in documents:
+            cls._hit_metric.inc()
+            return documents[(collection_name, key)]  # type: ignore[no-any-return]
+
+        cls._miss_metric.inc()
+        document = await loader()
+        documents[(collection_name, key)] = document
+        return document
+
+    @classmethod
+    def discard(cls, collection_name: str, key: str) -> None:
+        """
+        문서가 변경되었을 때 보관 중인 문서를 제거하는 함수
+        """
+        documents = _identity_map.get()
+        if documents is not None:
+            documents.pop((collection_name, key), None)
@@ -0,0 +1,61 @@
+from pymongo import IndexModel
+from pymongo.errors import OperationFailure
+
+from app.db.database import Database
+
+
+class IndexRegistry:
+    """
+    컬렉션별 인덱스를 모아두고 앱 시작 시 생성하는 클래스
+
+    각 Collection 클래스가 정의될 때 register로 인덱스를 등록하고,
+    lifespan에서 ensure_indexes를 호출해 한 번에 생성한다.
+    """
+
+    _indexes: dict[str, list[IndexModel]] = {}
+    _obsolete: dict[str, list[str]] = {}
+
+    # IndexNotFound, 다른 워커가 먼저 삭제한 경우
+    _INDEX_NOT_FOUND = 27
+
+    @classmethod
+    def register(
+        cls,
+        collection_name: str,
+        indexes: list[IndexModel],
+        obsolete: list[str] | None = None,
+    ) -> None:
+        """
+        컬렉션에 생성할 인덱스를 등록하는 함수
+
+        인덱스의 키나 옵션을 바꿀 때는 기존 인덱스를 고치지 않고 새 이름으로
+        등록한 뒤, 기존 인덱스 이름을 obsolete에 남긴다.
+
+        Parameters
+        ---
+        collection_name: str, 컬렉션 이름
+        indexes: list[IndexModel], 생성할 인덱스 목록
+        obsolete: list[str] | None, 새 인덱스를 만든 뒤 삭제할 기존 인덱스 이름 목록
+        """
+        cls._indexes.setdefault(collection_name, []).extend(indexes)
+        cls._obsolete.setdefault(collection_name, []).extend(obsolete or [])
+
+    @classmethod
+    async def ensure_indexes(cls) -> None:
+        """
+        등록된 인덱스를 모두 생성하고 더 이상 쓰지 않는 인덱스를 삭제하는 함수
+
+        새 인덱스를 모두 만든 뒤에 기존 인덱스를 삭제하므로, 여러 워커가 동시에
+        실행해도 unique 제약이 없는 구간이 생기지 않는다.
+        같은 이름의 인덱스가 다른 옵션으로 이미 있으면 예외가 발생한다.
+        """
+        for collection_name, indexes in cls._indexes.items():
+            collection = Database.collection(collection_name)
+            await collection.create_indexes(indexes)
+
+            for index_name in cls._obsolete.get(collection_name, []):
+                try:
+                    await collection.drop_index(index_name)
+                except OperationFailure as e:
+                    if e.code != cls._INDEX_NOT_FOUND:
+                        raise
@@ -0,0 +1,361 @@
+import json
+import logging
+import threading
+import time
+from typing import Any, Mapping
+
+from pymongo import monitoring
+
+from app.utils.metrics import Metrics
+from app.utils.timing import ServerTiming
+
+logger = logging.getLogger(__name__)
+
+
+class PoolMonitor(monitoring.ConnectionPoolListener):
+    """
+    MongoDB 커넥션 풀 사용량을 기록하는 pymongo 리스너
+
+    - checkout 대기 시간(횟수, 합계, 최대)과 실패 횟수
+    - 사용 중인 커넥션 수, 열려 있는 커넥션 수
+    - 같은 값을 Prometheus 메트릭(mongo_pool_*)에도 기록
+    pymongo는 motor의 스레드에서 이벤트를 호출하므로 lock으로 보호한다.
+    """
+
+    def __init__(self, max_pool_size: int) -> None:
+        self.max_pool_size = max_pool_size
+        self._lock = threading.Lock()
+        self.open_connections = 0
+        self.in_use = 0
+        self.max_in_use = 0
+        self.checkouts = 0
+        self.checkout_failures = 0
+        self.wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+        self.clears = 0
+        self._open_gauge = Metrics.mongo_pool_connections.labels("open")
+        self._in_use_gauge = Metrics.mongo_pool_connections.labels("in_use")
+        Metrics.mongo_pool_connections.labels("max").set(max_pool_size)
+
+    def connection_created(self, event: monitoring.ConnectionCreatedEvent) -> None:
+        with self._lock:
+            self.open_connections += 1
+            self._open_gauge.set(self.open_connections)
+
+    def connection_closed(self, event: monitoring.ConnectionClosedEvent) -> None:
+        with self._lock:
+            self.open_connections -= 1
+            self._open_gauge.set(self.open_connections)
+
+    def connection_checked_out(
+        self, event: monitoring.ConnectionCheckedOutEvent
+    ) -> None:
+        with self._lock:
+            self.checkouts += 1
+            self.in_use += 1
+            self.max_in_use = max(self.max_in_use, self.in_use)
+            self._in_use_gauge.set(self.in_use)
+            self._record_wait(event.duration, outcome="success")
+
+    def connection_check_out_failed(
+        self, event: monitoring.ConnectionCheckOutFailedEvent
+    ) -> None:
+        with self._lock:
+            self.checkout_failures += 1
+            self._record_wait(event.duration, outcome="failure")
+
+    def _record_wait(self, duration: float | None, outcome: str) -> None:
+        # lock 안에서 호출
+        if duration is not None:
+            self.wait_seconds += duration
+            self.max_wait_seconds = max(self.max_wait_seconds, duration)
+            Metrics.mongo_pool_checkout_wait.labels(outcome).observe(duration)
+
+    def connection_checked_in(self, event: monitoring.ConnectionCheckedInEvent) -> None:
+        with self._lock:
+            self.in_use -= 1
+            self._in_use_gauge.set(self.in_use)
+
+    def pool_cleared(self, event: monitoring.PoolClearedEvent) -> None:
+        with self._lock:
+            self.clears += 1
+        Metrics.mongo_pool_clears.inc()
+
+    # 사용하지 않는 이벤트
+    def pool_created(self, event: monitoring.PoolCreatedEvent) -> None:
+        pass
+
+    def pool_ready(self, event: monitoring.PoolReadyEvent) -> None:
+        pass
+
+    def pool_closed(self, event: monitoring.PoolClosedEvent) -> None:
+        pass
+
+    def connection_ready(self, event: monitoring.ConnectionReadyEvent) -> None:
+        pass
+
+    def connection_check_out_started(
+        self, event: monitoring.ConnectionCheckOutStartedEvent
+    ) -> None:
+        pass
+
+    def stats(self) -> dict[str, float]:
+        with self._lock:
+            return {
+                "open_connections": self.open_connections,
+                "in_use": self.in_use,
+                "max_in_use": self.max_in_use,
+                "occupancy": (
+                    self.in_use / self.max_pool_size if self.max_pool_size else 0.0
+                ),
+                "checkouts": self.checkouts,
+                "checkout_failures": self.checkout_failures,
+                "checkout_wait_seconds": self.wait_seconds,
+                "checkout_wait_avg_seconds": (
+                    self.wait_seconds / self.checkouts if self.checkouts else 0.0
+                ),
+                "checkout_wait_max_seconds": self.max_wait_seconds,
+                "pool_clears": self.clears,
+            }
+
+
+class RollingHistogram:
+    """
+    최근 window_seconds 동안의 값 분포를 구간(bucket)별로 세는 히스토그램
+
+    window를 slot_count개의 시간 칸으로 나눠 칸마다 따로 세고,
+    오래된 칸은 다시 사용할 때 비운다.
+    """
+
+    def __init__(
+        self, bounds: tuple[float, ...], window_seconds: float, slot_count: int = 6
+    ) -> None:
+        self.bounds = bounds
+        self.slot_seconds = window_seconds / slot_count
+        self._slot_ids = [-1] * slot_count
+        self._slots = [[0] * (len(bounds) + 1) for _ in range(slot_count)]
+        self.count = 0
+        self.total = 0.0
+
+    def _slot(self, now: float) -> list[int]:
+        slot_id = int(now / self.slot_seconds)
+        index = slot_id % len(self._slots)
+        if self._slot_ids[index] != slot_id:
+            self._slot_ids[index] = slot_id
+            self._slots[index] = [0] * (len(self.bounds) + 1)
+        return self._slots[index]
+
+    def record(self, value: float, now: float) -> None:
+        slot = self._slot(now)
+        bucket = next(
+            (i for i, bound in enumerate(self.bounds) if value <= bound),
+            len(self.bounds),
+        )
+        slot[bucket] += 1
+        self.count += 1
+        self.total += value
+
+    def snapshot(self, now: float) -> list[int]:
+        """
+        최근 window 동안 구간별 개수 (마지막 값은 가장 큰 bound 초과)
+        """
+        current = int(now / self.slot_seconds)
+        counts = [0] * (len(self.bounds) + 1)
+        for slot_id, slot in zip(self._slot_ids, self._slots):
+            if current - slot_id < len(self._slots):
+                counts = [a + b for a, b in zip(counts, slot)]
+        return counts
+
+
+def redact_filter(value: Any) -> Any:
+    """
+    조회 조건의 값은 "?"로 바꾸고 필드 이름과 연산자만 남기는 함수
+
+    Parameter
+    ---
+    value: Any, 조회 조건 (예: {"board_id": "abc", "locate_idx": {"$gt": 3}})
+
+    Return
+    ---
+    Any, 값이 가려진 조회 조건 (예: {"board_id": "?", "locate_idx": {"$gt": "?"}})
+    """
+    if isinstance(value, Mapping):
+        return {key: redact_filter(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        # 같은 모양이 반복되는 경우가 많으므로 첫 번째 항목만 남김
+        return [redact_filter(value[0])] if value else []
+    return "?"
+
+
+class CommandMonitor(monitoring.CommandListener):
+    """
+    MongoDB 명령의 실행 시간을 컬렉션, 명령별로 기록하는 pymongo 리스너
+
+    - 컬렉션, 명령별 실행 횟수, 실패 횟수, 최근 window 동안의 실행 시간 분포
+    - slow_query_ms보다 오래 걸린 명령은 값을 가린 조회 조건과 함께 로그로 남기고
+      Prometheus 메트릭(mongo_slow_commands_total)에 기록
+    - 실행 시간 분포는 MetricsCommandListener가 mongo_command_duration_seconds로 항상 기록하며,
+      최근 window 분포는 Prometheus에서 rate()로 구함
+    """
+
+    # 실행 시간 구간(ms)
+    BOUNDS_MS = (1.0, 2.0, 5.0, 10.0, 25.0, 50.0, 100.0, 250.0, 500.0, 1000.0)
+
+    def __init__(self, slow_query_ms: float, window_seconds: float) -> None:
+        self.slow_query_ms = slow_query_ms
+        self.window_seconds = window_seconds
+        self._lock = threading.Lock()
+        self._started: dict[tuple[Any, int], tuple[str, str, Any]] = {}
+        self._histograms: dict[tuple[str, str], RollingHistogram] = {}
+        self._failures: dict[tuple[str, str], int] = {}
+        self.slow_queries = 0
+
+    @staticmethod
+    def _collection_name(event: monitoring.CommandStartedEvent) -> str | None:
+        target = event.command.get(event.command_name)
+        if isinstance(target, str):
+            return target
+        # getMore는 커서 ID가 들어가므로 collection 필드를 사용
+        collection = event.command.get("collection")
+        return collection if isinstance(collection, str) else None
+
+    @staticmethod
+    def _filter_shape(event: monitoring.CommandStartedEvent) -> Any:
+        command = event.command
+        if "filter" in command:
+            return redact_filter(command["filter"])
+        if "query" in command:
+            return redact_filter(command["query"])
+        for key, field in (("updates", "q"), ("deletes", "q")):
+            if command.get(key):
+                return redact_filter(command[key][0].get(field, {}))
+        if command.get("pipeline"):
+            return redact_filter(command["pipeline"][0])
+        return None
+
+    def started(self, event: monitoring.CommandStartedEvent) -> None:
+        collection = self._collection_name(event)
+        if collection is None:
+            return
+
+        with self._lock:
+            self._started[(event.connection_id, event.request_id)] = (
+                collection,
+                event.command_name,
+                self._filter_shape(event),
+            )
+
+    def succeeded(self, event: monitoring.CommandSucceededEvent) -> None:
+        self._finish(event, failed=False)
+
+    def failed(self, event: monitoring.CommandFailedEvent) -> None:
+        self._finish(event, failed=True)
+
+    def _finish(
+        self,
+        event: monitoring.CommandSucceededEvent | monitoring.CommandFailedEvent,
+        failed: bool,
+    ) -> None:
+        with self._lock:
+            started = self._started.pop((event.connection_id, event.request_id), None)
+            if started is None:
+                return
+
+            collection, command_name, filter_shape = started
+            key = (collection, command_name)
+            duration_ms = event.duration_micros / 1000
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = RollingHistogram(
+                    self.BOUNDS_MS, self.window_seconds
+                )
+            histogram.record(duration_ms, time.monotonic())
+            if failed:
+                self._failures[key] = self._failures.get(key, 0) + 1
+
+            is_slow = duration_ms >= self.slow_query_ms
+            if is_slow:
+                self.slow_queries += 1
+
+        if is_slow:
+            Metrics.mongo_slow_commands.labels(collection, command_name).inc()
+            logger.warning(
+                "slow mongo command: %s.%s %.1fms filter=%s",
+                collection,
+                command_name,
+                duration_ms,
+                json.dumps(filter_shape, ensure_ascii=False, default=str),
+            )
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        now = time.monotonic()
+        with self._lock:
+            return {
+                f"{collection}.{command_name}": {
+                    "count": histogram.count,
+                    "failed": self._failures.get((collection, command_name), 0),
+                    "total_ms": histogram.total,
+                    "avg_ms": histogram.total / histogram.count,
+                    "bounds_ms": list(self.BOUNDS_MS),
+                    "recent_buckets": histogram.snapshot(now),
+                }
+                for (collection, command_name), histogram in self._histograms.items()
+            }
+
+
+class TimingCommandListener(monitoring.CommandListener):
+    """
+    MongoDB 명령 실행 시간을 현재 요청의 Server-Timing("mongo")에 더하는 pymongo 리스너
+
+    motor는 명령을 실행하는 스레드에 요청의 contextvars를 복사해 전달하므로
+    리스너에서도 현재 요청의 ServerTiming에 기록할 수 있다.
+    """
+
+    def started(self, event: monitoring.CommandStartedEvent) -> None:
+        pass
+
+    def succeeded(self, event: monitoring.CommandSucceededEvent) -> None:
+        ServerTiming.add("mongo", event.duration_micros / 1_000_000)
+
+    def failed(self, event: monitoring.CommandFailedEvent) -> None:
+        ServerTiming.add("mongo", event.duration_micros / 1_000_000)
+
+
+class MetricsCommandListener(monitoring.CommandListener):
+    """
+    MongoDB 명령 실행 시간을 Prometheus 히스토그램(컬렉션, 명령별)에 기록하는 pymongo 리스너
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._started: dict[tuple[Any, int], str] = {}
+
+    def started(self, event: monitoring.CommandStartedEvent) -> None:
+        collection = CommandMonitor._collection_name(event)
+        if collection is None:
+            return
+
+        with self._lock:
+            self._started[(event.connection_id, event.request_id)] = collection
+
+    def succeeded(self, event: monitoring.CommandSucceededEvent) -> None:
+        self._finish(event, outcome="success")
+
+    def failed(self, event: monitoring.CommandFailedEvent) -> None:
+        self._finish(event, outcome="failure")
+
+    def _finish(
+        self,
+        event: monitoring.CommandSucceededEvent | monitoring.CommandFailedEvent,
+        outcome: str,
+    ) -> None:
+        with self._lock:
+            collection = self._started.pop(
+                (event.connection_id, event.request_id), None
+            )
+        if collection is None:
+            return
+
+        Metrics.mongo_command_duration.labels(
+            collection, event.command_name, outcome
+        ).observe(event.duration_micros / 1_000_000)
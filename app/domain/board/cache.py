@@ -0,0 +1,81 @@
+import dataclasses
+from datetime import datetime
+
+from app.base.settings import settings
+from app.core.event import EventType
+from app.domain.memo.response import MemoSummaryData
+from app.utils.cache import TTLCache
+from app.utils.event_bus import EventBus
+
+
+@dataclasses.dataclass(kw_only=True, frozen=True)
+class BoardSnapshot:
+    """
+    칠판 조회 결과 중 요청자와 무관한 부분 (is_self는 요청마다 계산)
+    """
+
+    board_name: str
+    bg_num: int
+    graduated_at: datetime
+    memo_list: tuple[MemoSummaryData, ...]
+    version: int
+
+
+class BoardViewCache:
+    """
+    칠판 조회 결과를 워커 프로세스 안에 보관하는 캐시
+
+    메모가 삽입되면 invalidate로 해당 칠판을 제거한다.
+    조회 도중 무효화가 일어난 경우 오래된 결과를 저장하지 않도록
+    generation 값을 비교한 뒤 저장한다.
+    """
+
+    _cache: TTLCache[str, BoardSnapshot] = TTLCache(
+        max_size=settings.BOARD_CACHE_MAX_SIZE,
+        ttl=settings.BOARD_CACHE_TTL_SECONDS,
+        name="board_view",
+    )
+    _generation = 0
+
+    @classmethod
+    def get(cls, board_id: str) -> BoardSnapshot | None:
+        return cls._cache.get(board_id)
+
+    @classmethod
+    def generation(cls) -> int:
+        """
+        조회 시작 전에 호출해 set에 넘겨줄 generation 값을 반환하는 함수
+        """
+        return cls._generation
+
+    @classmethod
+    def set(cls, board_id: str, snapshot: BoardSnapshot, generation: int) -> None:
+        """
+        조회 시작 이후 무효화가 없었을 때만 칠판 조회 결과를 저장하는 함수
+
+        Parameters
+        ---
+        board_id: str, 칠판 ID
+        snapshot: BoardSnapshot, 칠판 조회 결과
+        generation: int, 조회 시작 시점의 generation 값
+        """
+        if generation == cls._generation:
+            cls._cache.set(board_id, snapshot)
+
+    @classmethod
+    def invalidate(cls, board_id: str) -> None:
+        """
+        칠판 조회 결과를 캐시에서 제거하는 함수
+        """
+        cls._generation += 1
+        cls._cache.delete(board_id)
+
+    @classmethod
+    def stats(cls) -> dict[str, float]:
+        return cls._cache.stats()
+
+
+# 다른 워커에서 메모가 추가된 칠판도 캐시에서 제거
+EventBus.subscribe(
+    EventType.BOARD_CHANGED, lambda data: BoardViewCache.invalidate(data["board_id"])
+)
@@ -1,14 +1,25 @@
 import dataclasses
-from typing import Any
+from typing import Any, AsyncIterator
 from bson import ObjectId
 from datetime import datetime
+from pymongo import ASCENDING, IndexModel
+from motor.motor_asyncio import AsyncIOMotorCollection
 
-from app.db.database import db
+from app.db.database import Database
+from app.db.identity_map import IdentityMap
+from app.db.index import IndexRegistry
 from app.domain.board.document import BoardDocument
 
 
 class BoardCollection:
-    _collection = db["board"]
+    @classmethod
+    def _collection(cls) -> AsyncIOMotorCollection:  # type: ignore[type-arg]
+        return Database.collection("board")
+
+    IndexRegistry.register(
+        "board",
+        [IndexModel([("board_name", ASCENDING)], name="board_name", unique=True)],
+    )
 
     @classmethod
     def _parse(cls, document: dict[str, Any]) -> BoardDocument:
@@ -18,6 +29,7 @@ class BoardCollection:
             password=document["password"],
             bg_num=document["bg_num"],
             graduated_at=document["graduated_at"],
+            version=document.get("version", 0),
         )
 
     @classmethod
@@ -32,9 +44,13 @@ class BoardCollection:
         Return
         ---
         str, 삽입된 칠판 id
+
+        Exception
+        ---
+        DuplicateKeyError: 같은 이름의 칠판이 이미 존재할 경우
         """
         insert_document = dataclasses.asdict(document)
-        result = await cls._collection.insert_one(document=insert_document)
+        result = await cls._collection().insert_one(document=insert_document)
 
         return str(result.inserted_id)
 
@@ -51,10 +67,38 @@ class BoardCollection:
         ---
         str, 삽입된 칠판 문서
         """
-        result = await cls._collection.find_one(filter={"board_name": board_name})
+        result = await cls._collection().find_one(filter={"board_name": board_name})
 
         return cls._parse(result) if result else None
 
+    @classmethod
+    async def count_board(cls) -> int:
+        """
+        칠판 수를 추정하는 함수 (컬렉션 메타데이터를 사용해 문서를 순회하지 않음)
+
+        Return
+        ---
+        int, 칠판 수
+        """
+        return int(await cls._collection().estimated_document_count())
+
+    @classmethod
+    async def iter_board_name(cls) -> AsyncIterator[str]:
+        """
+        모든 칠판 이름을 하나씩 반환하는 함수
+
+        Return
+        ---
+        AsyncIterator[str], 칠판 이름 비동기 이터레이터
+        """
+        cursor = (
+            cls._collection()
+            .find(filter={}, projection={"_id": False, "board_name": True})
+            .batch_size(1000)
+        )
+        async for document in cursor:
+            yield document["board_name"]
+
     @classmethod
     async def find_board_by_id(cls, board_id: str) -> BoardDocument | None:
         """
@@ -68,12 +112,18 @@ class BoardCollection:
         ---
         삽입된 칠판 문서
         """
-        result = await cls._collection.find_one(filter={"_id": ObjectId(board_id)})
 
-        return cls._parse(result) if result else None
+        # 같은 요청 안에서는 identity map에 보관된 문서를 재사용
+        async def load() -> BoardDocument | None:
+            result = await cls._collection().find_one(
+                filter={"_id": ObjectId(board_id)}
+            )
+            return cls._parse(result) if result else None
+
+        return await IdentityMap.get_or_load("board", board_id, load)
 
     @classmethod
-    async def find_board_graduated_at_by_id(cls, board_id: str) -> str | None:
+    async def find_board_graduated_at_by_id(cls, board_id: str) -> datetime | None:
         """
         칠판 아이디로 칠판 졸업일을 조회하는 함수
 
@@ -85,6 +135,59 @@ class BoardCollection:
         ---
         칠판 졸업일
         """
-        result = await cls._collection.find_one(filter={"_id": ObjectId(board_id)})
+        board = await cls.find_board_by_id(board_id=board_id)
+
+        return board.graduated_at if board else None
+
+    @classmethod
+    async def update_board_password(cls, board_id: str, password: str) -> None:
+        """
+        칠판 비밀번호 해시를 변경하는 함수
+
+        Parameter
+        ---
+        board_id: str, 칠판 아이디
+        password: str, 새 비밀번호 해시
+        """
+        await cls._collection().update_one(
+            filter={"_id": ObjectId(board_id)}, update={"$set": {"password": password}}
+        )
+        IdentityMap.discard("board", board_id)
+
+    @classmethod
+    async def increment_board_version(cls, board_id: str) -> None:
+        """
+        칠판 버전을 원자적으로 1 증가시키는 함수 (칠판 조회 결과가 바뀔 때 호출)
+
+        Parameter
+        ---
+        board_id: str, 칠판 아이디
+        """
+        await cls._collection().update_one(
+            filter={"_id": ObjectId(board_id)}, update={"$inc": {"version": 1}}
+        )
+        IdentityMap.discard("board", board_id)
+
+    @classmethod
+    async def find_board_version_by_id(
+        cls, board_id: str
+    ) -> tuple[int, datetime] | None:
+        """
+        칠판 버전과 졸업일만 조회하는 함수
+
+        Parameter
+        ---
+        board_id: str, 칠판 아이디
+
+        Return
+        ---
+        tuple[int, datetime] | None, 칠판 버전, 졸업일 (칠판이 없으면 None)
+        """
+        result = await cls._collection().find_one(
+            filter={"_id": ObjectId(board_id)},
+            projection={"_id": False, "version": True, "graduated_at": True},
+        )
+        if result is None:
+            return None
 
-        return result["graduated_at"] if result else None
+        return result.get("version", 0), result["graduated_at"]
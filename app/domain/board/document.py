@@ -10,3 +10,5 @@ class BoardDocument(BaseDocument):
     password: str
     bg_num: int
     graduated_at: datetime
+    # 칠판 조회 결과(메모 목록)가 바뀔 때마다 1씩 증가, ETag에 사용
+    version: int = 0
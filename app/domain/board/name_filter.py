@@ -0,0 +1,152 @@
+import asyncio
+import logging
+
+from app.base.settings import settings
+from app.core.event import EventType
+from app.domain.board.collection import BoardCollection
+from app.utils.bloom_filter import BloomFilter
+from app.utils.event_bus import EventBus
+from app.utils.metrics import Metrics
+
+logger = logging.getLogger(__name__)
+
+
+class BoardNameFilter:
+    """
+    이미 사용 중인 칠판 이름의 Bloom filter
+
+    - 앱 시작 시 board 컬렉션으로 만들고, 칠판 생성 시 이름을 추가
+    - 다른 워커에서 생성된 이름은 EventBus로 받아 추가
+    - BOARD_NAME_FILTER_REBUILD_SECONDS마다 다시 만들어 오탐률이 오르지 않도록 유지
+    - "없음"이면 중복 조회를 생략하고, "있을 수 있음"이면 DB를 조회
+    - 필터가 아직 없으면 항상 "있을 수 있음"으로 답해 DB 조회로 대체
+    - 생략/조회 수, 오탐 수, 필터 크기와 예상 오탐률을 /metrics로 내보냄
+    """
+
+    _filter: BloomFilter | None = None
+    # 다시 만드는 동안 추가된 이름, 새 필터로 교체하기 전에 옮겨 담음
+    _added_while_rebuilding: list[str] | None = None
+    _task: asyncio.Task[None] | None = None
+    _rebuilds = 0
+    _skipped = 0
+    _queried = 0
+    _false_positives = 0
+    _skipped_metric = Metrics.board_name_filter_checks.labels("skipped")
+    _queried_metric = Metrics.board_name_filter_checks.labels("queried")
+
+    @classmethod
+    async def start(cls) -> None:
+        """
+        필터를 만들고 주기적으로 다시 만드는 Task를 시작하는 함수
+        """
+        await cls.rebuild()
+        if cls._task is None:
+            cls._task = asyncio.create_task(cls._rebuild_periodically())
+
+    @classmethod
+    async def stop(cls) -> None:
+        task, cls._task = cls._task, None
+        if task is not None:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+    @classmethod
+    async def rebuild(cls) -> None:
+        """
+        board 컬렉션의 모든 칠판 이름으로 필터를 새로 만드는 함수
+        """
+        cls._added_while_rebuilding = []
+        try:
+            board_count = await BoardCollection.count_board()
+            # 다음 재생성 전까지 늘어날 칠판을 고려해 여유 있게 할당
+            bloom_filter = BloomFilter(
+                capacity=max(board_count * 2, settings.BOARD_NAME_FILTER_MIN_CAPACITY),
+                error_rate=settings.BOARD_NAME_FILTER_ERROR_RATE,
+            )
+            async for board_name in BoardCollection.iter_board_name():
+                bloom_filter.add(board_name)
+
+            for board_name in cls._added_while_rebuilding:
+                bloom_filter.add(board_name)
+            cls._filter = bloom_filter
+            cls._rebuilds += 1
+            Metrics.board_name_filter_memory.set(bloom_filter.stats()["memory_bytes"])
+            Metrics.board_name_filter_false_positive_rate.set(
+                bloom_filter.false_positive_rate()
+            )
+        finally:
+            cls._added_while_rebuilding = None
+
+    @classmethod
+    async def _rebuild_periodically(cls) -> None:
+        while True:
+            await asyncio.sleep(settings.BOARD_NAME_FILTER_REBUILD_SECONDS)
+            try:
+                await cls.rebuild()
+            except Exception:
+                # 실패해도 기존 필터를 계속 사용
+                logger.exception("board name filter rebuild failed")
+
+    @classmethod
+    def add(cls, board_name: str) -> None:
+        """
+        생성된 칠판 이름을 필터에 추가하는 함수
+
+        Parameter
+        ---
+        board_name: str, 칠판 이름
+        """
+        if cls._filter is not None:
+            cls._filter.add(board_name)
+            Metrics.board_name_filter_false_positive_rate.set(
+                cls._filter.false_positive_rate()
+            )
+        if cls._added_while_rebuilding is not None:
+            cls._added_while_rebuilding.append(board_name)
+
+    @classmethod
+    def might_contain(cls, board_name: str) -> bool:
+        """
+        칠판 이름이 사용 중일 수 있는지 확인하는 함수
+
+        Parameter
+        ---
+        board_name: str, 칠판 이름
+
+        Return
+        ---
+        bool, False면 사용 중이 아님이 확실하고 True면 DB 조회가 필요함
+        """
+        if cls._filter is not None and board_name not in cls._filter:
+            cls._skipped += 1
+            cls._skipped_metric.inc()
+            return False
+
+        cls._queried += 1
+        cls._queried_metric.inc()
+        return True
+
+    @classmethod
+    def record_false_positive(cls) -> None:
+        """
+        필터가 "있을 수 있음"으로 답했지만 DB에 없었던 경우 호출하는 함수
+        """
+        if cls._filter is not None:
+            cls._false_positives += 1
+            Metrics.board_name_filter_false_positives.inc()
+
+    @classmethod
+    def stats(cls) -> dict[str, float]:
+        filter_stats = cls._filter.stats() if cls._filter is not None else {}
+        return {
+            **filter_stats,
+            "rebuilds": cls._rebuilds,
+            "skipped_queries": cls._skipped,
+            "queries": cls._queried,
+            "observed_false_positives": cls._false_positives,
+        }
+
+
+EventBus.subscribe(
+    EventType.BOARD_CREATED, lambda data: BoardNameFilter.add(data["board_name"])
+)
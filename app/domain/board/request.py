@@ -1,3 +1,5 @@
+from typing import Optional
+
 from pydantic import BaseModel, Field
 
 
@@ -6,6 +8,11 @@ class BoardInsertRequest(BaseModel):
     password: str = Field(..., description="비밀번호", examples=["password1"])
     bg_num: int = Field(..., description="배경 번호", examples=[0])
     graduated_at: str = Field(..., description="졸업 날짜", examples=["2025-02-12"])
+    receipt: Optional[str] = Field(
+        None,
+        description="/board/validate에서 발급받은 칠판 이름 검증 영수증",
+        examples=["receipt"],
+    )
 
 
 class LoginRequest(BaseModel):
@@ -16,3 +23,9 @@ class LoginRequest(BaseModel):
 class BoardValidateRequest(BaseModel):
     board_name: str = Field(..., description="검증할 칠판 이름", examples=["인규"])
     password: str = Field(..., description="비밀번호", examples=["password1"])
+
+
+class TokenRefreshRequest(BaseModel):
+    refresh_token: str = Field(
+        ..., description="리프레시 토큰", examples=["refresh token"]
+    )
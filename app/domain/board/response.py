@@ -7,6 +7,9 @@ from app.domain.memo.response import MemoSummaryData
 class BoardInsertData(BaseModel):
     board_id: str = Field(..., description="삽입된 보드 아이디", examples=["uuid"])
     access_token: str = Field(..., description="엑세스 토큰", examples=["access token"])
+    refresh_token: str = Field(
+        ..., description="리프레시 토큰", examples=["refresh token"]
+    )
 
 
 class BoardInsertResponse(BaseResponseModel):
@@ -16,16 +19,36 @@ class BoardInsertResponse(BaseResponseModel):
 class LogintData(BaseModel):
     board_id: str = Field(..., description="칠판 아이디", examples=["uuid"])
     access_token: str = Field(..., description="엑세스 토큰", examples=["access token"])
+    refresh_token: str = Field(
+        ..., description="리프레시 토큰", examples=["refresh token"]
+    )
 
 
 class LoginResponse(BaseResponseModel):
     data: LogintData
 
 
+class TokenRefreshData(BaseModel):
+    board_id: str = Field(..., description="칠판 아이디", examples=["uuid"])
+    access_token: str = Field(..., description="엑세스 토큰", examples=["access token"])
+    refresh_token: str = Field(
+        ..., description="새 리프레시 토큰", examples=["refresh token"]
+    )
+
+
+class TokenRefreshResponse(BaseResponseModel):
+    data: TokenRefreshData
+
+
 class BoardValidateData(BaseModel):
     is_pass: bool = Field(
         ..., description="칠판 검증 통과 여부", examples=[True, False]
     )
+    receipt: str = Field(
+        ...,
+        description="칠판 생성 시 이름 검증을 생략할 수 있는 영수증",
+        examples=["receipt"],
+    )
 
 
 class BoardValidateResponse(BaseResponseModel):
@@ -1,9 +1,14 @@
-from fastapi import APIRouter, Header
+import asyncio
+import json
+from typing import AsyncIterator, Optional
+from fastapi import APIRouter, Header, Query, Response, status
+from fastapi.responses import StreamingResponse
 
 from app.domain.board.request import (
     BoardInsertRequest,
     LoginRequest,
     BoardValidateRequest,
+    TokenRefreshRequest,
 )
 from app.domain.board.response import (
     BoardInsertData,
@@ -14,11 +19,23 @@ from app.domain.board.response import (
     BoardValidateResponse,
     BoardGetData,
     BoardGetResponse,
+    TokenRefreshData,
+    TokenRefreshResponse,
 )
 from app.domain.board.service import BoardService
 from app.domain.memo.request import MemoInsertRequest
-from app.domain.memo.response import MemoInsertData, MemoInsertResponse
+from app.domain.memo.document import MemoDocument
+from app.domain.memo.response import (
+    MemoDetailData,
+    MemoInsertData,
+    MemoInsertResponse,
+    MemoListResponse,
+    MemoSyncData,
+    MemoSyncResponse,
+)
 from app.domain.memo.service import MemoService
+from app.domain.memo.stream import MemoStream
+from app.base.settings import settings
 from app.core.exception import *
 from app.utils.responses_creater import ResponsesCreater
 from app.core.swagger_responses import *
@@ -37,8 +54,11 @@ async def board_insert(request: BoardInsertRequest) -> BoardInsertResponse:
     insertd_id = await BoardService.insert_board(request=request)
 
     access_token = await JWT.create_access_token(board_id=insertd_id)
+    refresh_token = await JWT.create_refresh_token(board_id=insertd_id)
 
-    response_data = BoardInsertData(board_id=insertd_id, access_token=access_token)
+    response_data = BoardInsertData(
+        board_id=insertd_id, access_token=access_token, refresh_token=refresh_token
+    )
     return BoardInsertResponse(detail="칠판 생성 완료.", data=response_data)
 
 
@@ -46,21 +66,39 @@ async def board_insert(request: BoardInsertRequest) -> BoardInsertResponse:
     "/board/login", response_model=LoginResponse, responses=post_board_responses()
 )
 async def login(request: LoginRequest) -> LoginResponse:
-    board_id, access_token = await BoardService.login(request)
+    board_id, access_token, refresh_token = await BoardService.login(request)
 
-    response_data = LogintData(board_id=board_id, access_token=access_token)
+    response_data = LogintData(
+        board_id=board_id, access_token=access_token, refresh_token=refresh_token
+    )
     return LoginResponse(detail="로그인 완료", data=response_data)
 
 
+@router.post(
+    "/board/token/refresh",
+    response_model=TokenRefreshResponse,
+    responses=post_board_token_refresh_responses(),
+)
+async def token_refresh(request: TokenRefreshRequest) -> TokenRefreshResponse:
+    board_id, access_token, refresh_token = await BoardService.refresh_token(
+        request=request
+    )
+
+    response_data = TokenRefreshData(
+        board_id=board_id, access_token=access_token, refresh_token=refresh_token
+    )
+    return TokenRefreshResponse(detail="토큰 재발급 완료", data=response_data)
+
+
 @router.post(
     "/board/validate",
     response_model=BoardValidateResponse,
     responses=post_board_validate_responses(),
 )
 async def board_name_validate(request: BoardValidateRequest) -> BoardValidateResponse:
-    result_bool = await BoardService.board_name_validate(request=request)
+    result_bool, receipt = await BoardService.board_name_validate(request=request)
 
-    response_data = BoardValidateData(is_pass=result_bool)
+    response_data = BoardValidateData(is_pass=result_bool, receipt=receipt)
     return BoardValidateResponse(
         detail="칠판 이름, 비밀번호 검증 성공", data=response_data
     )
@@ -78,18 +116,142 @@ async def memo_insert(board_id: str, request: MemoInsertRequest) -> MemoInsertRe
     return MemoInsertResponse(detail="메모지 생성 완료.", data=response_data)
 
 
+@router.get(
+    path="/board/{board_id}/memo/",
+    response_model=MemoListResponse,
+    responses=get_board_boardid_memo_responses(),
+)
+async def memo_list_get(
+    board_id: str,
+    token: str = Header(..., description="토큰 값"),
+) -> StreamingResponse:
+    memo_list = await MemoService.get_memo_list(
+        board_id=board_id, token=JWT.decode_access_token(token)
+    )
+
+    return StreamingResponse(
+        _stream_memo_list(detail="메모지 전체 조회.", memo_list=memo_list),
+        media_type="application/json",
+    )
+
+
+@router.get(
+    path="/board/{board_id}/memos",
+    response_model=MemoSyncResponse,
+    responses=get_board_boardid_memos_responses(),
+)
+async def memo_sync(
+    board_id: str,
+    since: Optional[str] = Query(
+        None, description="이전 응답의 next_cursor", examples=["uuid"]
+    ),
+) -> MemoSyncResponse:
+    memo_list, next_cursor, has_more = await MemoService.get_memo_summary_list_since(
+        board_id=board_id, since=since
+    )
+
+    response_data = MemoSyncData(
+        memo_list=memo_list, next_cursor=next_cursor, has_more=has_more
+    )
+    return MemoSyncResponse(detail="메모 증분 조회.", data=response_data)
+
+
+@router.get(
+    path="/board/{board_id}/memo/stream",
+    response_class=StreamingResponse,
+    responses=get_board_boardid_memo_stream_responses(),
+)
+async def memo_stream(board_id: str) -> StreamingResponse:
+    await MemoService.validate_memo_stream(board_id=board_id)
+
+    return StreamingResponse(
+        _stream_new_memo(board_id=board_id),
+        media_type="text/event-stream",
+        # 프록시가 이벤트를 모아서 보내지 않도록 버퍼링 해제
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+async def _stream_new_memo(board_id: str) -> AsyncIterator[bytes]:
+    """
+    칠판에 새로 공개된 메모를 Server-Sent Events 형식으로 전송하는 함수
+
+    연결이 끊기면 StreamingResponse가 제너레이터를 취소하고 구독을 해제한다.
+    """
+    subscription = MemoStream.subscribe(board_id)
+    try:
+        while True:
+            try:
+                memo = await asyncio.wait_for(
+                    subscription.get(), timeout=settings.MEMO_STREAM_HEARTBEAT_SECONDS
+                )
+            except asyncio.TimeoutError:
+                # 연결 유지를 위한 주석 이벤트
+                yield b": heartbeat\n\n"
+                continue
+
+            # 느린 연결로 제거된 경우, 클라이언트는 칠판을 다시 조회 후 재연결
+            if memo is None:
+                yield b"event: evicted\ndata: {}\n\n"
+                return
+
+            yield b"event: memo\ndata: " + memo.model_dump_json().encode() + b"\n\n"
+    finally:
+        MemoStream.unsubscribe(subscription)
+
+
+async def _stream_memo_list(
+    detail: str, memo_list: AsyncIterator[MemoDocument]
+) -> AsyncIterator[bytes]:
+    """
+    MemoListResponse 형태의 JSON을 메모 단위로 나눠서 전송하는 함수
+    """
+    yield b'{"detail":' + json.dumps(detail).encode() + b',"data":{"memo_list":['
+
+    is_first = True
+    async for memo in memo_list:
+        memo_data = MemoDetailData(
+            memo_id=str(memo._id),
+            locate_idx=memo.locate_idx,
+            bg_num=memo.bg_num,
+            author=memo.author,
+            content=memo.content,
+        )
+        yield (b"" if is_first else b",") + memo_data.model_dump_json().encode()
+        is_first = False
+
+    yield b"]}}"
+
+
 @router.get(
     path="/board/{board_id}/",
     response_model=BoardGetResponse,
     responses=get_board_boardid_responses(),
 )
 async def board_get(
+    response: Response,
     board_id: str,
     token: str = Header(None, description="토큰 값"),
-) -> BoardGetResponse:
-    is_self, is_graduated, board_name, bg_num, memo_list = await BoardService.get_board(
-        board_id=board_id, token=JWT.optional_token(token)
+    if_none_match: Optional[str] = Header(
+        None, description="이전 응답의 ETag 값", examples=['"0-0-0"']
+    ),
+) -> BoardGetResponse | Response:
+    payload = JWT.optional_token(token)
+
+    # 칠판이 바뀌지 않았으면 버전만 확인하고 본문 없이 응답
+    if if_none_match is not None:
+        etag = await BoardService.get_board_etag(board_id=board_id, token=payload)
+        if _match_etag(if_none_match, etag):
+            return Response(
+                status_code=status.HTTP_304_NOT_MODIFIED,
+                headers={"ETag": etag, "Cache-Control": "no-cache"},
+            )
+
+    is_self, is_graduated, board_name, bg_num, memo_list, etag = (
+        await BoardService.get_board(board_id=board_id, token=payload)
     )
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = "no-cache"
 
     response_data = BoardGetData(
         is_self=is_self,
@@ -99,3 +261,15 @@ async def board_get(
         memo_list=memo_list,
     )
     return BoardGetResponse(detail="칠판 조회.", data=response_data)
+
+
+def _match_etag(if_none_match: str, etag: str) -> bool:
+    """
+    If-None-Match 헤더에 ETag가 포함되어 있는지 확인하는 함수 (약한 비교)
+    """
+    if if_none_match.strip() == "*":
+        return True
+    return any(
+        candidate.strip().removeprefix("W/") == etag
+        for candidate in if_none_match.split(",")
+    )
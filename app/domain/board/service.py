@@ -1,27 +1,26 @@
-import re
 from typing import Optional
-from korcen import korcen
 from datetime import datetime, timedelta, timezone
+from pymongo.errors import DuplicateKeyError
 
+from app.core.event import EventType
 from app.domain.board.request import (
     BoardInsertRequest,
     LoginRequest,
     BoardValidateRequest,
+    TokenRefreshRequest,
 )
+from app.domain.board.cache import BoardSnapshot, BoardViewCache
 from app.domain.board.collection import BoardCollection
 from app.domain.board.document import BoardDocument
+from app.domain.board.name_filter import BoardNameFilter
+from app.domain.board.validator import BoardValidator
 from app.utils.security import Security, JWT
+from app.utils.event_bus import EventBus
+from app.utils.single_flight import SingleFlight
 from app.core.exception import (
     BoardGraduatedException,
-    CanNotUseBadWordInNameException,
-    CanNotUseSpaceFrontEndBackInNameException,
-    CanNotUseSpaceInPasswordException,
     DoesNotExistBoardException,
     DuplicateNameException,
-    MinLengthInPasswordException,
-    OnlyKrEngNumSpecialInNameException,
-    TooLongNameException,
-    TooShortNameException,
     ValidateDateStrException,
     WrongNameOrPasswordInValidateLoginException,
 )
@@ -30,6 +29,10 @@ from app.domain.memo.collection import MemoCollection
 
 
 class BoardService:
+    # 같은 칠판에 대한 동시 조회를 하나의 DB 조회로 합침
+    _board_view_flight: SingleFlight[str, BoardSnapshot] = SingleFlight(
+        name="board_view"
+    )
 
     @classmethod
     async def insert_board(cls, request: BoardInsertRequest) -> str:
@@ -44,8 +47,17 @@ class BoardService:
         ---
         str, 칠판 아이디
         """
-        # 칠판 이름 유효성 확인
-        await cls._validate_board_name(board_name=request.board_name)
+        # 칠판 이름 유효성 확인 (중복 여부는 삽입 시 unique 인덱스로 확인)
+        # 같은 이름으로 발급된 검증 영수증이 있으면 이미 통과한 검사는 생략
+        if not (
+            request.receipt
+            and JWT.verify_board_name_receipt(
+                receipt=request.receipt, board_name=request.board_name
+            )
+        ):
+            await cls._validate_board_name(
+                board_name=request.board_name, check_duplicate=False
+            )
 
         # 비밀번호 유효성 확인
         await cls._validate_password(password=request.password)
@@ -59,13 +71,22 @@ class BoardService:
             graduated_at=graduated_at,
         )
 
-        inserted_id = await BoardCollection.insert_board(document=insert_board)
+        try:
+            inserted_id = await BoardCollection.insert_board(document=insert_board)
+        except DuplicateKeyError:
+            # 다른 워커에서 생성되어 아직 필터에 없던 이름
+            BoardNameFilter.add(request.board_name)
+            raise DuplicateNameException()
+
+        await EventBus.publish(
+            EventType.BOARD_CREATED, {"board_name": request.board_name}
+        )
         return inserted_id
 
     @classmethod
     async def get_board(
         cls, board_id: str, token: Optional[JWT.Payload] = None
-    ) -> tuple[bool, bool, str, int, list[MemoSummaryData]]:
+    ) -> tuple[bool, bool, str, int, list[MemoSummaryData], str]:
         """
         칠판 정보를 가져오는 함수
 
@@ -76,6 +97,7 @@ class BoardService:
         Return
         ---
         tuple[int, list[MemoSummaryData]], 칠판 배경 번호와 메모 리스트
+        str, 조회 결과의 ETag
         """
         is_self = False
 
@@ -86,11 +108,118 @@ class BoardService:
                 is_self = True
 
         await cls._validate_object_id(board_id=board_id)
+        snapshot = await cls._get_board_snapshot(board_id=board_id)
+        is_graduated = cls._check_graduated(graduated_at=snapshot.graduated_at)
+
+        return (
+            is_self,
+            is_graduated,
+            snapshot.board_name,
+            snapshot.bg_num,
+            list(snapshot.memo_list),
+            cls._make_etag(snapshot.version, is_self, is_graduated),
+        )
+
+    @classmethod
+    async def get_board_etag(
+        cls, board_id: str, token: Optional[JWT.Payload] = None
+    ) -> str:
+        """
+        칠판 조회 결과를 만들지 않고 ETag만 계산하는 함수
+
+        캐시에 조회 결과가 있으면 DB를 조회하지 않고, 없으면 버전과 졸업일만 조회한다.
+
+        Parameters
+        ---
+        board_id: str, 요청된 칠판 ID
+        token: Optional[JWT.Payload], 요청자의 토큰
+
+        Return
+        ---
+        str, 칠판 조회 결과의 ETag
+
+        Exceptions
+        ---
+        404: board_id에 해당하는 칠판이 존재하지 않을 경우
+        """
+        is_self = token is not None and await cls._validate_board_id_in_token(
+            board_id=board_id, token_board_id=token.board_id
+        )
+
+        await cls._validate_object_id(board_id=board_id)
+        snapshot = BoardViewCache.get(board_id)
+        if snapshot is not None:
+            version, graduated_at = snapshot.version, snapshot.graduated_at
+        else:
+            result = await BoardCollection.find_board_version_by_id(board_id=board_id)
+            if result is None:
+                raise DoesNotExistBoardException()
+            version, graduated_at = result
+
+        is_graduated = cls._check_graduated(graduated_at=graduated_at)
+        return cls._make_etag(version, is_self, is_graduated)
+
+    @staticmethod
+    def _make_etag(version: int, is_self: bool, is_graduated: bool) -> str:
+        # 같은 버전이라도 요청자와 졸업 여부에 따라 응답이 달라지므로 함께 포함
+        return f'"{version}-{int(is_self)}-{int(is_graduated)}"'
+
+    @classmethod
+    async def _get_board_snapshot(cls, board_id: str) -> BoardSnapshot:
+        """
+        칠판 조회 결과를 캐시에서 가져오고, 없으면 DB에서 조회해 캐시에 저장하는 함수
+
+        Parameters
+        ---
+        board_id: str, 요청된 칠판 ID
+
+        Return
+        ---
+        BoardSnapshot, 칠판 이름, 배경 번호, 졸업일, 메모 리스트
+
+        Exceptions
+        ---
+        404: board_id에 해당하는 칠판이 존재하지 않을 경우
+        """
+        snapshot = BoardViewCache.get(board_id)
+        if snapshot is not None:
+            return snapshot
+
+        return await cls._board_view_flight.do(
+            board_id, lambda: cls._load_board_snapshot(board_id=board_id)
+        )
+
+    @classmethod
+    async def _load_board_snapshot(cls, board_id: str) -> BoardSnapshot:
+        """
+        DB에서 칠판과 메모 리스트를 조회해 캐시에 저장하는 함수
+
+        Parameters
+        ---
+        board_id: str, 요청된 칠판 ID
+
+        Return
+        ---
+        BoardSnapshot, 칠판 조회 결과
+
+        Exceptions
+        ---
+        404: board_id에 해당하는 칠판이 존재하지 않을 경우
+        """
+        generation = BoardViewCache.generation()
         board = await cls._validate_board_id(board_id=board_id)
         memo_list = await cls.get_memo_list_by_board_id(board_id=board_id)
-        is_graduated = await cls._is_board_graduation(board_id=board_id)
 
-        return is_self, is_graduated, board.board_name, board.bg_num, memo_list
+        # 메모 삽입 후 버전을 올리므로, 칠판을 먼저 읽으면 버전이 메모 목록보다 앞서지 않음
+        snapshot = BoardSnapshot(
+            board_name=board.board_name,
+            bg_num=board.bg_num,
+            graduated_at=board.graduated_at,
+            memo_list=tuple(memo_list),
+            version=board.version,
+        )
+        BoardViewCache.set(board_id, snapshot, generation)
+        return snapshot
 
     @classmethod
     async def get_memo_list_by_board_id(cls, board_id: str) -> list[MemoSummaryData]:
@@ -105,7 +234,9 @@ class BoardService:
         ---
         list[MemoSummaryData], 메모 요약 리스트
         """
-        memo_list = await MemoCollection.find_memo_list_by_board_id(board_id=board_id)
+        memo_list = await MemoCollection.find_memo_summary_list_by_board_id(
+            board_id=board_id
+        )
         memo_summary_list = [
             MemoSummaryData(
                 memo_id=str(memo._id), locate_idx=memo.locate_idx, bg_num=memo.bg_num
@@ -115,7 +246,7 @@ class BoardService:
         return memo_summary_list
 
     @classmethod
-    async def login(cls, request: LoginRequest) -> tuple[str, str]:
+    async def login(cls, request: LoginRequest) -> tuple[str, str, str]:
         """
         로그인 처리하는 함수
 
@@ -125,7 +256,7 @@ class BoardService:
 
         Return
         ---
-        dict, 로그인 응답 데이터 (딕셔너리 형태로 반환)
+        tuple[str, str, str], 칠판 아이디, 엑세스 토큰, 리프레시 토큰
         """
         await cls._validate_password(password=request.password)
 
@@ -133,18 +264,42 @@ class BoardService:
 
         board_id = str(board._id)
         access_token = await JWT.create_access_token(board_id)
-        return board_id, access_token
+        refresh_token = await JWT.create_refresh_token(board_id)
+        return board_id, access_token, refresh_token
 
     @classmethod
-    async def _length_checker(cls, board_name: str) -> None:
-        max_len = 16 if re.match(r"^[a-zA-Z]+$", board_name) else 8
-        if not 2 <= len(board_name):
-            raise TooShortNameException()
-        elif not len(board_name) <= max_len:
-            raise TooLongNameException()
+    async def refresh_token(cls, request: TokenRefreshRequest) -> tuple[str, str, str]:
+        """
+        리프레시 토큰으로 새 엑세스 토큰과 리프레시 토큰을 발급하는 함수
+
+        비밀번호 검증(bcrypt) 없이 세션을 연장하며, 리프레시 토큰도 새로 발급해
+        사용하는 동안 세션 만료 시점이 계속 뒤로 밀린다.
+
+        Parameter
+        ---
+        request: TokenRefreshRequest, 리프레시 토큰 요청
+
+        Return
+        ---
+        tuple[str, str, str], 칠판 아이디, 엑세스 토큰, 리프레시 토큰
+
+        Exception
+        ---
+        401: 토큰이 만료되었거나 유효하지 않을 경우
+        404: 토큰의 칠판이 존재하지 않을 경우
+        """
+        token = JWT.decode_refresh_token(request.refresh_token)
+        await cls._validate_object_id(board_id=token.board_id)
+        await cls._validate_board_id(board_id=token.board_id)
+
+        access_token = await JWT.create_access_token(token.board_id)
+        refresh_token = await JWT.create_refresh_token(token.board_id)
+        return token.board_id, access_token, refresh_token
 
     @classmethod
-    async def _validate_board_name(cls, board_name: str) -> bool:
+    async def _validate_board_name(
+        cls, board_name: str, check_duplicate: bool = True
+    ) -> bool:
         """
         칠판 이름 유효성 검사 함수
 
@@ -158,6 +313,7 @@ class BoardService:
         Parameter
         ---
         board_name: str, 칠판 이름
+        check_duplicate: bool, 중복 이름 조회 여부 (삽입 시에는 unique 인덱스가 대신 검사)
 
         Return
         ---
@@ -172,28 +328,16 @@ class BoardService:
         400: 이름은 한글, 영어, 숫자, 특수문자만 사용할 수 있습니다.
         400: 이름에 비속어는 사용할 수 없습니다.
         """
-        # 중복 이름 금지
-        result = await BoardCollection.find_board_by_name(board_name=board_name)
-        if result is not None:
-            raise DuplicateNameException()
-
-        # 최소 2자 ~ 최대(한글 8자, 영어 16자, 혼용일 경우 8자)
-        await cls._length_checker(board_name=board_name)
+        # 길이, 공백, 문자 종류, 비속어 순으로 비용이 낮은 검사부터 실행
+        BoardValidator.board_name.validate(board_name)
 
-        # 앞 뒤 공백 금지
-        if board_name[0] == " " or board_name[-1] == " ":
-            raise CanNotUseSpaceFrontEndBackInNameException()
-
-        # 한글, 영어, 숫자, 특수문자만 허용
-        if not re.match(
-            r"^[가-힣ㄱ-ㅎa-zA-Z0-9!@#$%^&*()_+\-=\[\]{};':\"\\|,.<>\/?~`]+$",
-            board_name,
-        ):
-            raise OnlyKrEngNumSpecialInNameException()
-
-        # 비속어 금지, Reference: https://github.com/Tanat05/korcen
-        if korcen.check(board_name):
-            raise CanNotUseBadWordInNameException()
+        # 중복 이름 금지 (DB 조회가 필요하므로 마지막에 확인)
+        # Bloom filter에 없는 이름은 사용 중이 아님이 확실하므로 조회 생략
+        if check_duplicate and BoardNameFilter.might_contain(board_name):
+            result = await BoardCollection.find_board_by_name(board_name=board_name)
+            if result is not None:
+                raise DuplicateNameException()
+            BoardNameFilter.record_false_positive()
 
         return True
 
@@ -221,20 +365,7 @@ class BoardService:
         400: 비밀번호는 영어, 숫자, 특수문자만 사용 가능합니다.
         400: 비밀번호는 최소 4자 이상이어야 합니다.
         """
-
-        # 띄어쓰기 사용 금지
-        if " " in password:
-            raise CanNotUseSpaceInPasswordException()
-
-        # 영어, 숫자, 특수문자만 허용
-        if not re.fullmatch(
-            r"^[a-zA-Z0-9!@#$%^&*()_+\-=\[\]{};':\"\\|,.<>\/?~`]+$", password
-        ):
-            raise CanNotUseSpaceInPasswordException()
-
-        # 최소 4자 이상
-        if len(password) < 4:
-            raise MinLengthInPasswordException()
+        BoardValidator.password.validate(password)
 
         return True
 
@@ -262,13 +393,26 @@ class BoardService:
         if not board:
             raise WrongNameOrPasswordInValidateLoginException()
 
-        if not await Security.verify_password(password, board.password):
+        is_verified, new_hash = await Security.verify_login_password(
+            board_id=str(board._id),
+            plain_password=password,
+            hashed_password=board.password,
+        )
+        if not is_verified:
             raise WrongNameOrPasswordInValidateLoginException()
 
+        # 작업 비용이 바뀐 기존 해시는 로그인에 성공했을 때 새 비용으로 교체
+        if new_hash is not None:
+            await BoardCollection.update_board_password(
+                board_id=str(board._id), password=new_hash
+            )
+
         return board
 
     @classmethod
-    async def board_name_validate(cls, request: BoardValidateRequest) -> bool:
+    async def board_name_validate(
+        cls, request: BoardValidateRequest
+    ) -> tuple[bool, str]:
         """
         유저 이름 검증하는 함수
 
@@ -279,6 +423,7 @@ class BoardService:
         Return
         ---
         : bool, 이름 검증 성공 여부(성공시 True 반환, 실패시 에러 발생)
+        : str, 칠판 생성 시 이름 검증을 생략할 수 있는 영수증
 
         Exception
         ---
@@ -291,7 +436,11 @@ class BoardService:
             password=request.password
         )
 
-        return name_validate_result is True and password_validate_result is True
+        receipt = JWT.create_board_name_receipt(board_name=request.board_name)
+        return (
+            name_validate_result is True and password_validate_result is True,
+            receipt,
+        )
 
     @classmethod
     async def _validate_date_str(cls, date_str: str) -> datetime:
@@ -387,11 +536,24 @@ class BoardService:
         ---
         bool: 졸업 여부
         """
-        KST = timezone(timedelta(hours=9))
         board = await cls._validate_board_id(board_id=board_id)
-        graduated_at = board.graduated_at.astimezone(KST)
-        is_graduated = datetime.now(KST) >= graduated_at
-        return is_graduated
+        return cls._check_graduated(graduated_at=board.graduated_at)
+
+    @classmethod
+    def _check_graduated(cls, graduated_at: datetime) -> bool:
+        """
+        졸업일이 지났는지 확인하는 함수
+
+        Parameters
+        ---
+        graduated_at: datetime, 칠판 졸업일
+
+        Returns
+        ---
+        bool: 졸업 여부
+        """
+        KST = timezone(timedelta(hours=9))
+        return datetime.now(KST) >= graduated_at.astimezone(KST)
 
     @classmethod
     async def _validate_board_graduation(cls, board_id: str) -> None:
@@ -407,8 +569,10 @@ class BoardService:
         403: 조회 시점이 졸업 시점보다 이전일 경우
         """
         is_graduated = await cls._get_graduation_status(board_id)
-        date = await BoardCollection.find_board_graduated_at_by_id(board_id=board_id)
-        date = str(date).split(" ")[0]
+        graduated_at = await BoardCollection.find_board_graduated_at_by_id(
+            board_id=board_id
+        )
+        date = str(graduated_at).split(" ")[0]
 
         if not is_graduated:
             raise BoardGraduatedException(date=date)
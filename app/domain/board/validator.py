@@ -0,0 +1,64 @@
+import re
+
+from app.core.exception import (
+    CanNotUseBadWordInNameException,
+    CanNotUseSpaceFrontEndBackInNameException,
+    CanNotUseSpaceInPasswordException,
+    MinLengthInPasswordException,
+    OnlyKrEngNumSpecialInNameException,
+    TooLongNameException,
+    TooShortNameException,
+)
+from app.utils.validator import (
+    Validator,
+    fullmatch,
+    max_length,
+    min_length,
+    no_profanity,
+    no_space_front_back,
+    not_contains,
+)
+
+_ENGLISH_ONLY = re.compile(r"[a-zA-Z]+")
+_SPECIAL = r"!@#$%^&*()_+\-=\[\]{};':\"\\|,.<>\/?~`"
+
+
+def _board_name_max_length(board_name: str) -> int:
+    # 영어로만 된 이름은 16자, 한글이나 숫자가 섞인 이름은 8자
+    return 16 if _ENGLISH_ONLY.fullmatch(board_name) else 8
+
+
+class BoardValidator:
+    """
+    칠판 필드 검사 규칙
+
+    board_name
+        - 최소 2자 ~ 최대(한글 8자, 영어 16자, 숫자 포함 혼용일 경우 8자)
+        - 앞 뒤 공백 금지
+        - 한글, 영어, 숫자, 특수문자만 허용
+        - 비속어 금지
+    password
+        - 최소 4자 이상
+        - 띄어쓰기 금지
+        - 영어, 숫자, 특수문자만 허용
+    """
+
+    board_name = Validator(
+        [
+            min_length(2, TooShortNameException),
+            max_length(_board_name_max_length, TooLongNameException),
+            no_space_front_back(CanNotUseSpaceFrontEndBackInNameException),
+            fullmatch(
+                rf"[가-힣ㄱ-ㅎa-zA-Z0-9{_SPECIAL}]+", OnlyKrEngNumSpecialInNameException
+            ),
+            no_profanity(CanNotUseBadWordInNameException),
+        ]
+    )
+
+    password = Validator(
+        [
+            min_length(4, MinLengthInPasswordException),
+            not_contains(" ", CanNotUseSpaceInPasswordException),
+            fullmatch(rf"[a-zA-Z0-9{_SPECIAL}]+", CanNotUseSpaceInPasswordException),
+        ]
+    )
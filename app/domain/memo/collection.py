@@ -1,23 +1,76 @@
 import dataclasses
-from typing import Any
+from datetime import datetime, timedelta, timezone
+from typing import Any, AsyncIterator
 from bson import ObjectId
+from pymongo import ASCENDING, DESCENDING, IndexModel
+from motor.motor_asyncio import AsyncIOMotorCollection
 
-from app.db.database import db
-from app.domain.memo.document import MemoDocument
+from app.db.database import Database
+from app.db.identity_map import IdentityMap
+from app.db.index import IndexRegistry
+from app.domain.memo.document import MemoDocument, MemoStatus, MemoSummaryDocument
 
 
 class MemoCollection:
-    _collection = db["memo"]
+    @classmethod
+    def _collection(cls) -> AsyncIOMotorCollection:  # type: ignore[type-arg]
+        return Database.collection("memo")
+
+    # 칠판 조회 시 필요한 필드만 가져오기 위한 projection과 커서 배치 크기
+    _SUMMARY_PROJECTION = {"_id": 1, "locate_idx": 1, "bg_num": 1}
+    _SYNC_PROJECTION = {"_id": 1, "locate_idx": 1, "bg_num": 1, "published_at": 1}
+    _SUMMARY_BATCH_SIZE = 500
+
+    # 검사 대기 중이거나 숨겨진 메모는 칠판에 표시하지 않음
+    # locate_idx 조건은 partial 인덱스(board_id_locate_idx_placed)를 사용하기 위해 필요
+    _VISIBLE_FILTER = {
+        "locate_idx": {"$exists": True},
+        "status": {"$nin": [MemoStatus.PENDING, MemoStatus.HIDDEN]},
+    }
+
+    # 칠판 내 메모 조회와 메모 위치 중복 방지를 함께 담당
+    # 숨겨진 메모는 locate_idx를 제거해 위치를 다시 사용할 수 있게 함
+    # 기존 unique 인덱스(board_id_locate_idx)와 함께 있을 수 있도록 locate_idx 정렬 방향을 다르게 지정하고,
+    # 새 인덱스가 만들어진 뒤 기존 인덱스를 삭제해 중복 방지가 끊기지 않게 함
+    IndexRegistry.register(
+        "memo",
+        [
+            IndexModel(
+                [("board_id", ASCENDING), ("locate_idx", DESCENDING)],
+                name="board_id_locate_idx_placed",
+                unique=True,
+                partialFilterExpression={"locate_idx": {"$exists": True}},
+            ),
+            # 검사 대기 중인 메모만 색인해 공개된 메모가 늘어나도 크기가 커지지 않음
+            IndexModel(
+                [("status", ASCENDING)],
+                name="status_pending",
+                partialFilterExpression={"status": MemoStatus.PENDING},
+            ),
+            # 칠판별 메모 증분 조회 (공개 시각, _id 순)
+            IndexModel(
+                [
+                    ("board_id", ASCENDING),
+                    ("published_at", ASCENDING),
+                    ("_id", ASCENDING),
+                ],
+                name="board_id_published_at_id",
+            ),
+        ],
+        # 배포된 적 있는 기존 인덱스만 삭제 대상으로 남김
+        obsolete=["board_id_locate_idx"],
+    )
 
     @classmethod
     def _parse(cls, document: dict[str, Any]) -> MemoDocument:
         return MemoDocument(
             _id=document["_id"],
             board_id=document["board_id"],
-            locate_idx=document["locate_idx"],
+            locate_idx=document.get("locate_idx", -1),
             bg_num=document["bg_num"],
             author=document["author"],
             content=document["content"],
+            status=document.get("status", MemoStatus.PUBLISHED),
         )
 
     @classmethod
@@ -32,9 +85,18 @@ class MemoCollection:
         Return
         ---
         str, 생성된 메모의 ID
+
+        Exception
+        ---
+        DuplicateKeyError: 같은 칠판에 같은 위치의 메모가 이미 존재할 경우
         """
-        insert_document = dataclasses.asdict(document)
-        result = await cls._collection.insert_one(document=insert_document)
+        # 값이 없는 선택 필드(moderation_lease_until 등)는 저장하지 않음
+        insert_document = {
+            key: value
+            for key, value in dataclasses.asdict(document).items()
+            if value is not None
+        }
+        result = await cls._collection().insert_one(document=insert_document)
 
         return str(result.inserted_id)
 
@@ -51,9 +113,13 @@ class MemoCollection:
         ---
         MemoDocument | None
         """
-        result = await cls._collection.find_one(filter={"_id": ObjectId(memo_id)})
 
-        return cls._parse(result) if result else None
+        # 같은 요청 안에서는 identity map에 보관된 문서를 재사용
+        async def load() -> MemoDocument | None:
+            result = await cls._collection().find_one(filter={"_id": ObjectId(memo_id)})
+            return cls._parse(result) if result else None
+
+        return await IdentityMap.get_or_load("memo", memo_id, load)
 
     @classmethod
     async def find_memo_list_by_board_id(cls, board_id: str) -> list[MemoDocument]:
@@ -68,25 +134,252 @@ class MemoCollection:
         ---
         list[MemoDocument], 조회된 메모 리스트
         """
-        result = cls._collection.find(filter={"board_id": board_id})
+        result = cls._collection().find(filter={"board_id": board_id})
         return [cls._parse(document) async for document in result]
 
     @classmethod
-    async def is_same_locate_idx_memo(cls, board_id: str, locate_idx: int) -> bool:
+    async def iter_memo_list_by_board_id(
+        cls, board_id: str
+    ) -> AsyncIterator[MemoDocument]:
+        """
+        보드 ID에 속한 메모를 커서 한 번으로 순회하는 함수
+
+        Parameters
+        ---
+        board_id: str, 조회할 보드 ID
+
+        Return
+        ---
+        AsyncIterator[MemoDocument], 메모를 하나씩 반환하는 비동기 이터레이터
+        """
+        result = (
+            cls._collection()
+            .find(filter={"board_id": board_id, **cls._VISIBLE_FILTER})
+            .batch_size(cls._SUMMARY_BATCH_SIZE)
+        )
+        async for document in result:
+            yield cls._parse(document)
+
+    @classmethod
+    async def find_memo_summary_list_by_board_id(
+        cls, board_id: str
+    ) -> list[MemoSummaryDocument]:
+        """
+        보드 ID를 사용해 메모 요약(id, 위치, 배경 번호) 리스트를 조회하는 함수
+
+        Parameters
+        ---
+        board_id: str, 조회할 보드 ID
+
+        Return
+        ---
+        list[MemoSummaryDocument], 조회된 메모 요약 리스트
+        """
+        result = (
+            cls._collection()
+            .find(
+                filter={"board_id": board_id, **cls._VISIBLE_FILTER},
+                projection=cls._SUMMARY_PROJECTION,
+            )
+            .batch_size(cls._SUMMARY_BATCH_SIZE)
+        )
+        return [
+            MemoSummaryDocument(
+                _id=document["_id"],
+                locate_idx=document["locate_idx"],
+                bg_num=document["bg_num"],
+            )
+            async for document in result
+        ]
+
+    @classmethod
+    async def find_memo_summary_list_published_after(
+        cls, board_id: str, after: tuple[datetime, ObjectId] | None, limit: int
+    ) -> list[MemoSummaryDocument]:
         """
-        보드 아이디와 메모 위치를 통해 메모 위치 중복을 판단하는 함수
+        보드 ID에 속한 메모 중 (공개 시각, _id)가 after보다 뒤인 메모 요약을 그 순서로 조회하는 함수
 
         Parameters
         ---
         board_id: str, 조회할 보드 ID
-        locate_idx: int, 삽입할 메모 위치
+        after: tuple[datetime, ObjectId] | None, 이 (공개 시각, _id) 이후의 메모만 조회 (None이면 처음부터)
+        limit: int, 최대 조회 개수
+
+        Return
+        ---
+        list[MemoSummaryDocument], 공개 시각이 채워진 메모 요약 리스트
+        """
+        if after is None:
+            after_filter: dict[str, Any] = {"published_at": {"$type": "date"}}
+        else:
+            published_at, _id = after
+            after_filter = {
+                "$or": [
+                    {"published_at": {"$gt": published_at}},
+                    {"published_at": published_at, "_id": {"$gt": _id}},
+                ]
+            }
+        result = (
+            cls._collection()
+            .find(
+                filter={"board_id": board_id, **after_filter, **cls._VISIBLE_FILTER},
+                projection=cls._SYNC_PROJECTION,
+            )
+            .sort([("published_at", ASCENDING), ("_id", ASCENDING)])
+            .limit(limit)
+        )
+        return [
+            MemoSummaryDocument(
+                _id=document["_id"],
+                locate_idx=document["locate_idx"],
+                bg_num=document["bg_num"],
+                # pymongo는 UTC 기준 naive datetime을 반환
+                published_at=document["published_at"].replace(tzinfo=timezone.utc),
+            )
+            async for document in result
+        ]
+
+    @classmethod
+    async def backfill_published_at(cls) -> int:
+        """
+        published_at이 없는 기존 공개 메모에 _id 생성 시각을 채우는 함수
+
+        앱 시작 시 매번 실행되며, 이미 채워진 메모는 바뀌지 않는다.
 
         Return
         ---
-        is_same: bool, 메모 위치 중복 여부 반환
+        int, published_at을 채운 메모 수
         """
-        result = await cls._collection.find_one(
-            filter={"board_id": board_id, "locate_idx": locate_idx}
+        result = await cls._collection().update_many(
+            # $exists 대신 null 비교를 사용해 board_id_published_at_id 인덱스로 찾음
+            filter={
+                "published_at": None,
+                "status": {"$nin": [MemoStatus.PENDING, MemoStatus.HIDDEN]},
+            },
+            update=[{"$set": {"published_at": {"$toDate": "$_id"}}}],
         )
+        return int(result.modified_count)
 
-        return True if result else False
+    @classmethod
+    async def claim_pending_memo_list(
+        cls, limit: int, lease_seconds: float
+    ) -> list[MemoDocument]:
+        """
+        맡은 워커가 없는(작업 기한이 지난) pending 메모를 가져오고 새 기한을 설정하는 함수
+
+        기한 조건을 update_many에서 다시 확인하므로 여러 워커가 동시에 호출해도
+        메모 하나는 한 워커만 가져간다.
+
+        Parameters
+        ---
+        limit: int, 최대 조회 개수
+        lease_seconds: float, 새로 설정할 작업 기한(초)
+
+        Return
+        ---
+        list[MemoDocument], 이 호출에서 가져온 메모 리스트
+        """
+        now = datetime.now(timezone.utc)
+        # 기한이 없는 메모도 포함하기 위해 $lt 대신 $not $gte 사용
+        unclaimed_filter = {
+            "status": MemoStatus.PENDING,
+            "moderation_lease_until": {"$not": {"$gte": now}},
+        }
+        candidate_id_list = [
+            document["_id"]
+            async for document in cls._collection()
+            .find(filter=unclaimed_filter, projection={"_id": 1})
+            .limit(limit)
+        ]
+        if not candidate_id_list:
+            return []
+
+        token = ObjectId()
+        await cls._collection().update_many(
+            filter={"_id": {"$in": candidate_id_list}, **unclaimed_filter},
+            update={
+                "$set": {
+                    "moderation_lease_until": now + timedelta(seconds=lease_seconds),
+                    "moderation_token": token,
+                }
+            },
+        )
+        result = cls._collection().find(
+            filter={"_id": {"$in": candidate_id_list}, "moderation_token": token}
+        )
+        return [cls._parse(document) async for document in result]
+
+    @classmethod
+    async def publish_memo_list(
+        cls, memo_id_list: list[str], token: ObjectId
+    ) -> list[str]:
+        """
+        검사 대기 중인 메모를 공개 상태로 바꾸는 함수
+
+        Parameters
+        ---
+        memo_id_list: list[str], 공개할 메모 ID 리스트
+        token: ObjectId, 검사 묶음마다 만든 값 (재시도할 때는 같은 값을 사용)
+
+        Return
+        ---
+        list[str], 같은 token으로 공개된 메모 ID 리스트 (다른 워커가 처리한 메모는 제외)
+        """
+        object_id_list = [ObjectId(memo_id) for memo_id in memo_id_list]
+        await cls._collection().update_many(
+            filter={"_id": {"$in": object_id_list}, "status": MemoStatus.PENDING},
+            update={
+                "$set": {
+                    "status": MemoStatus.PUBLISHED,
+                    "published_at": datetime.now(timezone.utc),
+                    "moderation_token": token,
+                },
+                "$unset": {"moderation_lease_until": ""},
+            },
+        )
+        return await cls._find_moderated_id_list(object_id_list, token)
+
+    @classmethod
+    async def hide_memo_list(
+        cls, memo_id_list: list[str], token: ObjectId
+    ) -> list[str]:
+        """
+        검사 대기 중인 메모를 숨김 상태로 바꾸고 메모 위치를 비우는 함수
+
+        Parameters
+        ---
+        memo_id_list: list[str], 숨길 메모 ID 리스트
+        token: ObjectId, 검사 묶음마다 만든 값 (재시도할 때는 같은 값을 사용)
+
+        Return
+        ---
+        list[str], 같은 token으로 숨겨진 메모 ID 리스트 (다른 워커가 처리한 메모는 제외)
+        """
+        object_id_list = [ObjectId(memo_id) for memo_id in memo_id_list]
+        await cls._collection().update_many(
+            filter={"_id": {"$in": object_id_list}, "status": MemoStatus.PENDING},
+            update=[
+                {
+                    "$set": {
+                        "status": MemoStatus.HIDDEN,
+                        "hidden_locate_idx": "$locate_idx",
+                        "moderation_token": token,
+                    }
+                },
+                {"$unset": ["locate_idx", "moderation_lease_until"]},
+            ],
+        )
+        return await cls._find_moderated_id_list(object_id_list, token)
+
+    @classmethod
+    async def _find_moderated_id_list(
+        cls, object_id_list: list[ObjectId], token: ObjectId
+    ) -> list[str]:
+        # update_many는 바뀐 문서 수만 알려주므로 token으로 바뀐 메모를 찾음
+        # (다른 워커가 먼저 처리한 메모는 status 조건에서 제외되어 token이 다르고,
+        #  같은 묶음의 이전 시도에서 바뀐 메모는 token이 같아 다시 반환됨)
+        result = cls._collection().find(
+            filter={"_id": {"$in": object_id_list}, "moderation_token": token},
+            projection={"_id": 1},
+        )
+        return [str(document["_id"]) async for document in result]
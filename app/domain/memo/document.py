@@ -1,8 +1,25 @@
 import dataclasses
+from datetime import datetime
+
+from bson import ObjectId
 
 from app.base.base_document import BaseDocument
 
 
+class MemoStatus:
+    """
+    메모 공개 상태
+
+    - PENDING: 비속어 검사 대기 중 (칠판에 표시하지 않음)
+    - PUBLISHED: 공개됨 (status 필드가 없는 기존 메모도 공개로 취급)
+    - HIDDEN: 비속어가 발견되어 숨겨짐
+    """
+
+    PENDING = "pending"
+    PUBLISHED = "published"
+    HIDDEN = "hidden"
+
+
 @dataclasses.dataclass(kw_only=True, frozen=True)
 class MemoDocument(BaseDocument):
     board_id: str
@@ -10,3 +27,20 @@ class MemoDocument(BaseDocument):
     bg_num: int
     author: str
     content: str
+    status: str = MemoStatus.PUBLISHED
+    # 공개된 시각 (증분 조회 커서), 검사 대기 중이거나 숨겨진 메모는 없음
+    published_at: datetime | None = None
+    # pending 메모를 검사 중인 워커의 작업 기한, 지나면 다른 워커가 다시 가져감
+    moderation_lease_until: datetime | None = None
+
+
+@dataclasses.dataclass(kw_only=True, frozen=True, slots=True)
+class MemoSummaryDocument:
+    """
+    칠판 조회에 필요한 필드만 담은 메모 요약 문서
+    """
+
+    _id: ObjectId
+    locate_idx: int
+    bg_num: int
+    published_at: datetime | None = None
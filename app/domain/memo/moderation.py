@@ -0,0 +1,258 @@
+import asyncio
+import dataclasses
+import logging
+
+from bson import ObjectId
+
+from app.base.settings import settings
+from app.core.event import EventType
+from app.domain.board.collection import BoardCollection
+from app.domain.memo.collection import MemoCollection
+from app.utils.cpu_pool import CPUPool
+from app.utils.event_bus import EventBus
+from app.utils.profanity import check_many
+
+logger = logging.getLogger(__name__)
+
+
+@dataclasses.dataclass(kw_only=True, frozen=True)
+class ModerationItem:
+    memo_id: str
+    board_id: str
+    locate_idx: int
+    bg_num: int
+    author: str
+    content: str
+
+
+class MemoModerator:
+    """
+    검사 대기(pending) 상태로 저장된 메모의 비속어 검사를 백그라운드에서 처리하는 클래스
+
+    - 워커 Task들이 큐에서 최대 MEMO_MODERATION_BATCH_SIZE개씩 꺼내 한 번에 검사
+    - 검사는 CPUPool에서 실행하고, 결과에 따라 메모를 공개하거나 숨김
+    - 검사에 실패하면 MEMO_MODERATION_MAX_RETRIES번까지 간격을 늘려가며 다시 시도
+    - 큐에 넣지 못했거나 끝내 실패한 메모는 작업 기한(lease)이 지나면 sweep이 다시 가져옴
+      (sweep은 모든 워커 프로세스에서 돌지만 메모 하나는 한 프로세스만 가져감)
+    """
+
+    _queue: asyncio.Queue[ModerationItem] | None = None
+    _workers: list[asyncio.Task[None]] = []
+    _sweeper: asyncio.Task[None] | None = None
+    _enqueued = 0
+    _swept = 0
+    _published = 0
+    _hidden = 0
+    _batches = 0
+    _retries = 0
+    _failed = 0
+
+    @classmethod
+    async def start(cls) -> None:
+        """
+        모더레이션 워커와 남아있는 pending 메모를 주기적으로 가져오는 Task를 시작하는 함수
+        """
+        cls._ensure_started()
+        if cls._sweeper is None:
+            cls._sweeper = asyncio.create_task(cls._sweep_periodically())
+
+    @classmethod
+    async def stop(cls) -> None:
+        """
+        모더레이션 워커를 종료하는 함수 (남은 메모는 작업 기한이 지나면 다시 처리됨)
+        """
+        tasks, cls._workers = cls._workers, []
+        if cls._sweeper is not None:
+            tasks.append(cls._sweeper)
+            cls._sweeper = None
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        cls._queue = None
+
+    @classmethod
+    def _ensure_started(cls) -> asyncio.Queue[ModerationItem]:
+        if cls._queue is None:
+            cls._queue = asyncio.Queue(maxsize=settings.MEMO_MODERATION_QUEUE_SIZE)
+            cls._workers = [
+                asyncio.create_task(cls._work(cls._queue))
+                for _ in range(settings.MEMO_MODERATION_WORKERS)
+            ]
+        return cls._queue
+
+    @classmethod
+    def submit(cls, item: ModerationItem) -> bool:
+        """
+        메모를 검사 큐에 넣는 함수
+
+        Parameter
+        ---
+        item: ModerationItem, 검사할 메모
+
+        Return
+        ---
+        bool, 큐가 가득 차 넣지 못하면 False
+        """
+        try:
+            cls._ensure_started().put_nowait(item)
+        except asyncio.QueueFull:
+            return False
+
+        cls._enqueued += 1
+        return True
+
+    @classmethod
+    async def sweep(cls) -> int:
+        """
+        작업 기한이 지난 pending 메모를 큐의 남은 자리만큼 가져와 넣는 함수
+
+        Return
+        ---
+        int, 큐에 넣은 메모 수
+        """
+        queue = cls._ensure_started()
+        free = queue.maxsize - queue.qsize()
+        if free <= 0:
+            return 0
+
+        memo_list = await MemoCollection.claim_pending_memo_list(
+            limit=free, lease_seconds=settings.MEMO_MODERATION_LEASE_SECONDS
+        )
+        submitted = 0
+        for memo in memo_list:
+            item = ModerationItem(
+                memo_id=str(memo._id),
+                board_id=memo.board_id,
+                locate_idx=memo.locate_idx,
+                bg_num=memo.bg_num,
+                author=memo.author,
+                content=memo.content,
+            )
+            # 조회하는 동안 큐가 찬 경우 남은 메모는 기한이 지난 뒤 다시 가져옴
+            if cls.submit(item):
+                submitted += 1
+
+        cls._swept += submitted
+        return submitted
+
+    @classmethod
+    async def _sweep_periodically(cls) -> None:
+        while True:
+            try:
+                await cls.sweep()
+            except Exception:
+                logger.exception("memo moderation sweep failed")
+            await asyncio.sleep(settings.MEMO_MODERATION_SWEEP_SECONDS)
+
+    @classmethod
+    async def moderate(
+        cls, item_list: list[ModerationItem], token: ObjectId | None = None
+    ) -> None:
+        """
+        메모 묶음의 비속어 검사 후 공개 또는 숨김 처리하는 함수
+
+        다른 워커가 먼저 처리한 메모는 건너뛰고, 이 묶음으로 공개된 메모만
+        MEMO_PUBLISHED 이벤트를 보낸다. 같은 token으로 다시 호출하면 이전 시도에서
+        공개된 메모도 다시 반환되므로, 공개 후 이벤트 전송에 실패해도 재시도로 복구된다.
+
+        Parameters
+        ---
+        item_list: list[ModerationItem], 검사할 메모 리스트
+        token: ObjectId | None, 검사 묶음의 값 (재시도 시 같은 값, 없으면 새로 만듦)
+        """
+        token = token or ObjectId()
+        text_list = [text for item in item_list for text in (item.author, item.content)]
+        is_bad_list = await CPUPool.run("profanity_batch", check_many, text_list)
+
+        clean: list[ModerationItem] = []
+        bad: list[str] = []
+        for i, item in enumerate(item_list):
+            if is_bad_list[2 * i] or is_bad_list[2 * i + 1]:
+                bad.append(item.memo_id)
+            else:
+                clean.append(item)
+
+        published: list[ModerationItem] = []
+        if clean:
+            published_id_set = set(
+                await MemoCollection.publish_memo_list(
+                    memo_id_list=[item.memo_id for item in clean], token=token
+                )
+            )
+            published = [item for item in clean if item.memo_id in published_id_set]
+        hidden = (
+            await MemoCollection.hide_memo_list(memo_id_list=bad, token=token)
+            if bad
+            else []
+        )
+
+        # 다른 워커가 공개했더라도 그 워커가 버전을 올리기 전에 실패했을 수 있으므로
+        # 검사를 통과한 메모가 있는 칠판은 항상 버전을 올림 (한 번 더 올려도 ETag만 바뀜)
+        for board_id in {item.board_id for item in clean}:
+            await BoardCollection.increment_board_version(board_id=board_id)
+            await EventBus.publish(EventType.BOARD_CHANGED, {"board_id": board_id})
+
+        for item in published:
+            await EventBus.publish(
+                EventType.MEMO_PUBLISHED,
+                {
+                    "board_id": item.board_id,
+                    "memo_id": item.memo_id,
+                    "locate_idx": item.locate_idx,
+                    "bg_num": item.bg_num,
+                },
+            )
+
+        cls._batches += 1
+        cls._published += len(published)
+        cls._hidden += len(hidden)
+
+    @classmethod
+    async def _work(cls, queue: asyncio.Queue[ModerationItem]) -> None:
+        while True:
+            item_list = [await queue.get()]
+            while len(item_list) < settings.MEMO_MODERATION_BATCH_SIZE:
+                try:
+                    item_list.append(queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+
+            try:
+                await cls._moderate_with_retry(item_list)
+            finally:
+                for _ in item_list:
+                    queue.task_done()
+
+    @classmethod
+    async def _moderate_with_retry(cls, item_list: list[ModerationItem]) -> None:
+        # 재시도에서도 이전 시도에서 공개된 메모를 찾을 수 있도록 같은 token을 사용
+        token = ObjectId()
+        for attempt in range(settings.MEMO_MODERATION_MAX_RETRIES + 1):
+            try:
+                await cls.moderate(item_list, token)
+                return
+            except Exception:
+                if attempt == settings.MEMO_MODERATION_MAX_RETRIES:
+                    # 실패한 메모는 pending으로 남아 작업 기한이 지나면 sweep이 다시 가져감
+                    cls._failed += len(item_list)
+                    logger.exception("memo moderation failed")
+                    return
+
+                cls._retries += 1
+                logger.warning("memo moderation failed, retrying", exc_info=True)
+                await asyncio.sleep(
+                    settings.MEMO_MODERATION_RETRY_BACKOFF_SECONDS * 2**attempt
+                )
+
+    @classmethod
+    def stats(cls) -> dict[str, int]:
+        return {
+            "queue_size": cls._queue.qsize() if cls._queue else 0,
+            "enqueued": cls._enqueued,
+            "swept": cls._swept,
+            "published": cls._published,
+            "hidden": cls._hidden,
+            "batches": cls._batches,
+            "retries": cls._retries,
+            "failed": cls._failed,
+        }
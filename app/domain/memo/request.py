@@ -1,5 +1,7 @@
 from pydantic import BaseModel, Field
 
+from app.base.settings import settings
+
 
 class MemoInsertRequest(BaseModel):
     locate_idx: int = Field(..., description="메모 위치", examples=[0])
@@ -13,3 +15,12 @@ class MemoInsertRequest(BaseModel):
 class MemoValidateRequest(BaseModel):
     author: str = Field(..., description="메모 작성자", examples=["인규"])
     content: str = Field(..., description="메모 내용", examples=["축하해"])
+
+
+class MemoValidateBatchRequest(BaseModel):
+    memo_list: list[MemoValidateRequest] = Field(
+        ...,
+        description="검증할 메모 작성자, 내용 리스트",
+        min_length=1,
+        max_length=settings.MEMO_VALIDATE_BATCH_MAX_SIZE,
+    )
@@ -22,6 +22,24 @@ class MemoResponse(BaseResponseModel):
     data: MemoData
 
 
+class MemoDetailData(BaseModel):
+    memo_id: str = Field(..., description="메모 아이디", examples=["uuid"])
+    locate_idx: int = Field(..., description="메모 위치", examples=[0])
+    bg_num: int = Field(..., description="배경 번호", examples=[0])
+    author: str = Field(..., description="메모 작성자", examples=["민서"])
+    content: str = Field(
+        ..., description="메모 내용", examples=["너는 좋은 개발자가 되렴"]
+    )
+
+
+class MemoListData(BaseModel):
+    memo_list: list[MemoDetailData] = Field(..., description="메모 리스트")
+
+
+class MemoListResponse(BaseResponseModel):
+    data: MemoListData
+
+
 class MemoSummaryData(BaseModel):
     memo_id: str = Field(..., description="메모 아이디", examples=["uuid"])
     locate_idx: int = Field(..., description="메모 위치", examples=[0])
@@ -36,3 +54,42 @@ class MemoValidateData(BaseModel):
 
 class MemoValidateResponse(BaseResponseModel):
     data: MemoValidateData
+
+
+class MemoValidateResultData(BaseModel):
+    index: int = Field(..., description="요청 리스트에서의 위치", examples=[0])
+    is_pass: bool = Field(
+        ..., description="메모 검증 통과 여부", examples=[True, False]
+    )
+    detail: str | None = Field(
+        None,
+        description="검증 실패 사유 (통과 시 null)",
+        examples=[None, "내용에 비속어는 사용할 수 없습니다."],
+    )
+
+
+class MemoValidateBatchData(BaseModel):
+    result_list: list[MemoValidateResultData] = Field(
+        ..., description="요청 순서대로 정렬된 검증 결과 리스트"
+    )
+
+
+class MemoValidateBatchResponse(BaseResponseModel):
+    data: MemoValidateBatchData
+
+
+class MemoSyncData(BaseModel):
+    memo_list: list[MemoSummaryData] = Field(
+        ...,
+        description="커서 이후에 추가된 메모 요약 리스트 (memo_id로 중복 제거 필요)",
+    )
+    next_cursor: str | None = Field(
+        ..., description="다음 요청의 since 값 (메모가 없으면 null)", examples=["uuid"]
+    )
+    has_more: bool = Field(
+        ..., description="한 번에 반환할 수 있는 수를 넘어 남은 메모 존재 여부"
+    )
+
+
+class MemoSyncResponse(BaseResponseModel):
+    data: MemoSyncData
@@ -1,17 +1,21 @@
 from fastapi import APIRouter, Path, Header
 
-from app.domain.memo.request import MemoValidateRequest
+from app.domain.memo.request import MemoValidateRequest, MemoValidateBatchRequest
 from app.domain.memo.response import (
     MemoResponse,
     MemoData,
     MemoValidateData,
     MemoValidateResponse,
+    MemoValidateResultData,
+    MemoValidateBatchData,
+    MemoValidateBatchResponse,
 )
 from app.domain.memo.service import MemoService
 from app.utils.security import JWT
 from app.core.swagger_responses import (
     get_memo_momoid_responses,
     get_memo_validate_responses,
+    post_memo_validate_batch_responses,
 )
 
 router = APIRouter()
@@ -46,3 +50,24 @@ async def memo_validate(request: MemoValidateRequest) -> MemoValidateResponse:
 
     response_data = MemoValidateData(is_pass=is_pass)
     return MemoValidateResponse(detail="메모 검증 통과", data=response_data)
+
+
+@router.post(
+    path="/memo/validate/batch",
+    response_model=MemoValidateBatchResponse,
+    responses=post_memo_validate_batch_responses(),
+)
+async def memo_validate_batch(
+    request: MemoValidateBatchRequest,
+) -> MemoValidateBatchResponse:
+    detail_list = await MemoService.validate_memo_list(
+        memo_list=[(memo.author, memo.content) for memo in request.memo_list]
+    )
+
+    response_data = MemoValidateBatchData(
+        result_list=[
+            MemoValidateResultData(index=i, is_pass=detail is None, detail=detail)
+            for i, detail in enumerate(detail_list)
+        ]
+    )
+    return MemoValidateBatchResponse(detail="메모 일괄 검증 완료", data=response_data)
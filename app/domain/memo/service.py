@@ -1,23 +1,38 @@
-from korcen import korcen
+from typing import AsyncIterator
+from datetime import datetime, timedelta, timezone
+from bson import ObjectId
+from pymongo.errors import DuplicateKeyError
 
+from app.base.settings import settings
 from app.domain.memo.request import MemoInsertRequest
 from app.domain.memo.collection import MemoCollection
-from app.domain.memo.document import MemoDocument
+from app.domain.memo.document import MemoDocument, MemoStatus, MemoSummaryDocument
+from app.domain.memo.response import MemoSummaryData
+from app.domain.memo.moderation import MemoModerator, ModerationItem
+from app.domain.board.collection import BoardCollection
 from app.domain.board.service import BoardService
+from app.domain.memo.validator import MemoValidator
+from app.core.event import EventType
+from app.utils.cpu_pool import CPUPool
+from app.utils.event_bus import EventBus
+from app.utils.profanity import check_many
+from app.utils.timing import ServerTiming
+from app.utils.validator import Cost
 from app.utils.security import JWT
 from app.core.exception import (
-    CanNotUseBadWordInContentException,
-    CanNotUseBadWordInNameException,
-    CanNotUseSpaceFrontEndBackInNameException,
-    ContentLengthException,
     DoesNotExistMemoException,
+    InvalidCursorException,
+    NotBoardOwnerException,
     NotEqualMemoIdAndBoardIdException,
-    ValidateAuthorLengthException,
     SameLocateIdxMemoException,
 )
 
 
 class MemoService:
+    # 증분 조회 커서 변환에 사용 (공개 시각을 epoch ms로 표현, 겹침 구간 시작 _id)
+    _EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+    _MIN_OBJECT_ID = ObjectId("0" * 24)
+
     @classmethod
     async def validate_memo(cls, author: str, content: str) -> bool:
         """
@@ -37,6 +52,77 @@ class MemoService:
 
         return True
 
+    @classmethod
+    async def validate_memo_list(
+        cls, memo_list: list[tuple[str, str]]
+    ) -> list[str | None]:
+        """
+        여러 메모의 작성자와 내용을 한 번에 검토하는 함수
+
+        길이, 공백 검사는 메모마다 실행하고, 비속어 검사는 통과한 문자열만 모아
+        CPUPool에서 한 번에 실행한다. 실패 사유는 validate_memo와 같은 순서
+        (작성자 → 내용)로 결정된다.
+
+        Parameters
+        ---
+        memo_list: list[tuple[str, str]], (작성자, 내용) 리스트
+
+        Return
+        ---
+        list[str | None], 입력 순서대로 실패 사유 (통과 시 None)
+
+        Exceptions
+        ---
+        503: 비속어 검사 작업이 밀려 있을 경우
+        """
+        cheap_cost = cls._max_cost(check_profanity=False)
+        author_errors = [
+            MemoValidator.author.first_error(author, max_cost=cheap_cost)
+            for author, _ in memo_list
+        ]
+        content_errors = [
+            MemoValidator.content.first_error(content, max_cost=cheap_cost)
+            for _, content in memo_list
+        ]
+
+        # 앞선 검사에서 실패 사유가 정해지지 않은 문자열만 비속어 검사
+        text_list = []
+        for (author, content), author_error, content_error in zip(
+            memo_list, author_errors, content_errors
+        ):
+            if author_error is None:
+                text_list.append(author)
+                if content_error is None:
+                    text_list.append(content)
+        with ServerTiming.measure("korcen"):
+            is_bad_list = iter(
+                await CPUPool.run("profanity_batch", check_many, text_list)
+                if text_list
+                else []
+            )
+
+        author_bad_word = MemoValidator.author.rule("no_profanity").exception()
+        content_bad_word = MemoValidator.content.rule("no_profanity").exception()
+
+        result_list: list[str | None] = []
+        for author_error, content_error in zip(author_errors, content_errors):
+            if author_error is not None:
+                error = author_error
+            elif next(is_bad_list):
+                error = author_bad_word
+                if content_error is None:
+                    next(is_bad_list)
+            elif content_error is not None:
+                error = content_error
+            elif next(is_bad_list):
+                error = content_bad_word
+            else:
+                result_list.append(None)
+                continue
+            result_list.append(error.detail)
+
+        return result_list
+
     @classmethod
     async def insert_memo(cls, board_id: str, request: MemoInsertRequest) -> str:
         """
@@ -54,15 +140,14 @@ class MemoService:
         await BoardService._validate_object_id(board_id=board_id)
         await BoardService._validate_board_id(board_id=board_id)
 
-        await cls._validate_author(author=request.author)
-        await cls._validate_content(content=request.content)
-
-        is_same = await MemoCollection.is_same_locate_idx_memo(
-            board_id=board_id, locate_idx=request.locate_idx
+        # 비동기 모더레이션 모드에서는 비속어 검사를 백그라운드 워커에 맡김
+        is_pending = settings.MEMO_MODERATION_ASYNC
+        await cls._validate_author(
+            author=request.author, check_profanity=not is_pending
+        )
+        await cls._validate_content(
+            content=request.content, check_profanity=not is_pending
         )
-
-        if is_same:
-            raise SameLocateIdxMemoException()
 
         insert_memo = MemoDocument(
             board_id=board_id,
@@ -70,9 +155,50 @@ class MemoService:
             bg_num=request.bg_num,
             author=request.author,
             content=request.content,
+            status=MemoStatus.PENDING if is_pending else MemoStatus.PUBLISHED,
+            # pending 메모는 검사를 통과해 공개될 때 기록
+            published_at=None if is_pending else datetime.now(timezone.utc),
+            # 이 워커가 검사를 맡으며, 기한 안에 끝내지 못하면 sweep이 다시 가져감
+            moderation_lease_until=(
+                datetime.now(timezone.utc)
+                + timedelta(seconds=settings.MEMO_MODERATION_LEASE_SECONDS)
+                if is_pending
+                else None
+            ),
         )
 
-        inserted_id = await MemoCollection.insert_memo(document=insert_memo)
+        # 메모 위치 중복은 (board_id, locate_idx) unique 인덱스로 확인
+        try:
+            inserted_id = await MemoCollection.insert_memo(document=insert_memo)
+        except DuplicateKeyError:
+            raise SameLocateIdxMemoException()
+
+        if is_pending:
+            item = ModerationItem(
+                memo_id=inserted_id,
+                board_id=board_id,
+                locate_idx=request.locate_idx,
+                bg_num=request.bg_num,
+                author=request.author,
+                content=request.content,
+            )
+            # 큐가 가득 찬 경우 메모는 pending으로 남겨두고 작업 기한이 지나면 sweep이 검사
+            # (이미 저장된 메모이므로 요청은 성공으로 응답)
+            MemoModerator.submit(item)
+        else:
+            # 칠판 조회 결과가 바뀌었으므로 ETag에 사용하는 버전을 올림
+            await BoardCollection.increment_board_version(board_id=board_id)
+            await EventBus.publish(EventType.BOARD_CHANGED, {"board_id": board_id})
+            await EventBus.publish(
+                EventType.MEMO_PUBLISHED,
+                {
+                    "board_id": board_id,
+                    "memo_id": inserted_id,
+                    "locate_idx": request.locate_idx,
+                    "bg_num": request.bg_num,
+                },
+            )
+
         return inserted_id
 
     @classmethod
@@ -98,13 +224,175 @@ class MemoService:
         return memo.author, memo.content
 
     @classmethod
-    async def _validate_content(cls, content: str) -> None:
+    async def get_memo_list(
+        cls, board_id: str, token: JWT.Payload
+    ) -> AsyncIterator[MemoDocument]:
+        """
+        칠판 주인이 졸업 이후 칠판의 모든 메모를 한 번에 조회하는 함수
+
+        권한과 졸업 여부는 한 번만 확인하고, 메모는 커서 한 번으로 순회한다.
+
+        Parameters
+        ---
+        board_id: str, 조회할 칠판 ID
+        token: JWT.Payload, 요청자의 토큰
+
+        Return
+        ---
+        AsyncIterator[MemoDocument], 메모를 하나씩 반환하는 비동기 이터레이터
+
+        Exceptions
+        ---
+        404: 존재하지 않는 칠판일 경우
+        403: 토큰의 board_id와 요청한 칠판이 다를 경우
+        403: 조회 시점이 졸업 시점보다 이전일 경우
+        """
+        await BoardService._validate_object_id(board_id=board_id)
+        if board_id != token.board_id:
+            raise NotBoardOwnerException()
+        await BoardService._validate_board_graduation(board_id=board_id)
+
+        return MemoCollection.iter_memo_list_by_board_id(board_id=board_id)
+
+    @classmethod
+    async def get_memo_summary_list_since(
+        cls, board_id: str, since: str | None
+    ) -> tuple[list[MemoSummaryData], str | None, bool]:
+        """
+        커서(since) 이후에 공개된 메모 요약만 조회하는 함수
+
+        메모는 생성 시각이 아닌 공개 시각(published_at) 순으로 조회하므로, 먼저 저장되고
+        나중에 검사를 통과한 메모도 다음 조회에 포함된다.
+        공개 시각은 워커마다 따로 기록되어 순서가 조금 어긋날 수 있으므로
+        커서보다 MEMO_SYNC_OVERLAP_SECONDS 앞에서부터 조회한다.
+        이미 받은 메모가 다시 포함될 수 있어 클라이언트는 memo_id로 중복을 제거한다.
+
+        Parameters
+        ---
+        board_id: str, 조회할 칠판 ID
+        since: str | None, 이전 응답의 next_cursor (없으면 처음부터 조회)
+
+        Return
+        ---
+        tuple[list[MemoSummaryData], str | None, bool], 메모 요약 리스트, 다음 커서, 남은 메모 여부
+
+        Exceptions
+        ---
+        400: 커서 형식이 올바르지 않을 경우
+        404: 존재하지 않는 칠판일 경우
+        """
+        await BoardService._validate_object_id(board_id=board_id)
+        await BoardService._validate_board_id(board_id=board_id)
+
+        limit = settings.MEMO_SYNC_PAGE_SIZE
+        since_key = cls._validate_cursor(since) if since is not None else None
+        overlap_key = (
+            (
+                since_key[0] - timedelta(seconds=settings.MEMO_SYNC_OVERLAP_SECONDS),
+                cls._MIN_OBJECT_ID,
+            )
+            if since_key is not None
+            else None
+        )
+
+        memo_list = await MemoCollection.find_memo_summary_list_published_after(
+            board_id=board_id, after=overlap_key, limit=limit
+        )
+        # 겹쳐서 조회하는 구간만으로 가득 찬 경우 커서가 앞으로 가지 않으므로 겹침 생략
+        if (
+            since_key is not None
+            and len(memo_list) == limit
+            and cls._cursor_key(memo_list[-1]) <= since_key
+        ):
+            memo_list = await MemoCollection.find_memo_summary_list_published_after(
+                board_id=board_id, after=since_key, limit=limit
+            )
+
+        # 겹치는 구간만 조회된 경우 커서가 뒤로 가지 않도록 since를 유지
+        cursor_key = cls._cursor_key(memo_list[-1]) if memo_list else None
+        if since_key is not None and (cursor_key is None or cursor_key < since_key):
+            cursor_key = since_key
+
+        memo_summary_list = [
+            MemoSummaryData(
+                memo_id=str(memo._id), locate_idx=memo.locate_idx, bg_num=memo.bg_num
+            )
+            for memo in memo_list
+        ]
+        return (
+            memo_summary_list,
+            cls._encode_cursor(cursor_key) if cursor_key is not None else None,
+            len(memo_list) == limit,
+        )
+
+    @classmethod
+    def _cursor_key(cls, memo: MemoSummaryDocument) -> tuple[datetime, ObjectId]:
+        assert memo.published_at is not None
+        return memo.published_at, memo._id
+
+    @classmethod
+    def _encode_cursor(cls, key: tuple[datetime, ObjectId]) -> str:
+        # MongoDB의 datetime은 ms 단위이므로 ms 정수로 표현해도 정확히 복원됨
+        published_at, _id = key
+        return f"{(published_at - cls._EPOCH) // timedelta(milliseconds=1)}_{_id}"
+
+    @classmethod
+    def _validate_cursor(cls, cursor: str) -> tuple[datetime, ObjectId]:
+        """
+        증분 조회 커서를 (공개 시각, _id)로 바꾸는 함수
+
+        커서는 "<공개 시각(epoch ms)>_<메모 ID>" 형식이며, 이전 형식인 메모 ID만 있는
+        커서는 ID의 생성 시각을 공개 시각으로 사용한다.
+
+        Exceptions
+        ---
+        400: 커서 형식이 올바르지 않을 경우
+        """
+        if ObjectId.is_valid(cursor):
+            _id = ObjectId(cursor)
+            return _id.generation_time, _id
+
+        published_ms, _, memo_id = cursor.partition("_")
+        is_valid = (
+            published_ms.isascii()
+            and published_ms.isdigit()
+            and ObjectId.is_valid(memo_id)
+        )
+        if not is_valid:
+            raise InvalidCursorException()
+        try:
+            published_at = cls._EPOCH + timedelta(milliseconds=int(published_ms))
+        except OverflowError:
+            raise InvalidCursorException()
+        return published_at, ObjectId(memo_id)
+
+    @classmethod
+    async def validate_memo_stream(cls, board_id: str) -> None:
+        """
+        새 메모 스트림을 구독할 수 있는 칠판인지 확인하는 함수
+
+        Parameters
+        ---
+        board_id: str, 구독할 칠판 ID
+
+        Exceptions
+        ---
+        404: 존재하지 않는 칠판일 경우
+        """
+        await BoardService._validate_object_id(board_id=board_id)
+        await BoardService._validate_board_id(board_id=board_id)
+
+    @classmethod
+    async def _validate_content(
+        cls, content: str, check_profanity: bool = True
+    ) -> None:
         """
         메모 내용의 유효성을 검사하는 함수
 
         Parameters
         ---
         content: str, 검증할 메모 내용
+        check_profanity: bool, 비속어 검사 여부
 
         Return
         ---
@@ -115,22 +403,17 @@ class MemoService:
         400: 내용에 비속어가 포함된 경우
         400: 내용의 길이가 1자 미만 100자 초과인 경우
         """
-        # 비속어 금지, Reference: https://github.com/Tanat05/korcen
-        if korcen.check(content):
-            raise CanNotUseBadWordInContentException()
-
-        # 내용 길이 검사 (임시로 길이 지정)
-        if len(content) < 1 or len(content) > 100:
-            raise ContentLengthException()
+        MemoValidator.content.validate(content, max_cost=cls._max_cost(check_profanity))
 
     @classmethod
-    async def _validate_author(cls, author: str) -> None:
+    async def _validate_author(cls, author: str, check_profanity: bool = True) -> None:
         """
         메모 작성자의 유효성을 검사하는 함수
 
         Parameters
         ---
         author: str, 검증할 작성자 이름
+        check_profanity: bool, 비속어 검사 여부
 
         Return
         ---
@@ -142,17 +425,12 @@ class MemoService:
         400: 이름의 앞뒤에 공백이 있을 경우
         400: 이름의 길이가 1자 미만 10자 초과인 경우
         """
-        # 비속어 금지, Reference: https://github.com/Tanat05/korcen
-        if korcen.check(author):
-            raise CanNotUseBadWordInNameException()
-
-        # 앞 뒤 공백 금지
-        if author[0] == " " or author[-1] == " ":
-            raise CanNotUseSpaceFrontEndBackInNameException()
+        MemoValidator.author.validate(author, max_cost=cls._max_cost(check_profanity))
 
-        # 이름 길이 검사 (임시로 길이 지정)
-        if len(author) < 1 or len(author) > 10:
-            raise ValidateAuthorLengthException()
+    @staticmethod
+    def _max_cost(check_profanity: bool) -> int:
+        # 비속어 검사를 생략하면 그보다 비용이 낮은 규칙까지만 실행
+        return Cost.PROFANITY if check_profanity else Cost.PROFANITY - 1
 
     @classmethod
     async def _validate_memo_id(cls, memo_id: str) -> MemoDocument:
@@ -169,10 +447,10 @@ class MemoService:
 
         Exceptions
         ---
-        404: 존재하지 않은 메모 ID일 경우
+        404: 존재하지 않은 메모 ID일 경우 (검사 대기 중이거나 숨겨진 메모 포함)
         """
         memo = await MemoCollection.find_memo_by_id(memo_id=memo_id)
-        if not memo:
+        if not memo or memo.status != MemoStatus.PUBLISHED:
             raise DoesNotExistMemoException()
 
         return memo
@@ -0,0 +1,54 @@
+from app.base.settings import settings
+from app.core.event import EventType
+from app.domain.memo.response import MemoSummaryData
+from app.utils.event_bus import EventBus
+from app.utils.pubsub import PubSub, Subscription
+
+
+class MemoStream:
+    """
+    칠판별로 새로 공개된 메모를 SSE 연결에 전달하는 클래스
+
+    다른 워커에서 공개된 메모는 EventBus의 MEMO_PUBLISHED 이벤트로 받아 전달한다.
+    """
+
+    _pubsub: PubSub[str, MemoSummaryData] = PubSub(
+        queue_size=settings.MEMO_STREAM_QUEUE_SIZE, name="memo_stream"
+    )
+
+    @classmethod
+    def subscribe(cls, board_id: str) -> Subscription[str, MemoSummaryData]:
+        return cls._pubsub.subscribe(board_id)
+
+    @classmethod
+    def unsubscribe(cls, subscription: Subscription[str, MemoSummaryData]) -> None:
+        cls._pubsub.unsubscribe(subscription)
+
+    @classmethod
+    def publish(cls, board_id: str, memo: MemoSummaryData) -> None:
+        """
+        칠판을 구독 중인 연결에 새 메모를 전달하는 함수
+
+        Parameters
+        ---
+        board_id: str, 메모가 속한 칠판 ID
+        memo: MemoSummaryData, 공개된 메모 요약
+        """
+        cls._pubsub.publish(board_id, memo)
+
+    @classmethod
+    def stats(cls) -> dict[str, int]:
+        return cls._pubsub.stats()
+
+
+EventBus.subscribe(
+    EventType.MEMO_PUBLISHED,
+    lambda data: MemoStream.publish(
+        data["board_id"],
+        MemoSummaryData(
+            memo_id=data["memo_id"],
+            locate_idx=data["locate_idx"],
+            bg_num=data["bg_num"],
+        ),
+    ),
+)
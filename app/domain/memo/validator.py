@@ -0,0 +1,45 @@
+from app.core.exception import (
+    CanNotUseBadWordInContentException,
+    CanNotUseBadWordInNameException,
+    CanNotUseSpaceFrontEndBackInNameException,
+    ContentLengthException,
+    ValidateAuthorLengthException,
+)
+from app.utils.validator import (
+    Validator,
+    max_length,
+    min_length,
+    no_profanity,
+    no_space_front_back,
+)
+
+
+class MemoValidator:
+    """
+    메모 필드 검사 규칙
+
+    author
+        - 1자 이상 10자 이하 (임시로 길이 지정)
+        - 앞 뒤 공백 금지
+        - 비속어 금지
+    content
+        - 1자 이상 100자 이하 (임시로 길이 지정)
+        - 비속어 금지
+    """
+
+    author = Validator(
+        [
+            min_length(1, ValidateAuthorLengthException),
+            max_length(10, ValidateAuthorLengthException),
+            no_space_front_back(CanNotUseSpaceFrontEndBackInNameException),
+            no_profanity(CanNotUseBadWordInNameException),
+        ]
+    )
+
+    content = Validator(
+        [
+            min_length(1, ContentLengthException),
+            max_length(100, ContentLengthException),
+            no_profanity(CanNotUseBadWordInContentException),
+        ]
+    )
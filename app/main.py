@@ -1,16 +1,52 @@
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
 import uvicorn
-from typing import Any, Dict
+from typing import Any, AsyncIterator, Dict
 
 from app.domain.board.router import router as board_router
 from app.domain.memo.router import router as memo_router
 from app.domain.developer.router import router as developer_router
 from app.base.settings import settings
+from app.core.middleware import (
+    IdentityMapMiddleware,
+    MetricsMiddleware,
+    ServerTimingMiddleware,
+)
+from app.db.database import Database
+from app.db.index import IndexRegistry
+from app.domain.board.name_filter import BoardNameFilter
+from app.domain.memo.collection import MemoCollection
+from app.domain.memo.moderation import MemoModerator
+from app.utils.cpu_pool import CPUPool
+from app.utils.event_bus import EventBus
+from app.utils.metrics import Metrics
 
 mode = settings.MODE
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    Database.connect()
+    await Database.warmup()
+    await IndexRegistry.ensure_indexes()
+    # published_at이 추가되기 전에 저장된 메모도 증분 조회에 포함되도록 채움
+    await MemoCollection.backfill_published_at()
+    await EventBus.start()
+    await BoardNameFilter.start()
+    await CPUPool.start()
+    if settings.MEMO_MODERATION_ASYNC:
+        await MemoModerator.start()
+    yield
+    await MemoModerator.stop()
+    await BoardNameFilter.stop()
+    CPUPool.shutdown()
+    await EventBus.stop()
+    Database.close()
+
+
 app = FastAPI(
+    lifespan=lifespan,
     openapi_url=None if mode == "MAIN" else "/openapi.json",
     docs_url=None if mode == "MAIN" else "/docs",
     redoc_url=None if mode == "MAIN" else "/redoc",
@@ -23,6 +59,10 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+app.add_middleware(IdentityMapMiddleware)
+if settings.SERVER_TIMING_ENABLED:
+    app.add_middleware(ServerTimingMiddleware)
+app.add_middleware(MetricsMiddleware)
 app.include_router(router=board_router)
 app.include_router(router=memo_router)
 app.include_router(router=developer_router)
@@ -33,5 +73,14 @@ async def root() -> Dict[str, Any]:
     return {"I'm ready": "OK"}
 
 
+async def metrics() -> Response:
+    return Response(content=Metrics.render(), media_type=Metrics.CONTENT_TYPE)
+
+
+# 운영(MAIN) 환경에서는 METRICS_ENABLED일 때만 노출
+if mode != "MAIN" or settings.METRICS_ENABLED:
+    app.add_api_route("/metrics", metrics, methods=["GET"], include_in_schema=False)
+
+
 if __name__ == "__main__":
     uvicorn.run("app.main:app", reload=True)
@@ -1,11 +1,20 @@
 from asyncio import AbstractEventLoop
-from typing import Generator
+from typing import AsyncGenerator, Generator
 import pytest_asyncio
 import asyncio
 
+from app.db.index import IndexRegistry
+
 
 @pytest_asyncio.fixture(scope="session")
 def event_loop() -> Generator[AbstractEventLoop, None, None]:
     loop = asyncio.get_event_loop()
     yield loop
     loop.close()
+
+
+@pytest_asyncio.fixture(scope="session")
+async def ensure_indexes() -> AsyncGenerator[None, None]:
+    # ASGITransport는 lifespan을 실행하지 않으므로 unique 인덱스를 직접 생성
+    await IndexRegistry.ensure_indexes()
+    yield
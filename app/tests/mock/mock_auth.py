@@ -13,3 +13,15 @@ async def mock_login(board_name: str, password: str) -> Response:
         response = await client.post("/board/login", json=login_request)
 
     return response
+
+
+async def mock_refresh_token(refresh_token: str) -> Response:
+
+    refresh_request = {"refresh_token": refresh_token}
+
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        response = await client.post("/board/token/refresh", json=refresh_request)
+
+    return response
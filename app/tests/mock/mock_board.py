@@ -5,6 +5,7 @@ from typing import Tuple
 import dataclasses
 import uuid
 
+from app.domain.board.validator import BoardValidator
 from app.main import app
 
 
@@ -21,6 +22,7 @@ async def mock_create_board(
     password: str | None = None,
     bg_num: int = 0,
     graduated_at: str | None = None,
+    receipt: str | None = None,
 ) -> Tuple[Response, mock_board_dto]:
     """
     칠판 생성 모킹 함수
@@ -31,6 +33,7 @@ async def mock_create_board(
     password: str | None = None, 비밀번호
     bg_num: int = 0, 배경 번호
     graduated_at: datetime | None = None, 졸업 날짜
+    receipt: str | None = None, 칠판 이름 검증 영수증
 
     Return
     ---
@@ -50,12 +53,18 @@ async def mock_create_board(
         "bg_num": bg_num,
         "graduated_at": graduated_at,
     }
+    if receipt is not None:
+        mock_request["receipt"] = receipt
 
     async with AsyncClient(
         transport=ASGITransport(app=app), base_url="http://test"
     ) as client:
         if is_mock_board_name:
-            with patch("app.domain.board.service.BoardService._length_checker"):
+            with patch.object(
+                BoardValidator,
+                "board_name",
+                BoardValidator.board_name.without("max_length"),
+            ):
                 response = await client.post("/board", json=mock_request)
         else:
             response = await client.post("/board", json=mock_request)
@@ -68,3 +77,26 @@ async def mock_create_board(
     )
 
     return response, mock_dto
+
+
+async def mock_validate_board(board_name: str, password: str) -> Response:
+    """
+    칠판 이름 검증 모킹 함수
+
+    Parameter
+    ---
+    board_name: str, 칠판 이름
+    password: str, 비밀번호
+
+    Return
+    ---
+    Response: Response, request 결과
+    """
+    mock_request = {"board_name": board_name, "password": password}
+
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        response = await client.post("/board/validate", json=mock_request)
+
+    return response
@@ -0,0 +1,40 @@
+from httpx import AsyncClient, ASGITransport, Response
+
+from app.main import app
+
+
+async def mock_create_memo(
+    board_id: str,
+    locate_idx: int = 0,
+    bg_num: int = 0,
+    author: str = "민서",
+    content: str = "졸업 축하해",
+) -> Response:
+    """
+    메모 생성 모킹 함수
+
+    Parameter
+    ---
+    board_id: str, 메모를 생성할 칠판 아이디
+    locate_idx: int = 0, 메모 위치
+    bg_num: int = 0, 배경 번호
+    author: str = "민서", 작성자
+    content: str = "졸업 축하해", 메모 내용
+
+    Return
+    ---
+    Response: Response, request 결과
+    """
+    mock_request = {
+        "locate_idx": locate_idx,
+        "bg_num": bg_num,
+        "author": author,
+        "content": content,
+    }
+
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        response = await client.post(f"/board/{board_id}/memo/", json=mock_request)
+
+    return response
@@ -1,7 +1,10 @@
 from fastapi import status
+import pytest
 
 from app.tests.mock.mock_board import mock_create_board
-from app.tests.mock.mock_auth import mock_login
+from app.tests.mock.mock_auth import mock_login, mock_refresh_token
+
+pytestmark = pytest.mark.usefixtures("ensure_indexes")
 
 
 async def test_login_success() -> None:
@@ -47,3 +50,30 @@ async def test_login_fail_board_name() -> None:
     # Then
     assert response.status_code == status.HTTP_200_OK
     assert login_response.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+async def test_refresh_token_success() -> None:
+    # Given
+    response, mock_board_dto = await mock_create_board()
+    refresh_token = response.json()["data"]["refresh_token"]
+
+    # When
+    refresh_response = await mock_refresh_token(refresh_token=refresh_token)
+
+    # Then
+    assert refresh_response.status_code == status.HTTP_200_OK
+    assert "access_token" in refresh_response.json()["data"]
+    assert "refresh_token" in refresh_response.json()["data"]
+
+
+async def test_refresh_token_fail_access_token() -> None:
+    # Given
+    response, mock_board_dto = await mock_create_board()
+    access_token = response.json()["data"]["access_token"]
+
+    # When
+    # 엑세스 토큰으로는 재발급할 수 없음
+    refresh_response = await mock_refresh_token(refresh_token=access_token)
+
+    # Then
+    assert refresh_response.status_code == status.HTTP_401_UNAUTHORIZED
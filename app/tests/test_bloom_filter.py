@@ -0,0 +1,69 @@
+from typing import AsyncIterator
+from unittest.mock import AsyncMock, patch
+
+from prometheus_client import REGISTRY
+
+from app.domain.board.collection import BoardCollection
+from app.domain.board.name_filter import BoardNameFilter
+from app.utils.bloom_filter import BloomFilter
+
+
+def test_bloom_filter_no_false_negative() -> None:
+    # Given
+    bloom_filter = BloomFilter(capacity=1000, error_rate=0.01)
+    names = [f"칠판{i}" for i in range(1000)]
+
+    # When
+    for name in names:
+        bloom_filter.add(name)
+
+    # Then
+    assert all(name in bloom_filter for name in names)
+
+
+def test_bloom_filter_false_positive_rate() -> None:
+    # Given
+    bloom_filter = BloomFilter(capacity=1000, error_rate=0.01)
+    for i in range(1000):
+        bloom_filter.add(f"칠판{i}")
+
+    # When
+    false_positives = sum(f"없는칠판{i}" in bloom_filter for i in range(10000))
+
+    # Then
+    assert false_positives / 10000 < 0.03
+    assert bloom_filter.stats()["false_positive_rate"] < 0.02
+
+
+async def test_board_name_filter_export_metrics() -> None:
+    # Given
+    async def iter_board_name() -> AsyncIterator[str]:
+        yield "칠판"
+
+    skipped = (
+        REGISTRY.get_sample_value(
+            "board_name_filter_checks_total", {"result": "skipped"}
+        )
+        or 0.0
+    )
+    # 다른 테스트가 만든 칠판이 중복 확인을 생략하지 않도록 필터를 테스트 후 되돌림
+    with patch.object(BoardNameFilter, "_filter", None):
+        with patch.object(
+            BoardCollection, "count_board", AsyncMock(return_value=1)
+        ), patch.object(BoardCollection, "iter_board_name", iter_board_name):
+            await BoardNameFilter.rebuild()
+
+        # When
+        BoardNameFilter.might_contain("새 칠판")
+
+    # Then
+    assert (
+        REGISTRY.get_sample_value(
+            "board_name_filter_checks_total", {"result": "skipped"}
+        )
+        == skipped + 1
+    )
+    assert (REGISTRY.get_sample_value("board_name_filter_memory_bytes") or 0.0) > 0
+    assert (
+        REGISTRY.get_sample_value("board_name_filter_false_positive_rate") or 0.0
+    ) > 0
@@ -1,6 +1,14 @@
 from fastapi import status
+import pytest
+import uuid
 
-from app.tests.mock.mock_board import mock_create_board
+from httpx import AsyncClient, ASGITransport
+
+from app.main import app
+from app.tests.mock.mock_board import mock_create_board, mock_validate_board
+from app.tests.mock.mock_memo import mock_create_memo
+
+pytestmark = pytest.mark.usefixtures("ensure_indexes")
 
 
 async def test_post_board_success() -> None:
@@ -134,3 +142,59 @@ async def test_post_board_password_too_short() -> None:
 
     # Then
     assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+async def test_post_board_with_receipt() -> None:
+    # Given
+    board_name = uuid.uuid4().hex[:8]
+    validate_response = await mock_validate_board(
+        board_name=board_name, password="1004"
+    )
+    receipt = validate_response.json()["data"]["receipt"]
+
+    # When
+    response, _ = await mock_create_board(board_name=board_name, receipt=receipt)
+
+    # Then
+    assert validate_response.status_code == status.HTTP_200_OK
+    assert response.status_code == status.HTTP_200_OK
+
+
+async def test_post_board_receipt_other_name() -> None:
+    # Given
+    validate_response = await mock_validate_board(
+        board_name=uuid.uuid4().hex[:8], password="1004"
+    )
+    receipt = validate_response.json()["data"]["receipt"]
+
+    # When
+    response, _ = await mock_create_board(board_name="닉", receipt=receipt)
+
+    # Then
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+async def test_get_board_not_modified() -> None:
+    # Given
+    board_response, _ = await mock_create_board()
+    board_id = board_response.json()["data"]["board_id"]
+
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        first_response = await client.get(f"/board/{board_id}/")
+        etag = first_response.headers["ETag"]
+
+        # When
+        response = await client.get(
+            f"/board/{board_id}/", headers={"If-None-Match": etag}
+        )
+        await mock_create_memo(board_id=board_id, locate_idx=0)
+        changed_response = await client.get(
+            f"/board/{board_id}/", headers={"If-None-Match": etag}
+        )
+
+    # Then
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+    assert changed_response.status_code == status.HTTP_200_OK
+    assert changed_response.headers["ETag"] != etag
@@ -0,0 +1,81 @@
+from unittest.mock import patch
+
+from prometheus_client import REGISTRY
+
+from app.utils.cache import TTLCache
+
+
+def test_cache_hit_and_miss() -> None:
+    # Given
+    cache: TTLCache[str, int] = TTLCache(max_size=2, ttl=60)
+    cache.set("a", 1)
+
+    # When
+    hit = cache.get("a")
+    miss = cache.get("b")
+
+    # Then
+    assert hit == 1
+    assert miss is None
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_cache_evict_least_recently_used() -> None:
+    # Given
+    cache: TTLCache[str, int] = TTLCache(max_size=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+
+    # When
+    cache.set("c", 3)
+
+    # Then
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.stats()["evictions"] == 1
+
+
+def test_cache_expire_after_ttl() -> None:
+    # Given
+    cache: TTLCache[str, int] = TTLCache(max_size=2, ttl=10)
+    with patch("app.utils.cache.time.monotonic", return_value=100.0):
+        cache.set("a", 1)
+
+    # When
+    with patch("app.utils.cache.time.monotonic", return_value=111.0):
+        value = cache.get("a")
+
+    # Then
+    assert value is None
+    assert cache.stats()["expirations"] == 1
+
+
+def test_named_cache_export_metrics() -> None:
+    # Given
+    cache: TTLCache[str, int] = TTLCache(max_size=1, ttl=60, name="test_export")
+    cache.set("a", 1)
+
+    # When
+    cache.get("a")
+    cache.get("b")
+    cache.set("b", 2)
+
+    # Then
+    labels = {"cache": "test_export"}
+    assert (
+        REGISTRY.get_sample_value("cache_lookups_total", labels | {"result": "hit"})
+        == 1
+    )
+    assert (
+        REGISTRY.get_sample_value("cache_lookups_total", labels | {"result": "miss"})
+        == 1
+    )
+    assert (
+        REGISTRY.get_sample_value(
+            "cache_removals_total", labels | {"reason": "evicted"}
+        )
+        == 1
+    )
+    assert REGISTRY.get_sample_value("cache_entries", labels) == 1
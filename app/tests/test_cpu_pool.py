@@ -0,0 +1,118 @@
+import asyncio
+import time
+from typing import AsyncGenerator
+from unittest.mock import patch
+
+import pytest
+import pytest_asyncio
+from prometheus_client import REGISTRY
+
+from app.base.settings import settings
+from app.core.exception import CPUPoolBusyException, CPUPoolTimeoutException
+from app.utils.cpu_pool import CPUPool
+
+
+@pytest_asyncio.fixture
+async def cpu_pool() -> AsyncGenerator[None, None]:
+    # 테스트마다 작은 프로세스 풀을 새로 만들고 종료
+    with patch.object(settings, "CPU_POOL_WORKERS", 1), patch.object(
+        settings, "CPU_POOL_MAX_PENDING", 1
+    ):
+        CPUPool.shutdown()
+        CPUPool._stats = {}
+        yield
+        CPUPool.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_cpu_pool_round_trip(cpu_pool: None) -> None:
+    # When
+    result = await CPUPool.run("pow", pow, 2, 10)
+
+    # Then
+    assert result == 1024
+    assert CPUPool.stats()["operations"]["pow"]["completed"] == 1
+    assert CPUPool.stats()["pending"] == 0
+
+
+@pytest.mark.asyncio
+async def test_cpu_pool_busy(cpu_pool: None) -> None:
+    # Given
+    running = asyncio.ensure_future(CPUPool.run("sleep", time.sleep, 0.3))
+    await asyncio.sleep(0)
+
+    # When
+    with pytest.raises(CPUPoolBusyException) as exc_info:
+        await CPUPool.run("pow", pow, 2, 10)
+
+    # Then
+    assert exc_info.value.status_code == 503
+    assert CPUPool.stats()["operations"]["pow"]["rejected"] == 1
+    await running
+    assert await CPUPool.run("pow", pow, 2, 10) == 1024
+
+
+@pytest.mark.asyncio
+async def test_cpu_pool_timeout(cpu_pool: None) -> None:
+    # When
+    with pytest.raises(CPUPoolTimeoutException) as exc_info:
+        await CPUPool.run("sleep", time.sleep, 0.5, timeout=0.05)
+
+    # Then
+    assert exc_info.value.status_code == 503
+    assert CPUPool.stats()["operations"]["sleep"]["timed_out"] == 1
+
+
+@pytest.mark.asyncio
+async def test_cpu_pool_inline() -> None:
+    # Given
+    with patch.object(settings, "CPU_POOL_WORKERS", 0):
+        # When
+        result = await CPUPool.run("pow", pow, 3, 3)
+
+    # Then
+    assert result == 27
+
+
+@pytest.mark.asyncio
+async def test_cpu_pool_start_warm_up_workers(cpu_pool: None) -> None:
+    # When
+    await CPUPool.start()
+
+    # Then
+    executor = CPUPool._get_executor()
+    assert len(executor._processes) == settings.CPU_POOL_WORKERS
+    assert CPUPool.stats()["pending"] == 0
+
+
+@pytest.mark.asyncio
+async def test_cpu_pool_export_metrics(cpu_pool: None) -> None:
+    # Given
+    duration_count = (
+        REGISTRY.get_sample_value(
+            "cpu_pool_task_duration_seconds_count",
+            {"op": "pow", "outcome": "success"},
+        )
+        or 0.0
+    )
+    timed_out = (
+        REGISTRY.get_sample_value("cpu_pool_timed_out_total", {"op": "sleep"}) or 0.0
+    )
+
+    # When
+    await CPUPool.run("pow", pow, 2, 10)
+    with pytest.raises(CPUPoolTimeoutException):
+        await CPUPool.run("sleep", time.sleep, 0.3, timeout=0.05)
+
+    # Then
+    assert (
+        REGISTRY.get_sample_value(
+            "cpu_pool_task_duration_seconds_count",
+            {"op": "pow", "outcome": "success"},
+        )
+        == duration_count + 1
+    )
+    assert (
+        REGISTRY.get_sample_value("cpu_pool_timed_out_total", {"op": "sleep"})
+        == timed_out + 1
+    )
@@ -0,0 +1,121 @@
+from typing import Iterator
+from unittest.mock import patch
+
+from passlib.context import CryptContext
+import pytest
+from prometheus_client import REGISTRY
+
+from app.base.settings import settings
+from app.utils.security import CredentialCache, Security
+
+BOARD_ID = "board"
+
+
+@pytest.fixture(autouse=True)
+def login_cache() -> Iterator[None]:
+    # 테스트 시간을 줄이기 위해 낮은 작업 비용의 bcrypt를 이벤트 루프에서 바로 실행
+    rounds = 4
+    pwd_context = CryptContext(
+        schemes=["bcrypt"],
+        bcrypt__default_rounds=rounds,
+        bcrypt__min_rounds=rounds,
+        bcrypt__max_rounds=rounds,
+    )
+    with patch.object(settings, "LOGIN_CACHE_ENABLED", True), patch.object(
+        settings, "CPU_POOL_WORKERS", 0
+    ), patch.object(Security, "pwd_context", pwd_context):
+        CredentialCache._cache.clear()
+        yield
+        CredentialCache._cache.clear()
+
+
+async def _login(password: str, hashed_password: str) -> bool:
+    is_verified, _ = await Security.verify_login_password(
+        board_id=BOARD_ID, plain_password=password, hashed_password=hashed_password
+    )
+    return is_verified
+
+
+@pytest.mark.asyncio
+async def test_credential_cache_hit_after_success() -> None:
+    # Given
+    hashed_password = await Security.hash_password("0000")
+    await _login("0000", hashed_password)
+    hits = CredentialCache.stats()["hits"]
+
+    # When
+    is_verified = await _login("0000", hashed_password)
+
+    # Then
+    assert is_verified
+    assert CredentialCache.stats()["hits"] == hits + 1
+
+
+@pytest.mark.asyncio
+async def test_credential_cache_reject_wrong_password() -> None:
+    # Given
+    hashed_password = await Security.hash_password("0000")
+    await _login("0000", hashed_password)
+    verify_count = CredentialCache.stats()["bcrypt_verify_count"]
+
+    # When
+    is_verified = await _login("1111", hashed_password)
+
+    # Then
+    assert not is_verified
+    assert CredentialCache.stats()["bcrypt_verify_count"] == verify_count + 1
+
+
+@pytest.mark.asyncio
+async def test_credential_cache_expire() -> None:
+    # Given
+    hashed_password = await Security.hash_password("0000")
+    with patch("app.utils.cache.time.monotonic", return_value=100.0):
+        await _login("0000", hashed_password)
+    verify_count = CredentialCache.stats()["bcrypt_verify_count"]
+
+    # When
+    expired_at = 100.0 + settings.LOGIN_CACHE_TTL_SECONDS + 1
+    with patch("app.utils.cache.time.monotonic", return_value=expired_at):
+        is_verified = await _login("0000", hashed_password)
+
+    # Then
+    assert is_verified
+    assert CredentialCache.stats()["bcrypt_verify_count"] == verify_count + 1
+
+
+@pytest.mark.asyncio
+async def test_credential_cache_miss_after_hash_change() -> None:
+    # Given
+    old_hashed_password = await Security.hash_password("0000")
+    await _login("0000", old_hashed_password)
+    new_hashed_password = await Security.hash_password("1111")
+    verify_count = CredentialCache.stats()["bcrypt_verify_count"]
+
+    # When
+    old_password_verified = await _login("0000", new_hashed_password)
+    new_password_verified = await _login("1111", new_hashed_password)
+
+    # Then
+    assert not old_password_verified
+    assert new_password_verified
+    assert CredentialCache.stats()["bcrypt_verify_count"] == verify_count + 2
+
+
+@pytest.mark.asyncio
+async def test_credential_cache_export_metrics() -> None:
+    # Given
+    labels = {"cache": "login_credential", "result": "hit"}
+    hits = REGISTRY.get_sample_value("cache_lookups_total", labels) or 0.0
+    saved_seconds = REGISTRY.get_sample_value("login_cache_saved_seconds_total") or 0.0
+    hashed_password = await Security.hash_password("0000")
+    await _login("0000", hashed_password)
+
+    # When
+    await _login("0000", hashed_password)
+
+    # Then
+    assert REGISTRY.get_sample_value("cache_lookups_total", labels) == hits + 1
+    assert (
+        REGISTRY.get_sample_value("login_cache_saved_seconds_total") or 0.0
+    ) > saved_seconds
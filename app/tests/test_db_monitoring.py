@@ -0,0 +1,105 @@
+from datetime import timedelta
+
+import pytest
+from prometheus_client import REGISTRY
+from pymongo import monitoring
+
+from app.db.monitoring import CommandMonitor, PoolMonitor, redact_filter
+
+ADDRESS = ("localhost", 27017)
+
+
+def test_pool_monitor_occupancy_and_wait() -> None:
+    # Given
+    monitor = PoolMonitor(max_pool_size=4)
+    monitor.connection_created(monitoring.ConnectionCreatedEvent(ADDRESS, 1))
+    monitor.connection_created(monitoring.ConnectionCreatedEvent(ADDRESS, 2))
+
+    # When
+    monitor.connection_checked_out(
+        monitoring.ConnectionCheckedOutEvent(ADDRESS, 1, 0.01)
+    )
+    monitor.connection_checked_out(
+        monitoring.ConnectionCheckedOutEvent(ADDRESS, 2, 0.03)
+    )
+    monitor.connection_checked_in(monitoring.ConnectionCheckedInEvent(ADDRESS, 1))
+
+    # Then
+    stats = monitor.stats()
+    assert stats["open_connections"] == 2
+    assert stats["in_use"] == 1
+    assert stats["max_in_use"] == 2
+    assert stats["occupancy"] == 0.25
+    assert stats["checkout_wait_max_seconds"] == 0.03
+    assert abs(stats["checkout_wait_avg_seconds"] - 0.02) < 1e-9
+
+
+def test_pool_monitor_export_metrics() -> None:
+    # Given
+    monitor = PoolMonitor(max_pool_size=4)
+    wait_count = (
+        REGISTRY.get_sample_value(
+            "mongo_pool_checkout_wait_seconds_count", {"outcome": "success"}
+        )
+        or 0.0
+    )
+
+    # When
+    monitor.connection_created(monitoring.ConnectionCreatedEvent(ADDRESS, 1))
+    monitor.connection_checked_out(
+        monitoring.ConnectionCheckedOutEvent(ADDRESS, 1, 0.002)
+    )
+
+    # Then
+    assert REGISTRY.get_sample_value("mongo_pool_connections", {"state": "open"}) == 1
+    assert REGISTRY.get_sample_value("mongo_pool_connections", {"state": "in_use"}) == 1
+    assert (
+        REGISTRY.get_sample_value(
+            "mongo_pool_checkout_wait_seconds_count", {"outcome": "success"}
+        )
+        == wait_count + 1
+    )
+
+
+def test_redact_filter_keep_shape_only() -> None:
+    # Given
+    query = {"board_id": "abc", "_id": {"$gt": 3}, "status": {"$nin": ["a", "b"]}}
+
+    # When
+    shape = redact_filter(query)
+
+    # Then
+    assert shape == {"board_id": "?", "_id": {"$gt": "?"}, "status": {"$nin": ["?"]}}
+
+
+def test_command_monitor_record_and_log_slow_query(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    # Given
+    monitor = CommandMonitor(slow_query_ms=100, window_seconds=60)
+    command = {"find": "memo", "filter": {"board_id": "secret"}}
+    slow_labels = {"collection": "memo", "command": "find"}
+    slow_count = REGISTRY.get_sample_value("mongo_slow_commands_total", slow_labels)
+
+    # When
+    for request_id, duration_ms in ((1, 3), (2, 150)):
+        monitor.started(
+            monitoring.CommandStartedEvent(command, "base", request_id, ADDRESS, 1)
+        )
+        monitor.succeeded(
+            monitoring.CommandSucceededEvent(
+                timedelta(milliseconds=duration_ms), {}, "find", request_id, ADDRESS, 1
+            )
+        )
+
+    # Then
+    stats = monitor.stats()["memo.find"]
+    assert stats["count"] == 2
+    assert sum(stats["recent_buckets"]) == 2
+    assert monitor.slow_queries == 1
+    assert (
+        REGISTRY.get_sample_value("mongo_slow_commands_total", slow_labels)
+        == (slow_count or 0.0) + 1
+    )
+    assert "memo.find" in caplog.text
+    assert "secret" not in caplog.text
@@ -0,0 +1,55 @@
+import asyncio
+from pathlib import Path
+from typing import Any
+
+from app.utils.event_bus import EventBus, LocalBroker
+
+
+async def test_local_broker_send_to_other_workers(tmp_path: Path) -> None:
+    # Given
+    received: list[bytes] = []
+    sender = LocalBroker(socket_dir=str(tmp_path), name="sender")
+    receiver = LocalBroker(socket_dir=str(tmp_path), name="receiver")
+    await sender.start(lambda payload: received.append(b"sender:" + payload))
+    await receiver.start(received.append)
+
+    # When
+    await sender.publish(b"event")
+    await asyncio.sleep(0.05)
+
+    # Then
+    assert received == [b"event"]
+    await sender.stop()
+    await receiver.stop()
+
+
+async def test_local_broker_remove_dead_peer(tmp_path: Path) -> None:
+    # Given
+    sender = LocalBroker(socket_dir=str(tmp_path), name="sender")
+    await sender.start(lambda payload: None)
+    (tmp_path / "dead.sock").touch()
+
+    # When
+    await sender.publish(b"event")
+
+    # Then
+    assert not (tmp_path / "dead.sock").exists()
+    assert sender.stats()["removed_peers"] == 1
+    await sender.stop()
+
+
+async def test_event_bus_dispatch_local_and_remote() -> None:
+    # Given
+    received: list[dict[str, Any]] = []
+    EventBus.subscribe("test.event", received.append)
+    remote = b'{"type": "test.event", "origin": "other", "data": {"n": 2}}'
+    own = EventBus._origin.encode()
+    echo = b'{"type": "test.event", "origin": "' + own + b'", "data": {"n": 3}}'
+
+    # When
+    await EventBus.publish("test.event", {"n": 1})
+    EventBus._on_message(remote)
+    EventBus._on_message(echo)
+
+    # Then
+    assert received == [{"n": 1}, {"n": 2}]
@@ -0,0 +1,130 @@
+import asyncio
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from bson import ObjectId
+import pytest
+from prometheus_client import REGISTRY
+
+from app.db.identity_map import IdentityMap
+from app.domain.board.collection import BoardCollection
+
+
+def _mock_board_collection(board_id: str) -> MagicMock:
+    collection = MagicMock()
+    collection.find_one = AsyncMock(
+        return_value={
+            "_id": ObjectId(board_id),
+            "board_name": "칠판",
+            "password": "hashed",
+            "bg_num": 1,
+            "graduated_at": datetime(2000, 1, 1),
+        }
+    )
+    collection.update_one = AsyncMock()
+    return collection
+
+
+@pytest.mark.asyncio
+async def test_identity_map_reuse_in_request() -> None:
+    # Given
+    token = IdentityMap.start()
+    load = AsyncMock(return_value="document")
+
+    # When
+    first = await IdentityMap.get_or_load("board", "1", load)
+    second = await IdentityMap.get_or_load("board", "1", load)
+    IdentityMap.reset(token)
+
+    # Then
+    assert first == second == "document"
+    assert load.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_identity_map_not_cache_outside_request() -> None:
+    # Given
+    load = AsyncMock(return_value="document")
+
+    # When
+    await IdentityMap.get_or_load("board", "1", load)
+    await IdentityMap.get_or_load("board", "1", load)
+
+    # Then
+    assert load.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_identity_map_isolate_concurrent_request() -> None:
+    # Given
+    async def request(value: str) -> list[str]:
+        token = IdentityMap.start()
+        try:
+            first = await IdentityMap.get_or_load(
+                "board", "1", AsyncMock(return_value=value)
+            )
+            await asyncio.sleep(0.01)
+            second = await IdentityMap.get_or_load(
+                "board", "1", AsyncMock(return_value="other")
+            )
+            return [first, second]
+        finally:
+            IdentityMap.reset(token)
+
+    # When
+    results = await asyncio.gather(request("a"), request("b"))
+
+    # Then
+    assert list(results) == [["a", "a"], ["b", "b"]]
+
+
+@pytest.mark.asyncio
+async def test_identity_map_discard_after_write() -> None:
+    # Given
+    board_id = str(ObjectId())
+    collection = _mock_board_collection(board_id)
+    token = IdentityMap.start()
+
+    # When
+    with patch.object(BoardCollection, "_collection", return_value=collection):
+        await BoardCollection.find_board_by_id(board_id=board_id)
+        await BoardCollection.find_board_by_id(board_id=board_id)
+        await BoardCollection.update_board_password(
+            board_id=board_id, password="new_hashed"
+        )
+        await BoardCollection.find_board_by_id(board_id=board_id)
+    IdentityMap.reset(token)
+
+    # Then
+    assert collection.find_one.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_identity_map_export_metrics() -> None:
+    # Given
+    labels = {"cache": "identity_map"}
+    hits = (
+        REGISTRY.get_sample_value("cache_lookups_total", labels | {"result": "hit"})
+        or 0.0
+    )
+    misses = (
+        REGISTRY.get_sample_value("cache_lookups_total", labels | {"result": "miss"})
+        or 0.0
+    )
+    token = IdentityMap.start()
+    load = AsyncMock(return_value="document")
+
+    # When
+    await IdentityMap.get_or_load("board", "1", load)
+    await IdentityMap.get_or_load("board", "1", load)
+    IdentityMap.reset(token)
+
+    # Then
+    assert (
+        REGISTRY.get_sample_value("cache_lookups_total", labels | {"result": "hit"})
+        == hits + 1
+    )
+    assert (
+        REGISTRY.get_sample_value("cache_lookups_total", labels | {"result": "miss"})
+        == misses + 1
+    )
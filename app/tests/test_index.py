@@ -0,0 +1,66 @@
+from typing import Iterator
+from unittest.mock import AsyncMock, MagicMock, call, patch
+
+import pytest
+from pymongo import ASCENDING, IndexModel
+from pymongo.errors import OperationFailure
+
+from app.db.database import Database
+from app.db.index import IndexRegistry
+
+INDEX = IndexModel([("name", ASCENDING)], name="name_v2", unique=True)
+
+
+@pytest.fixture
+def collection() -> Iterator[MagicMock]:
+    collection = MagicMock()
+    collection.create_indexes = AsyncMock()
+    collection.drop_index = AsyncMock()
+    with patch.object(IndexRegistry, "_indexes", {}), patch.object(
+        IndexRegistry, "_obsolete", {}
+    ), patch.object(Database, "collection", return_value=collection):
+        IndexRegistry.register("test", [INDEX], obsolete=["name"])
+        yield collection
+
+
+async def test_ensure_indexes_drop_obsolete_after_create(
+    collection: MagicMock,
+) -> None:
+    # Given
+    manager = MagicMock()
+    manager.attach_mock(collection.create_indexes, "create_indexes")
+    manager.attach_mock(collection.drop_index, "drop_index")
+
+    # When
+    await IndexRegistry.ensure_indexes()
+
+    # Then
+    assert manager.mock_calls == [
+        call.create_indexes([INDEX]),
+        call.drop_index("name"),
+    ]
+
+
+async def test_ensure_indexes_ignore_already_dropped(collection: MagicMock) -> None:
+    # Given
+    collection.drop_index.side_effect = OperationFailure("index not found", code=27)
+
+    # When
+    await IndexRegistry.ensure_indexes()
+
+    # Then
+    collection.drop_index.assert_awaited_once_with("name")
+
+
+async def test_ensure_indexes_raise_on_conflict(collection: MagicMock) -> None:
+    # Given
+    collection.create_indexes.side_effect = OperationFailure(
+        "index options conflict", code=85
+    )
+
+    # When
+    with pytest.raises(OperationFailure):
+        await IndexRegistry.ensure_indexes()
+
+    # Then
+    collection.drop_index.assert_not_awaited()
@@ -0,0 +1,90 @@
+from typing import Iterator
+from unittest.mock import patch
+
+import pytest
+from prometheus_client import REGISTRY
+
+from app.core.exception import InvalidTokenException
+from app.utils.security import JWT
+
+BOARD_ID = "board"
+
+
+@pytest.fixture(autouse=True)
+def payload_cache() -> Iterator[None]:
+    JWT._payload_cache.clear()
+    yield
+    JWT._payload_cache.clear()
+
+
+@pytest.mark.asyncio
+async def test_jwt_cache_check_token_type_on_hit() -> None:
+    # Given
+    access_token = await JWT.create_access_token(board_id=BOARD_ID)
+    JWT.decode_access_token(access_token)
+
+    # When
+    with pytest.raises(InvalidTokenException):
+        JWT.decode_refresh_token(access_token)
+
+    # Then
+    assert JWT._payload_cache.get(access_token) is not None
+
+
+@pytest.mark.asyncio
+async def test_jwt_cache_expire_at_exp() -> None:
+    # Given
+    token = JWT._create_token(
+        board_id=BOARD_ID, token_type=JWT.ACCESS, expire_minutes=1
+    )
+    with patch("app.utils.cache.time.monotonic", return_value=100.0):
+        JWT.decode_access_token(token)
+
+    # When
+    with patch("app.utils.cache.time.monotonic", return_value=100.0 + 59):
+        before_exp = JWT._payload_cache.get(token)
+    with patch("app.utils.cache.time.monotonic", return_value=100.0 + 61):
+        after_exp = JWT._payload_cache.get(token)
+
+    # Then
+    assert before_exp is not None
+    assert after_exp is None
+
+
+@pytest.mark.asyncio
+async def test_jwt_cache_reject_tampered_token() -> None:
+    # Given
+    access_token = await JWT.create_access_token(board_id=BOARD_ID)
+    JWT.decode_access_token(access_token)
+    header, payload, signature = access_token.split(".")
+    tampered_signature = ("A" if signature[0] != "A" else "B") + signature[1:]
+    tampered_token = ".".join([header, payload, tampered_signature])
+
+    # When
+    with pytest.raises(InvalidTokenException):
+        JWT.decode_access_token(tampered_token)
+
+    # Then
+    assert JWT._payload_cache.get(tampered_token) is None
+
+
+@pytest.mark.asyncio
+async def test_jwt_cache_export_metrics() -> None:
+    # Given
+    labels = {"cache": "jwt_payload"}
+    hits = (
+        REGISTRY.get_sample_value("cache_lookups_total", labels | {"result": "hit"})
+        or 0.0
+    )
+    token = await JWT.create_access_token(board_id=BOARD_ID)
+
+    # When
+    JWT.decode_access_token(token)
+    JWT.decode_access_token(token)
+
+    # Then
+    assert (
+        REGISTRY.get_sample_value("cache_lookups_total", labels | {"result": "hit"})
+        == hits + 1
+    )
+    assert REGISTRY.get_sample_value("cache_entries", labels) == 1
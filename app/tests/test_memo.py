@@ -0,0 +1,281 @@
+from bson import ObjectId
+from httpx import AsyncClient, ASGITransport
+from fastapi import status
+import pytest
+
+from app.domain.memo.collection import MemoCollection
+from app.domain.memo.document import MemoDocument, MemoStatus
+from app.main import app
+from app.tests.mock.mock_board import mock_create_board
+from app.tests.mock.mock_memo import mock_create_memo
+
+pytestmark = pytest.mark.usefixtures("ensure_indexes")
+
+
+async def test_get_memo_list_success() -> None:
+    # Given
+    board_response, _ = await mock_create_board(graduated_at="2000-01-01")
+    board_id = board_response.json()["data"]["board_id"]
+    access_token = board_response.json()["data"]["access_token"]
+    await mock_create_memo(board_id=board_id, locate_idx=0, content="첫번째")
+    await mock_create_memo(board_id=board_id, locate_idx=1, content="두번째")
+
+    # When
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        response = await client.get(
+            f"/board/{board_id}/memo/", headers={"token": access_token}
+        )
+
+    # Then
+    assert response.status_code == status.HTTP_200_OK
+    memo_list = response.json()["data"]["memo_list"]
+    assert sorted(memo["content"] for memo in memo_list) == ["두번째", "첫번째"]
+
+
+async def test_get_memo_list_not_graduated() -> None:
+    # Given
+    board_response, _ = await mock_create_board()
+    board_id = board_response.json()["data"]["board_id"]
+    access_token = board_response.json()["data"]["access_token"]
+
+    # When
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        response = await client.get(
+            f"/board/{board_id}/memo/", headers={"token": access_token}
+        )
+
+    # Then
+    assert response.status_code == status.HTTP_403_FORBIDDEN
+
+
+async def test_get_memo_list_not_owner() -> None:
+    # Given
+    board_response, _ = await mock_create_board(graduated_at="2000-01-01")
+    other_response, _ = await mock_create_board(graduated_at="2000-01-01")
+    board_id = board_response.json()["data"]["board_id"]
+    other_access_token = other_response.json()["data"]["access_token"]
+
+    # When
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        response = await client.get(
+            f"/board/{board_id}/memo/", headers={"token": other_access_token}
+        )
+
+    # Then
+    assert response.status_code == status.HTTP_403_FORBIDDEN
+
+
+async def test_post_memo_validate_batch() -> None:
+    # Given
+    memo_list = [
+        {"author": "민서", "content": "졸업 축하해"},
+        {"author": " 민서", "content": "졸업 축하해"},
+        {"author": "민서", "content": "씨발 드디어 졸업"},
+        {"author": "민서", "content": ""},
+    ]
+
+    # When
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        response = await client.post(
+            "/memo/validate/batch", json={"memo_list": memo_list}
+        )
+
+    # Then
+    assert response.status_code == status.HTTP_200_OK
+    result_list = response.json()["data"]["result_list"]
+    assert [result["index"] for result in result_list] == [0, 1, 2, 3]
+    assert [result["is_pass"] for result in result_list] == [
+        True,
+        False,
+        False,
+        False,
+    ]
+
+
+async def test_get_memo_sync_since_cursor() -> None:
+    # Given
+    board_response, _ = await mock_create_board()
+    board_id = board_response.json()["data"]["board_id"]
+    await mock_create_memo(board_id=board_id, locate_idx=0, content="첫번째")
+
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        first_response = await client.get(f"/board/{board_id}/memos")
+        next_cursor = first_response.json()["data"]["next_cursor"]
+        await mock_create_memo(board_id=board_id, locate_idx=1, content="두번째")
+
+        # When
+        response = await client.get(
+            f"/board/{board_id}/memos", params={"since": next_cursor}
+        )
+
+    # Then
+    assert response.status_code == status.HTTP_200_OK
+    memo_list = response.json()["data"]["memo_list"]
+    assert memo_list[-1]["locate_idx"] == 1
+    assert response.json()["data"]["next_cursor"].endswith(memo_list[-1]["memo_id"])
+    assert response.json()["data"]["has_more"] is False
+
+
+async def test_get_memo_sync_invalid_cursor() -> None:
+    # Given
+    board_response, _ = await mock_create_board()
+    board_id = board_response.json()["data"]["board_id"]
+
+    # When
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        response = await client.get(
+            f"/board/{board_id}/memos", params={"since": "invalid"}
+        )
+
+    # Then
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+async def _insert_pending_memo(board_id: str, locate_idx: int) -> str:
+    return await MemoCollection.insert_memo(
+        document=MemoDocument(
+            board_id=board_id,
+            locate_idx=locate_idx,
+            bg_num=0,
+            author="민서",
+            content="졸업 축하해",
+            status=MemoStatus.PENDING,
+        )
+    )
+
+
+async def test_moderation_publish_and_hide_once() -> None:
+    # Given
+    board_response, _ = await mock_create_board()
+    board_id = board_response.json()["data"]["board_id"]
+    clean_id = await _insert_pending_memo(board_id=board_id, locate_idx=0)
+    bad_id = await _insert_pending_memo(board_id=board_id, locate_idx=1)
+
+    # When
+    token = ObjectId()
+    published = await MemoCollection.publish_memo_list(
+        memo_id_list=[clean_id], token=token
+    )
+    hidden = await MemoCollection.hide_memo_list(memo_id_list=[bad_id], token=token)
+    # 같은 묶음의 재시도는 이미 공개한 메모를 다시 반환하고, 다른 묶음은 반환하지 않음
+    published_retry = await MemoCollection.publish_memo_list(
+        memo_id_list=[clean_id], token=token
+    )
+    published_other = await MemoCollection.publish_memo_list(
+        memo_id_list=[clean_id, bad_id], token=ObjectId()
+    )
+
+    # Then
+    assert published == [clean_id]
+    assert hidden == [bad_id]
+    assert published_retry == [clean_id]
+    assert published_other == []
+
+
+async def test_moderation_show_only_published_memo() -> None:
+    # Given
+    board_response, _ = await mock_create_board()
+    board_id = board_response.json()["data"]["board_id"]
+    published_id = await _insert_pending_memo(board_id=board_id, locate_idx=0)
+    hidden_id = await _insert_pending_memo(board_id=board_id, locate_idx=1)
+    await _insert_pending_memo(board_id=board_id, locate_idx=2)
+    await MemoCollection.publish_memo_list(
+        memo_id_list=[published_id], token=ObjectId()
+    )
+    await MemoCollection.hide_memo_list(memo_id_list=[hidden_id], token=ObjectId())
+
+    # When
+    memo_list = await MemoCollection.find_memo_summary_list_by_board_id(
+        board_id=board_id
+    )
+    # 숨겨진 메모의 위치는 다시 사용할 수 있음
+    response = await mock_create_memo(board_id=board_id, locate_idx=1)
+
+    # Then
+    assert [str(memo._id) for memo in memo_list] == [published_id]
+    assert response.status_code == status.HTTP_200_OK
+
+
+async def test_moderation_claim_pending_memo_once() -> None:
+    # Given
+    board_response, _ = await mock_create_board()
+    board_id = board_response.json()["data"]["board_id"]
+    memo_id = await _insert_pending_memo(board_id=board_id, locate_idx=0)
+
+    # When
+    first = await MemoCollection.claim_pending_memo_list(limit=1000, lease_seconds=60)
+    second = await MemoCollection.claim_pending_memo_list(limit=1000, lease_seconds=60)
+
+    # Then
+    assert memo_id in [str(memo._id) for memo in first]
+    assert memo_id not in [str(memo._id) for memo in second]
+
+
+async def test_get_memo_sync_include_memo_published_later() -> None:
+    # Given
+    board_response, _ = await mock_create_board()
+    board_id = board_response.json()["data"]["board_id"]
+    pending_id = await _insert_pending_memo(board_id=board_id, locate_idx=0)
+    await mock_create_memo(board_id=board_id, locate_idx=1)
+
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        first_response = await client.get(f"/board/{board_id}/memos")
+        next_cursor = first_response.json()["data"]["next_cursor"]
+        # 커서보다 먼저 저장되었지만 나중에 검사를 통과한 메모
+        await MemoCollection.publish_memo_list(
+            memo_id_list=[pending_id], token=ObjectId()
+        )
+
+        # When
+        response = await client.get(
+            f"/board/{board_id}/memos", params={"since": next_cursor}
+        )
+
+    # Then
+    assert response.status_code == status.HTTP_200_OK
+    assert pending_id in [
+        memo["memo_id"] for memo in response.json()["data"]["memo_list"]
+    ]
+
+
+async def test_get_memo_sync_include_backfilled_memo() -> None:
+    # Given
+    board_response, _ = await mock_create_board()
+    board_id = board_response.json()["data"]["board_id"]
+    # published_at과 status가 없는 기존 메모
+    result = await MemoCollection._collection().insert_one(
+        {
+            "board_id": board_id,
+            "locate_idx": 0,
+            "bg_num": 0,
+            "author": "민서",
+            "content": "졸업 축하해",
+        }
+    )
+    await MemoCollection.backfill_published_at()
+
+    # When
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        response = await client.get(f"/board/{board_id}/memos")
+
+    # Then
+    assert response.status_code == status.HTTP_200_OK
+    assert [memo["memo_id"] for memo in response.json()["data"]["memo_list"]] == [
+        str(result.inserted_id)
+    ]
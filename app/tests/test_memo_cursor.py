@@ -0,0 +1,39 @@
+from datetime import datetime, timezone
+
+from bson import ObjectId
+import pytest
+
+from app.core.exception import InvalidCursorException
+from app.domain.memo.service import MemoService
+
+
+def test_memo_cursor_round_trip() -> None:
+    # Given
+    key = (datetime(2026, 10, 18, 9, 0, 0, 123000, tzinfo=timezone.utc), ObjectId())
+
+    # When
+    cursor = MemoService._encode_cursor(key)
+
+    # Then
+    assert MemoService._validate_cursor(cursor) == key
+
+
+def test_memo_cursor_accept_legacy_object_id() -> None:
+    # Given
+    memo_id = ObjectId()
+
+    # When
+    published_at, _id = MemoService._validate_cursor(str(memo_id))
+
+    # Then
+    assert published_at == memo_id.generation_time
+    assert _id == memo_id
+
+
+@pytest.mark.parametrize(
+    "cursor", ["invalid", f"-1_{ObjectId()}", f"{'9' * 30}_{ObjectId()}", "1_memo"]
+)
+def test_memo_cursor_reject_invalid(cursor: str) -> None:
+    # When, Then
+    with pytest.raises(InvalidCursorException):
+        MemoService._validate_cursor(cursor)
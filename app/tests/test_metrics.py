@@ -0,0 +1,43 @@
+from httpx import AsyncClient, ASGITransport
+from fastapi import status
+import pytest
+
+from app.main import app
+from app.utils.profanity import Profanity
+
+
+@pytest.mark.asyncio
+async def test_metrics_route_template() -> None:
+    # Given
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        await client.get("/")
+        await client.get("/not-found-path")
+
+        # When
+        response = await client.get("/metrics")
+
+    # Then
+    assert response.status_code == status.HTTP_200_OK
+    assert 'http_requests_total{method="GET",route="/",status="200"}' in response.text
+    assert (
+        'http_requests_total{method="GET",route="unmatched",status="404"}'
+        in response.text
+    )
+    assert "http_requests_in_progress" in response.text
+
+
+@pytest.mark.asyncio
+async def test_metrics_korcen_duration() -> None:
+    # Given
+    Profanity.check("메트릭 테스트용 문장입니다")
+
+    # When
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        response = await client.get("/metrics")
+
+    # Then
+    assert "korcen_duration_seconds_count" in response.text
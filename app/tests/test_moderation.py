@@ -0,0 +1,190 @@
+from typing import AsyncIterator
+from unittest.mock import AsyncMock, patch
+
+from bson import ObjectId
+import pytest
+import pytest_asyncio
+
+from app.base.settings import settings
+from app.core.event import EventType
+from app.domain.board.collection import BoardCollection
+from app.domain.board.service import BoardService
+from app.domain.memo.collection import MemoCollection
+from app.domain.memo.document import MemoDocument, MemoStatus
+from app.domain.memo.moderation import MemoModerator, ModerationItem
+from app.domain.memo.request import MemoInsertRequest
+from app.domain.memo.service import MemoService
+from app.utils.event_bus import EventBus
+
+BOARD_ID = str(ObjectId())
+
+
+def _item(content: str = "졸업 축하해") -> ModerationItem:
+    return ModerationItem(
+        memo_id=str(ObjectId()),
+        board_id=BOARD_ID,
+        locate_idx=0,
+        bg_num=0,
+        author="민서",
+        content=content,
+    )
+
+
+@pytest_asyncio.fixture(autouse=True)
+async def moderator() -> AsyncIterator[None]:
+    # 비속어 검사는 이벤트 루프에서 바로 실행하고, 워커 Task는 테스트마다 새로 만듦
+    with patch.object(settings, "CPU_POOL_WORKERS", 0), patch.object(
+        settings, "MEMO_MODERATION_RETRY_BACKOFF_SECONDS", 0
+    ), patch.object(BoardCollection, "increment_board_version", AsyncMock()):
+        yield
+        await MemoModerator.stop()
+
+
+async def test_moderate_publish_event_only_for_changed_memo() -> None:
+    # Given
+    changed, already_published = _item(), _item()
+    publish = AsyncMock(return_value=[changed.memo_id])
+
+    # When
+    with patch.object(MemoCollection, "publish_memo_list", publish), patch.object(
+        EventBus, "publish", AsyncMock()
+    ) as event_publish:
+        await MemoModerator.moderate([changed, already_published])
+
+    # Then
+    memo_events = [
+        call.args[1]["memo_id"]
+        for call in event_publish.await_args_list
+        if call.args[0] == EventType.MEMO_PUBLISHED
+    ]
+    assert memo_events == [changed.memo_id]
+
+
+async def test_moderate_no_memo_event_when_other_worker_published() -> None:
+    # Given
+    item = _item()
+
+    # When
+    with patch.object(
+        MemoCollection, "publish_memo_list", AsyncMock(return_value=[])
+    ), patch.object(
+        BoardCollection, "increment_board_version", AsyncMock()
+    ) as increment_board_version, patch.object(
+        EventBus, "publish", AsyncMock()
+    ) as event_publish:
+        await MemoModerator.moderate([item])
+
+    # Then
+    event_types = [call.args[0] for call in event_publish.await_args_list]
+    assert event_types == [EventType.BOARD_CHANGED]
+    increment_board_version.assert_awaited_once_with(board_id=BOARD_ID)
+
+
+async def test_moderate_retry_bump_version_after_publish() -> None:
+    # Given
+    item = _item()
+    # 첫 시도에서 공개된 뒤 버전 올리기에 실패해도 재시도는 같은 token으로 같은 메모를 받음
+    publish = AsyncMock(return_value=[item.memo_id])
+    increment_board_version = AsyncMock(side_effect=[RuntimeError(), None])
+
+    # When
+    with patch.object(MemoCollection, "publish_memo_list", publish), patch.object(
+        BoardCollection, "increment_board_version", increment_board_version
+    ), patch.object(EventBus, "publish", AsyncMock()) as event_publish:
+        await MemoModerator._moderate_with_retry([item])
+
+    # Then
+    assert increment_board_version.await_count == 2
+    first_token, retry_token = (
+        call.kwargs["token"] for call in publish.await_args_list
+    )
+    assert first_token == retry_token
+    memo_events = [
+        call.args[1]["memo_id"]
+        for call in event_publish.await_args_list
+        if call.args[0] == EventType.MEMO_PUBLISHED
+    ]
+    assert memo_events == [item.memo_id]
+
+
+async def test_moderate_retry_failed_batch() -> None:
+    # Given
+    moderate = AsyncMock(side_effect=[RuntimeError(), None])
+
+    # When
+    with patch.object(settings, "MEMO_MODERATION_WORKERS", 1), patch.object(
+        MemoModerator, "moderate", moderate
+    ):
+        MemoModerator.submit(_item())
+        await MemoModerator._ensure_started().join()
+
+    # Then
+    assert moderate.await_count == 2
+
+
+async def test_sweep_submit_claimed_memo() -> None:
+    # Given
+    memo = MemoDocument(
+        board_id=BOARD_ID,
+        locate_idx=0,
+        bg_num=0,
+        author="민서",
+        content="졸업 축하해",
+        status=MemoStatus.PENDING,
+    )
+    claim = AsyncMock(return_value=[memo])
+
+    # When
+    with patch.object(settings, "MEMO_MODERATION_WORKERS", 0), patch.object(
+        MemoCollection, "claim_pending_memo_list", claim
+    ):
+        submitted = await MemoModerator.sweep()
+
+    # Then
+    assert submitted == 1
+    claim.assert_awaited_once_with(
+        limit=settings.MEMO_MODERATION_QUEUE_SIZE,
+        lease_seconds=settings.MEMO_MODERATION_LEASE_SECONDS,
+    )
+    assert MemoModerator._ensure_started().get_nowait().memo_id == str(memo._id)
+
+
+async def test_insert_memo_leave_pending_when_queue_full() -> None:
+    # Given
+    request = MemoInsertRequest(locate_idx=0, bg_num=0, author="민서", content="축하해")
+    moderate = AsyncMock()
+
+    # When
+    with patch.object(settings, "MEMO_MODERATION_ASYNC", True), patch.object(
+        BoardService, "_validate_board_id", AsyncMock()
+    ), patch.object(
+        MemoCollection, "insert_memo", AsyncMock(return_value="memo_id")
+    ) as insert_memo, patch.object(
+        MemoModerator, "submit", return_value=False
+    ), patch.object(
+        MemoModerator, "moderate", moderate
+    ):
+        memo_id = await MemoService.insert_memo(board_id=BOARD_ID, request=request)
+
+    # Then
+    assert memo_id == "memo_id"
+    moderate.assert_not_awaited()
+    document = insert_memo.await_args_list[0].kwargs["document"]
+    assert document.status == MemoStatus.PENDING
+    assert document.moderation_lease_until is not None
+
+
+async def test_sweep_skip_when_queue_full() -> None:
+    # Given
+    claim = AsyncMock(return_value=[])
+
+    # When
+    with patch.object(settings, "MEMO_MODERATION_WORKERS", 0), patch.object(
+        settings, "MEMO_MODERATION_QUEUE_SIZE", 1
+    ), patch.object(MemoCollection, "claim_pending_memo_list", claim):
+        MemoModerator.submit(_item())
+        submitted = await MemoModerator.sweep()
+
+    # Then
+    assert submitted == 0
+    claim.assert_not_awaited()
@@ -0,0 +1,19 @@
+from korcen import korcen
+
+from app.utils.profanity import Profanity
+
+
+def test_profanity_same_result_as_korcen() -> None:
+    # Given
+    texts = [
+        "졸업 축하해",
+        "고양이새끼 너무 귀엽다",
+        "테스트욕할거야 시 발",
+        "개새끼야",
+    ]
+
+    # When
+    results = [Profanity.check(text) for text in texts]
+
+    # Then
+    assert results == [bool(korcen.check(text)) for text in texts]
@@ -0,0 +1,80 @@
+from prometheus_client import REGISTRY
+
+from app.utils.pubsub import PubSub
+
+
+async def test_pubsub_fan_out() -> None:
+    # Given
+    pubsub: PubSub[str, int] = PubSub(queue_size=4)
+    subscription_1 = pubsub.subscribe("board")
+    subscription_2 = pubsub.subscribe("board")
+    other = pubsub.subscribe("other")
+
+    # When
+    delivered = pubsub.publish("board", 1)
+
+    # Then
+    assert delivered == 2
+    assert await subscription_1.get() == 1
+    assert await subscription_2.get() == 1
+    assert other._queue.empty()
+    assert pubsub.stats()["connections"] == 3
+
+
+async def test_pubsub_evict_slow_subscriber() -> None:
+    # Given
+    pubsub: PubSub[str, int] = PubSub(queue_size=1)
+    slow = pubsub.subscribe("board")
+    pubsub.publish("board", 1)
+
+    # When
+    delivered = pubsub.publish("board", 2)
+
+    # Then
+    assert delivered == 0
+    assert slow.evicted
+    assert await slow.get() is None
+    assert pubsub.stats()["connections"] == 0
+    assert pubsub.stats()["evicted"] == 1
+
+
+async def test_pubsub_unsubscribe() -> None:
+    # Given
+    pubsub: PubSub[str, int] = PubSub(queue_size=1)
+    subscription = pubsub.subscribe("board")
+
+    # When
+    pubsub.unsubscribe(subscription)
+
+    # Then
+    assert pubsub.publish("board", 1) == 0
+    assert pubsub.stats()["topics"] == 0
+
+
+async def test_named_pubsub_export_metrics() -> None:
+    # Given
+    pubsub: PubSub[str, int] = PubSub(queue_size=1, name="test_export")
+    fast = pubsub.subscribe("board")
+    pubsub.subscribe("board")
+    pubsub.publish("board", 1)
+    await fast.get()
+
+    # When
+    pubsub.publish("board", 2)
+    pubsub.unsubscribe(fast)
+
+    # Then
+    labels = {"name": "test_export"}
+    assert REGISTRY.get_sample_value("pubsub_connections", labels) == 0
+    assert (
+        REGISTRY.get_sample_value(
+            "pubsub_messages_total", labels | {"result": "delivered"}
+        )
+        == 3
+    )
+    assert (
+        REGISTRY.get_sample_value(
+            "pubsub_messages_total", labels | {"result": "evicted"}
+        )
+        == 1
+    )
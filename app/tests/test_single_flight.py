@@ -0,0 +1,73 @@
+import asyncio
+import pytest
+from prometheus_client import REGISTRY
+
+from app.utils.single_flight import SingleFlight
+
+
+@pytest.mark.asyncio
+async def test_single_flight_coalesce_same_key() -> None:
+    # Given
+    single_flight: SingleFlight[str, int] = SingleFlight()
+    call_count = 0
+
+    async def load() -> int:
+        nonlocal call_count
+        call_count += 1
+        await asyncio.sleep(0.01)
+        return call_count
+
+    # When
+    results = await asyncio.gather(*[single_flight.do("board", load) for _ in range(5)])
+
+    # Then
+    assert results == [1, 1, 1, 1, 1]
+    assert single_flight.stats()["executions"] == 1
+    assert single_flight.stats()["coalesced"] == 4
+
+
+@pytest.mark.asyncio
+async def test_single_flight_share_exception() -> None:
+    # Given
+    single_flight: SingleFlight[str, int] = SingleFlight()
+
+    async def load() -> int:
+        await asyncio.sleep(0.01)
+        raise ValueError()
+
+    # When
+    results = await asyncio.gather(
+        *[single_flight.do("board", load) for _ in range(3)], return_exceptions=True
+    )
+
+    # Then
+    assert all(isinstance(result, ValueError) for result in results)
+    assert single_flight.stats()["in_flight"] == 0
+
+
+@pytest.mark.asyncio
+async def test_named_single_flight_export_metrics() -> None:
+    # Given
+    single_flight: SingleFlight[str, int] = SingleFlight(name="test_export")
+
+    async def load() -> int:
+        await asyncio.sleep(0.01)
+        return 1
+
+    # When
+    await asyncio.gather(*[single_flight.do("board", load) for _ in range(3)])
+
+    # Then
+    labels = {"name": "test_export"}
+    assert (
+        REGISTRY.get_sample_value(
+            "single_flight_calls_total", labels | {"result": "executed"}
+        )
+        == 1
+    )
+    assert (
+        REGISTRY.get_sample_value(
+            "single_flight_calls_total", labels | {"result": "coalesced"}
+        )
+        == 2
+    )
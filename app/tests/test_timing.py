@@ -0,0 +1,58 @@
+from httpx import AsyncClient, ASGITransport
+import pytest
+
+from app.main import app
+from app.utils.timing import ServerTiming
+from app.utils.validator import Cost
+from app.domain.memo.validator import MemoValidator
+
+
+def test_timing_sum_stage() -> None:
+    # Given
+    token = ServerTiming.start()
+
+    # When
+    ServerTiming.add("bcrypt", 0.25)
+    ServerTiming.add("mongo", 0.002)
+    ServerTiming.add("mongo", 0.003)
+    header = ServerTiming.header(total_ms=260.0)
+    ServerTiming.reset(token)
+
+    # Then
+    assert header == "bcrypt;dur=250.0, mongo;dur=5.0, total;dur=260.0"
+
+
+def test_timing_ignore_outside_request() -> None:
+    # Given
+    # 요청 밖(백그라운드 작업 등)에서는 기록하지 않음
+
+    # When
+    ServerTiming.add("bcrypt", 0.25)
+
+    # Then
+    assert ServerTiming.summary() == {}
+
+
+def test_timing_validator_stage() -> None:
+    # Given
+    token = ServerTiming.start()
+
+    # When
+    MemoValidator.content.first_error("안녕하세요", max_cost=Cost.PROFANITY)
+    summary = ServerTiming.summary()
+    ServerTiming.reset(token)
+
+    # Then
+    assert set(summary) == {"validate", "korcen"}
+
+
+@pytest.mark.asyncio
+async def test_timing_header() -> None:
+    # When
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        response = await client.get("/")
+
+    # Then
+    assert response.headers["Server-Timing"].startswith("total;dur=")
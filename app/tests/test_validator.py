@@ -0,0 +1,61 @@
+from unittest.mock import patch
+
+import pytest
+
+from app.core.exception import (
+    TooLongNameException,
+    TooShortNameException,
+    CanNotUseBadWordInNameException,
+)
+from app.domain.board.validator import BoardValidator
+from app.domain.memo.validator import MemoValidator
+from app.utils.validator import Cost
+
+
+def test_validator_run_cheap_rules_first() -> None:
+    # Given
+    board_name = "닉"
+
+    # When
+    with patch("app.utils.validator.Profanity.check") as mock_check:
+        with pytest.raises(TooShortNameException):
+            BoardValidator.board_name.validate(board_name)
+
+    # Then
+    mock_check.assert_not_called()
+
+
+def test_validator_max_length_by_language() -> None:
+    # Given
+    english_name = "a" * 16
+    korean_name = "가" * 9
+
+    # When
+    BoardValidator.board_name.validate(english_name)
+
+    # Then
+    with pytest.raises(TooLongNameException):
+        BoardValidator.board_name.validate(korean_name)
+
+
+def test_validator_skip_profanity_by_max_cost() -> None:
+    # Given
+    author = "씨발"
+
+    # When
+    MemoValidator.author.validate(author, max_cost=Cost.PROFANITY - 1)
+
+    # Then
+    with pytest.raises(CanNotUseBadWordInNameException):
+        MemoValidator.author.validate(author)
+
+
+def test_validator_without_rule() -> None:
+    # Given
+    validator = BoardValidator.board_name.without("max_length")
+
+    # When
+    validator.validate("a" * 36)
+
+    # Then
+    assert all(rule.name != "max_length" for rule in validator.rules)
@@ -0,0 +1,54 @@
+import hashlib
+import math
+
+
+class BloomFilter:
+    """
+    문자열 집합의 포함 여부를 적은 메모리로 판단하는 확률적 자료구조
+
+    - "없음"은 항상 정확하고, "있을 수 있음"은 오탐일 수 있음
+    - 예상 항목 수(capacity)와 목표 오탐률(error_rate)로 비트 수와 해시 수를 결정
+    - 해시는 blake2b 한 번으로 두 값을 만들어 k개의 위치를 계산 (double hashing)
+    """
+
+    def __init__(self, capacity: int, error_rate: float) -> None:
+        capacity = max(capacity, 1)
+        self.bit_count = max(
+            8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        )
+        self.hash_count = max(1, round(self.bit_count / capacity * math.log(2)))
+        self.item_count = 0
+        self._bits = bytearray((self.bit_count + 7) // 8)
+
+    def _positions(self, item: str) -> list[int]:
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return [(h1 + i * h2) % self.bit_count for i in range(self.hash_count)]
+
+    def add(self, item: str) -> None:
+        for position in self._positions(item):
+            self._bits[position >> 3] |= 1 << (position & 7)
+        self.item_count += 1
+
+    def __contains__(self, item: str) -> bool:
+        return all(
+            self._bits[position >> 3] & (1 << (position & 7))
+            for position in self._positions(item)
+        )
+
+    def false_positive_rate(self) -> float:
+        # 현재 항목 수 기준 예상 오탐률, (1 - e^(-kn/m))^k
+        return float(
+            (1 - math.exp(-self.hash_count * self.item_count / self.bit_count))
+            ** self.hash_count
+        )
+
+    def stats(self) -> dict[str, float]:
+        return {
+            "memory_bytes": len(self._bits),
+            "bit_count": self.bit_count,
+            "hash_count": self.hash_count,
+            "item_count": self.item_count,
+            "false_positive_rate": self.false_positive_rate(),
+        }
@@ -0,0 +1,107 @@
+import time
+from collections import OrderedDict
+from typing import Generic, Hashable, TypeVar
+
+from app.utils.metrics import Metrics
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class TTLCache(Generic[K, V]):
+    """
+    만료 시간(TTL)과 최대 크기(LRU)를 가진 프로세스 내 캐시
+
+    - 항목마다 만료 시각을 따로 지정할 수 있음
+    - 최대 크기를 넘으면 가장 오래 사용하지 않은 항목부터 제거
+    - hits/misses/evictions/expirations 통계를 제공
+    - name을 지정하면 같은 통계를 Prometheus 메트릭(cache_*)에도 기록
+    """
+
+    def __init__(self, max_size: int, ttl: float, name: str | None = None) -> None:
+        self.max_size = max_size
+        self.ttl = ttl
+        self._items: OrderedDict[K, tuple[float, V]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self._metrics = _CacheMetrics(name) if name is not None else None
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def get(self, key: K) -> V | None:
+        item = self._items.get(key)
+        if item is None:
+            self.misses += 1
+            if self._metrics is not None:
+                self._metrics.misses.inc()
+            return None
+
+        expires_at, value = item
+        if expires_at <= time.monotonic():
+            del self._items[key]
+            self.expirations += 1
+            self.misses += 1
+            if self._metrics is not None:
+                self._metrics.expirations.inc()
+                self._metrics.misses.inc()
+                self._metrics.entries.set(len(self._items))
+            return None
+
+        self._items.move_to_end(key)
+        self.hits += 1
+        if self._metrics is not None:
+            self._metrics.hits.inc()
+        return value
+
+    def set(self, key: K, value: V, ttl: float | None = None) -> None:
+        ttl = self.ttl if ttl is None else ttl
+        if self.max_size <= 0 or ttl <= 0:
+            return
+
+        expires_at = time.monotonic() + ttl
+        self._items[key] = (expires_at, value)
+        self._items.move_to_end(key)
+
+        while len(self._items) > self.max_size:
+            self._items.popitem(last=False)
+            self.evictions += 1
+            if self._metrics is not None:
+                self._metrics.evictions.inc()
+
+        if self._metrics is not None:
+            self._metrics.entries.set(len(self._items))
+
+    def delete(self, key: K) -> None:
+        self._items.pop(key, None)
+        if self._metrics is not None:
+            self._metrics.entries.set(len(self._items))
+
+    def clear(self) -> None:
+        self._items.clear()
+        if self._metrics is not None:
+            self._metrics.entries.set(0)
+
+    def stats(self) -> dict[str, float]:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._items),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+        }
+
+
+class _CacheMetrics:
+    # 조회마다 라벨을 찾지 않도록 캐시 이름별 메트릭을 미리 만들어 둠
+    def __init__(self, name: str) -> None:
+        self.hits = Metrics.cache_lookups.labels(name, "hit")
+        self.misses = Metrics.cache_lookups.labels(name, "miss")
+        self.evictions = Metrics.cache_removals.labels(name, "evicted")
+        self.expirations = Metrics.cache_removals.labels(name, "expired")
+        self.entries = Metrics.cache_entries.labels(name)
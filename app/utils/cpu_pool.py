@@ -0,0 +1,227 @@
+import asyncio
+import dataclasses
+import multiprocessing
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Callable, TypeVar
+
+from app.base.settings import settings
+from app.core.exception import CPUPoolBusyException, CPUPoolTimeoutException
+from app.utils.metrics import Metrics
+
+T = TypeVar("T")
+
+
+@dataclasses.dataclass(kw_only=True)
+class _OperationStats:
+    submitted: int = 0
+    completed: int = 0
+    failed: int = 0
+    rejected: int = 0
+    timed_out: int = 0
+    total_latency: float = 0.0
+    max_latency: float = 0.0
+
+
+class CPUPool:
+    """
+    bcrypt 같은 CPU 작업을 이벤트 루프 밖의 프로세스 풀에서 실행하는 클래스
+
+    - 대기 중인 작업 수가 CPU_POOL_MAX_PENDING을 넘으면 즉시 503을 반환
+    - 작업마다 타임아웃을 지정할 수 있음 (기본값: CPU_POOL_TIMEOUT_SECONDS)
+    - CPU_POOL_WORKERS가 0이면 풀 없이 현재 스레드에서 실행 (개발/테스트용)
+    - 대기열 길이, 작업별 지연 시간, 거절/타임아웃 수를 /metrics로 내보냄
+    """
+
+    _executor: ProcessPoolExecutor | None = None
+    _lock = threading.Lock()
+    _pending = 0
+    _stats: dict[str, _OperationStats] = {}
+
+    @classmethod
+    def _get_executor(cls) -> ProcessPoolExecutor:
+        with cls._lock:
+            if cls._executor is None:
+                # uvicorn 워커는 이미 스레드를 가지고 있으므로 fork 대신 spawn 사용
+                cls._executor = ProcessPoolExecutor(
+                    max_workers=settings.CPU_POOL_WORKERS,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            return cls._executor
+
+    @classmethod
+    def _operation(cls, name: str) -> _OperationStats:
+        stats = cls._stats.get(name)
+        if stats is None:
+            stats = cls._stats[name] = _OperationStats()
+        return stats
+
+    @classmethod
+    def _on_done(cls, name: str, started_at: float, future: Future[Any]) -> None:
+        latency = time.perf_counter() - started_at
+
+        with cls._lock:
+            cls._pending -= 1
+            Metrics.cpu_pool_pending.set(cls._pending)
+            stats = cls._operation(name)
+            if future.cancelled() or future.exception() is not None:
+                stats.failed += 1
+                outcome = "error"
+            else:
+                stats.completed += 1
+                outcome = "success"
+            stats.total_latency += latency
+            stats.max_latency = max(stats.max_latency, latency)
+        Metrics.cpu_pool_task_duration.labels(name, outcome).observe(latency)
+
+    @classmethod
+    def _run_inline(cls, name: str, fn: Callable[..., T], *args: Any) -> T:
+        with cls._lock:
+            stats = cls._operation(name)
+            stats.submitted += 1
+
+        started_at = time.perf_counter()
+        try:
+            result = fn(*args)
+        except BaseException:
+            with cls._lock:
+                stats.failed += 1
+            Metrics.cpu_pool_task_duration.labels(name, "error").observe(
+                time.perf_counter() - started_at
+            )
+            raise
+        latency = time.perf_counter() - started_at
+        Metrics.cpu_pool_task_duration.labels(name, "success").observe(latency)
+
+        with cls._lock:
+            stats.completed += 1
+            stats.total_latency += latency
+            stats.max_latency = max(stats.max_latency, latency)
+        return result
+
+    @classmethod
+    async def run(
+        cls,
+        name: str,
+        fn: Callable[..., T],
+        *args: Any,
+        timeout: float | None = None,
+    ) -> T:
+        """
+        함수를 프로세스 풀에서 실행하고 결과를 반환하는 함수
+
+        Parameters
+        ---
+        name: str, 통계에 사용할 작업 이름
+        fn: Callable, 실행할 함수 (pickle 가능한 모듈 최상위 함수여야 함)
+        args: Any, 함수 인자
+        timeout: float | None, 작업 타임아웃(초)
+
+        Return
+        ---
+        T, 함수 실행 결과
+
+        Exceptions
+        ---
+        503: 대기 중인 작업이 너무 많을 경우
+        503: 작업 시간이 타임아웃을 넘을 경우
+        """
+        if settings.CPU_POOL_WORKERS <= 0:
+            return cls._run_inline(name, fn, *args)
+
+        with cls._lock:
+            stats = cls._operation(name)
+            if cls._pending >= settings.CPU_POOL_MAX_PENDING:
+                stats.rejected += 1
+                Metrics.cpu_pool_rejected.labels(name).inc()
+                raise CPUPoolBusyException()
+            cls._pending += 1
+            Metrics.cpu_pool_pending.set(cls._pending)
+            stats.submitted += 1
+
+        started_at = time.perf_counter()
+        try:
+            future = cls._get_executor().submit(fn, *args)
+        except BaseException:
+            with cls._lock:
+                cls._pending -= 1
+                Metrics.cpu_pool_pending.set(cls._pending)
+                stats.failed += 1
+            raise
+        future.add_done_callback(lambda done: cls._on_done(name, started_at, done))
+
+        try:
+            return await asyncio.wait_for(
+                asyncio.wrap_future(future),
+                timeout=timeout or settings.CPU_POOL_TIMEOUT_SECONDS,
+            )
+        except asyncio.TimeoutError:
+            with cls._lock:
+                stats.timed_out += 1
+            Metrics.cpu_pool_timed_out.labels(name).inc()
+            raise CPUPoolTimeoutException()
+
+    @classmethod
+    def stats(cls) -> dict[str, Any]:
+        """
+        풀의 대기열 길이와 작업별 지연 시간 통계를 반환하는 함수
+        """
+        with cls._lock:
+            operations = {
+                name: {
+                    "submitted": stats.submitted,
+                    "completed": stats.completed,
+                    "failed": stats.failed,
+                    "rejected": stats.rejected,
+                    "timed_out": stats.timed_out,
+                    "latency_avg_ms": (
+                        stats.total_latency / (stats.completed + stats.failed) * 1000
+                        if stats.completed + stats.failed
+                        else 0.0
+                    ),
+                    "latency_max_ms": stats.max_latency * 1000,
+                }
+                for name, stats in cls._stats.items()
+            }
+            return {
+                "workers": settings.CPU_POOL_WORKERS,
+                "max_pending": settings.CPU_POOL_MAX_PENDING,
+                "pending": cls._pending,
+                "operations": operations,
+            }
+
+    @classmethod
+    async def start(cls) -> None:
+        """
+        프로세스 풀을 만들고 워커 프로세스를 미리 띄우는 함수 (앱 시작 시 호출)
+
+        워커 프로세스는 첫 작업을 받을 때 만들어지고 인터프리터 시작과 앱 모듈 import에
+        1초 가까이 걸리므로, 워커 수만큼 import 작업을 보내 첫 요청이 기다리지 않게 한다.
+        """
+        if settings.CPU_POOL_WORKERS <= 0:
+            return
+
+        executor = cls._get_executor()
+        await asyncio.gather(
+            *(
+                asyncio.wrap_future(executor.submit(_warm_up))
+                for _ in range(settings.CPU_POOL_WORKERS)
+            )
+        )
+
+    @classmethod
+    def shutdown(cls) -> None:
+        """
+        프로세스 풀을 종료하는 함수 (앱 종료 시 호출)
+        """
+        with cls._lock:
+            executor, cls._executor = cls._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+
+def _warm_up() -> None:
+    # 워커 프로세스에서 실행되며, 풀에서 실행하는 함수가 있는 모듈을 미리 import
+    import app.utils.profanity
+    import app.utils.security
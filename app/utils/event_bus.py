@@ -0,0 +1,253 @@
+import abc
+import asyncio
+import json
+import logging
+import os
+import socket
+import tempfile
+import uuid
+from typing import Any, Callable
+
+from app.base.settings import settings
+
+logger = logging.getLogger(__name__)
+
+EventHandler = Callable[[dict[str, Any]], None]
+
+
+class BrokerAdapter(abc.ABC):
+    """
+    워커 프로세스 사이에서 이벤트를 주고받는 브로커의 인터페이스
+
+    외부 브로커(Redis Pub/Sub 등)를 사용하려면 이 클래스를 구현해
+    EventBus.start에 전달한다.
+    """
+
+    @abc.abstractmethod
+    async def start(self, on_message: Callable[[bytes], None]) -> None:
+        """
+        브로커에 연결하고, 다른 워커가 보낸 메시지를 on_message로 전달하는 함수
+        """
+
+    @abc.abstractmethod
+    async def publish(self, payload: bytes) -> None:
+        """
+        다른 모든 워커에 메시지를 보내는 함수
+        """
+
+    @abc.abstractmethod
+    async def stop(self) -> None:
+        """
+        브로커 연결을 종료하는 함수
+        """
+
+    def stats(self) -> dict[str, int]:
+        return {}
+
+
+class LocalBroker(BrokerAdapter):
+    """
+    같은 서버의 워커끼리 Unix 도메인 데이터그램 소켓으로 이벤트를 주고받는 브로커
+
+    - 워커마다 EVENT_BUS_SOCKET_DIR 아래에 자신의 소켓 파일을 만들어 수신
+    - 보낼 때는 디렉터리의 다른 소켓 파일에 모두 전송 (디렉터리가 곧 구독자 목록)
+    - 종료된 워커의 소켓 파일은 전송에 실패하면 삭제
+    """
+
+    _RECV_SIZE = 65536
+
+    def __init__(self, socket_dir: str, name: str | None = None) -> None:
+        self.socket_dir = socket_dir
+        self.path = os.path.join(socket_dir, f"{name or os.getpid()}.sock")
+        self._socket: socket.socket | None = None
+        self._on_message: Callable[[bytes], None] | None = None
+        self.sent = 0
+        self.dropped = 0
+        self.removed_peers = 0
+
+    async def start(self, on_message: Callable[[bytes], None]) -> None:
+        os.makedirs(self.socket_dir, exist_ok=True)
+        # 같은 pid를 쓰던 이전 워커의 소켓 파일이 남아있을 수 있음
+        if os.path.exists(self.path):
+            os.unlink(self.path)
+
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        sock.setblocking(False)
+        sock.bind(self.path)
+        self._socket = sock
+        self._on_message = on_message
+        asyncio.get_running_loop().add_reader(sock.fileno(), self._on_readable)
+
+    def _on_readable(self) -> None:
+        assert self._socket is not None and self._on_message is not None
+        while True:
+            try:
+                payload = self._socket.recv(self._RECV_SIZE)
+            except BlockingIOError:
+                return
+            self._on_message(payload)
+
+    def _peers(self) -> list[str]:
+        with os.scandir(self.socket_dir) as entries:
+            return [
+                entry.path
+                for entry in entries
+                if entry.name.endswith(".sock") and entry.path != self.path
+            ]
+
+    async def publish(self, payload: bytes) -> None:
+        if self._socket is None:
+            return
+
+        for peer in self._peers():
+            try:
+                self._socket.sendto(payload, peer)
+                self.sent += 1
+            except BlockingIOError:
+                # 받는 워커의 수신 버퍼가 가득 찬 경우, 기다리지 않고 버림
+                self.dropped += 1
+            except (ConnectionRefusedError, FileNotFoundError):
+                # 종료된 워커의 소켓 파일
+                self._remove_peer(peer)
+
+    def _remove_peer(self, peer: str) -> None:
+        try:
+            os.unlink(peer)
+            self.removed_peers += 1
+        except FileNotFoundError:
+            pass
+
+    async def stop(self) -> None:
+        sock, self._socket = self._socket, None
+        if sock is None:
+            return
+
+        asyncio.get_running_loop().remove_reader(sock.fileno())
+        sock.close()
+        self._remove_peer(self.path)
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "sent": self.sent,
+            "dropped": self.dropped,
+            "removed_peers": self.removed_peers,
+        }
+
+
+class EventBus:
+    """
+    워커 프로세스 사이에 "칠판 변경", "메모 공개" 같은 이벤트를 전달하는 클래스
+
+    - publish한 이벤트는 현재 워커의 핸들러에 바로 전달되고,
+      브로커를 통해 다른 워커의 핸들러에도 전달됨
+    - 워커마다 갖고 있는 캐시, 구독자 목록 등은 subscribe로 이벤트를 받아 갱신
+    - 브로커가 없으면(시작 전, EVENT_BUS_BACKEND=none) 현재 워커에만 전달
+    """
+
+    # 브로커를 통해 받은 이벤트 중 자신이 보낸 것을 구분하기 위한 워커 ID
+    _origin = uuid.uuid4().hex
+    _handlers: dict[str, list[EventHandler]] = {}
+    _broker: BrokerAdapter | None = None
+    _published = 0
+    _received = 0
+    _failed = 0
+
+    @classmethod
+    async def start(cls, broker: BrokerAdapter | None = None) -> None:
+        """
+        브로커에 연결하는 함수
+
+        Parameter
+        ---
+        broker: BrokerAdapter | None, 사용할 브로커 (없으면 EVENT_BUS_BACKEND 설정을 따름)
+        """
+        if broker is None and settings.EVENT_BUS_BACKEND == "local":
+            broker = LocalBroker(socket_dir=cls._socket_dir())
+        if broker is None:
+            return
+
+        await broker.start(cls._on_message)
+        cls._broker = broker
+
+    @staticmethod
+    def _socket_dir() -> str:
+        if settings.EVENT_BUS_SOCKET_DIR:
+            return settings.EVENT_BUS_SOCKET_DIR
+        # 같은 서버의 다른 배포와 섞이지 않도록 같은 부모 프로세스의 워커끼리만 연결
+        return os.path.join(
+            tempfile.gettempdir(), f"memory-page-event-bus-{os.getppid()}"
+        )
+
+    @classmethod
+    async def stop(cls) -> None:
+        broker, cls._broker = cls._broker, None
+        if broker is not None:
+            await broker.stop()
+
+    @classmethod
+    def subscribe(cls, event_type: str, handler: EventHandler) -> None:
+        """
+        이벤트 핸들러를 등록하는 함수
+
+        Parameters
+        ---
+        event_type: str, 이벤트 종류 (app/core/event.py의 EventType)
+        handler: EventHandler, 이벤트 데이터를 받는 함수
+        """
+        cls._handlers.setdefault(event_type, []).append(handler)
+
+    @classmethod
+    async def publish(cls, event_type: str, data: dict[str, Any]) -> None:
+        """
+        현재 워커와 다른 모든 워커에 이벤트를 전달하는 함수
+
+        Parameters
+        ---
+        event_type: str, 이벤트 종류
+        data: dict[str, Any], JSON으로 변환 가능한 이벤트 데이터
+        """
+        cls._published += 1
+        cls._dispatch(event_type, data)
+
+        if cls._broker is not None:
+            payload = json.dumps(
+                {"type": event_type, "origin": cls._origin, "data": data}
+            ).encode()
+            try:
+                await cls._broker.publish(payload)
+            except Exception:
+                # 다른 워커의 캐시는 TTL로 만료되므로 요청은 실패시키지 않음
+                cls._failed += 1
+                logger.exception("event bus publish failed")
+
+    @classmethod
+    def _on_message(cls, payload: bytes) -> None:
+        try:
+            message = json.loads(payload)
+        except ValueError:
+            cls._failed += 1
+            return
+
+        if message.get("origin") == cls._origin:
+            return
+        cls._received += 1
+        cls._dispatch(message["type"], message["data"])
+
+    @classmethod
+    def _dispatch(cls, event_type: str, data: dict[str, Any]) -> None:
+        for handler in cls._handlers.get(event_type, ()):
+            try:
+                handler(data)
+            except Exception:
+                cls._failed += 1
+                logger.exception("event handler failed: %s", event_type)
+
+    @classmethod
+    def stats(cls) -> dict[str, int]:
+        broker_stats = cls._broker.stats() if cls._broker is not None else {}
+        return {
+            **broker_stats,
+            "published": cls._published,
+            "received": cls._received,
+            "failed": cls._failed,
+        }
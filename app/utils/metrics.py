@@ -0,0 +1,187 @@
+import os
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+
+# 초 단위 구간, bcrypt(수백 ms)와 korcen/mongo(수 ms)를 모두 구분할 수 있도록 설정
+_BUCKETS = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+# 커넥션 풀 checkout 대기 시간 구간, 대부분 1ms 이하이므로 더 작은 구간부터 시작
+_WAIT_BUCKETS = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0)
+
+
+class Metrics:
+    """
+    Prometheus 메트릭을 정의하고 /metrics 응답을 만드는 클래스
+
+    - gunicorn으로 실행하면 gunicorn.conf.py가 bind 주소별 PROMETHEUS_MULTIPROC_DIR을 설정하고,
+      워커(및 CPUPool 프로세스)가 기록한 값을 디렉터리에서 합산해 응답
+    - 환경 변수가 없으면(uvicorn 단독 실행, 테스트) 현재 프로세스의 값만 응답
+    """
+
+    CONTENT_TYPE = CONTENT_TYPE_LATEST
+
+    http_request_duration = Histogram(
+        "http_request_duration_seconds",
+        "라우트별 요청 처리 시간",
+        ["method", "route"],
+        buckets=_BUCKETS,
+    )
+    http_requests = Counter(
+        "http_requests",
+        "라우트, 상태 코드별 요청 수",
+        ["method", "route", "status"],
+    )
+    http_requests_in_progress = Gauge(
+        "http_requests_in_progress",
+        "처리 중인 요청 수",
+        ["method"],
+        multiprocess_mode="livesum",
+    )
+    cpu_pool_pending = Gauge(
+        "cpu_pool_pending",
+        "CPUPool에서 실행 중이거나 대기 중인 작업 수",
+        multiprocess_mode="livesum",
+    )
+    cpu_pool_task_duration = Histogram(
+        "cpu_pool_task_duration_seconds",
+        "CPUPool 작업별 제출부터 완료까지 걸린 시간 (대기 시간 포함)",
+        ["op", "outcome"],
+        buckets=_BUCKETS,
+    )
+    cpu_pool_rejected = Counter(
+        "cpu_pool_rejected",
+        "대기 중인 작업이 CPU_POOL_MAX_PENDING 이상이라 거절된 CPUPool 작업 수",
+        ["op"],
+    )
+    cpu_pool_timed_out = Counter(
+        "cpu_pool_timed_out",
+        "타임아웃을 넘겨 503으로 응답한 CPUPool 작업 수",
+        ["op"],
+    )
+    mongo_command_duration = Histogram(
+        "mongo_command_duration_seconds",
+        "컬렉션, 명령별 MongoDB 명령 실행 시간",
+        ["collection", "command", "outcome"],
+        buckets=_BUCKETS,
+    )
+    mongo_slow_commands = Counter(
+        "mongo_slow_commands",
+        "MONGO_SLOW_QUERY_MS 이상 걸린 MongoDB 명령 수 (MONGO_COMMAND_MONITORING 사용 시)",
+        ["collection", "command"],
+    )
+    mongo_pool_connections = Gauge(
+        "mongo_pool_connections",
+        "MongoDB 커넥션 풀의 커넥션 수 (open: 열려 있음, in_use: 사용 중, max: 최대 크기)",
+        ["state"],
+        multiprocess_mode="livesum",
+    )
+    mongo_pool_checkout_wait = Histogram(
+        "mongo_pool_checkout_wait_seconds",
+        "MongoDB 커넥션 풀 checkout 대기 시간",
+        ["outcome"],
+        buckets=_WAIT_BUCKETS,
+    )
+    mongo_pool_clears = Counter(
+        "mongo_pool_clears",
+        "MongoDB 커넥션 풀이 비워진 횟수 (서버 연결 오류 등)",
+    )
+    cache_lookups = Counter(
+        "cache_lookups",
+        "프로세스 내 캐시 조회 수 (result: hit, miss)",
+        ["cache", "result"],
+    )
+    cache_removals = Counter(
+        "cache_removals",
+        "프로세스 내 캐시에서 제거된 항목 수 (reason: evicted, expired)",
+        ["cache", "reason"],
+    )
+    cache_entries = Gauge(
+        "cache_entries",
+        "프로세스 내 캐시 항목 수",
+        ["cache"],
+        multiprocess_mode="livesum",
+    )
+    single_flight_calls = Counter(
+        "single_flight_calls",
+        "SingleFlight 호출 수 (result: executed 직접 조회, coalesced 다른 조회에 합류)",
+        ["name", "result"],
+    )
+    login_cache_saved_seconds = Counter(
+        "login_cache_saved_seconds",
+        "로그인 캐시 적중으로 생략한 bcrypt 검증 시간 추정치 (평균 검증 시간 기준)",
+    )
+    board_name_filter_checks = Counter(
+        "board_name_filter_checks",
+        "칠판 이름 중복 확인 수 (result: skipped 필터로 DB 조회 생략, queried DB 조회)",
+        ["result"],
+    )
+    board_name_filter_false_positives = Counter(
+        "board_name_filter_false_positives",
+        "칠판 이름 필터가 있을 수 있음으로 답했지만 DB에 없었던 횟수",
+    )
+    board_name_filter_memory = Gauge(
+        "board_name_filter_memory_bytes",
+        "칠판 이름 필터의 비트 배열 크기",
+        multiprocess_mode="livesum",
+    )
+    board_name_filter_false_positive_rate = Gauge(
+        "board_name_filter_false_positive_rate",
+        "칠판 이름 필터의 현재 항목 수 기준 예상 오탐률",
+        multiprocess_mode="livemax",
+    )
+    pubsub_connections = Gauge(
+        "pubsub_connections",
+        "PubSub 구독 연결 수 (SSE 연결 등)",
+        ["name"],
+        multiprocess_mode="livesum",
+    )
+    pubsub_messages = Counter(
+        "pubsub_messages",
+        "PubSub 메시지 전달 수 (result: delivered 전달, evicted 느린 구독자 제거)",
+        ["name", "result"],
+    )
+    bcrypt_duration = Histogram(
+        "bcrypt_duration_seconds",
+        "bcrypt 해시 생성, 검증 실행 시간",
+        ["operation"],
+        buckets=_BUCKETS,
+    )
+    korcen_duration = Histogram(
+        "korcen_duration_seconds",
+        "korcen 비속어 검사 실행 시간 (캐시 적중 제외)",
+        buckets=_BUCKETS,
+    )
+
+    @classmethod
+    def render(cls) -> bytes:
+        """
+        Prometheus 텍스트 형식의 메트릭을 반환하는 함수
+        """
+        if "PROMETHEUS_MULTIPROC_DIR" not in os.environ:
+            return bytes(generate_latest())
+
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)  # type: ignore[no-untyped-call]
+        return bytes(generate_latest(registry))
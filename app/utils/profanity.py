@@ -0,0 +1,140 @@
+import ast
+import functools
+import inspect
+import re
+import types
+from typing import Any, Callable
+
+from korcen import korcen
+
+from app.base.settings import settings
+from app.utils.metrics import Metrics
+
+
+class _CompiledRe:
+    """
+    korcen 내부의 re 모듈 대신 사용하는 객체
+
+    korcen은 검사 한 번에 600개가 넘는 서로 다른 패턴으로 re.sub를 호출하는데,
+    re 모듈의 컴파일 캐시(512개)보다 많아 매 호출마다 패턴을 다시 컴파일한다.
+    미리 컴파일한 패턴 테이블을 사용해 결과는 그대로 두고 재컴파일만 없앤다.
+    """
+
+    def __init__(self, patterns: dict[tuple[str, int], re.Pattern[str]]) -> None:
+        self._patterns = patterns
+
+    def _compile(self, pattern: str, flags: int) -> re.Pattern[str]:
+        compiled = self._patterns.get((pattern, flags))
+        if compiled is None:
+            compiled = self._patterns[(pattern, flags)] = re.compile(pattern, flags)
+        return compiled
+
+    def sub(
+        self, pattern: str, repl: str, string: str, count: int = 0, flags: int = 0
+    ) -> str:
+        return self._compile(pattern, flags).sub(repl, string, count)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(re, name)
+
+
+def _collect_patterns() -> dict[tuple[str, int], re.Pattern[str]]:
+    # korcen 소스에서 re.sub의 첫 번째 인자(문자열 상수)를 모두 수집
+    patterns: dict[tuple[str, int], re.Pattern[str]] = {}
+    for node in ast.walk(ast.parse(inspect.getsource(korcen))):
+        if (
+            isinstance(node, ast.Call)
+            and isinstance(node.func, ast.Attribute)
+            and isinstance(node.func.value, ast.Name)
+            and node.func.value.id == "re"
+            and node.func.attr == "sub"
+            and node.args
+            and isinstance(node.args[0], ast.Constant)
+            and isinstance(node.args[0].value, str)
+        ):
+            pattern = node.args[0].value
+            patterns[(pattern, 0)] = re.compile(pattern)
+    return patterns
+
+
+def _build_check() -> Callable[[str], bool]:
+    # korcen 모듈의 함수들을 미리 컴파일한 re를 바라보는 전역 환경으로 복제
+    compiled_globals = dict(vars(korcen))
+    compiled_globals["re"] = _CompiledRe(_collect_patterns())
+    for name, value in vars(korcen).items():
+        if (
+            isinstance(value, types.FunctionType)
+            and value.__module__ == korcen.__name__
+        ):
+            compiled_globals[name] = types.FunctionType(
+                value.__code__,
+                compiled_globals,
+                value.__name__,
+                value.__defaults__,
+                value.__closure__,
+            )
+    check: Callable[[str], bool] = compiled_globals["check"]
+    return check
+
+
+class Profanity:
+    """
+    비속어 검사 클래스, Reference: https://github.com/Tanat05/korcen
+
+    korcen.check와 같은 결과를 반환하며, 패턴을 import 시점에 한 번만 컴파일하고
+    같은 문자열에 대한 결과는 LRU 캐시(PROFANITY_CACHE_SIZE)로 재사용한다.
+    """
+
+    _compiled_check = staticmethod(_build_check())
+
+    @staticmethod
+    @functools.lru_cache(maxsize=settings.PROFANITY_CACHE_SIZE)
+    def _cached_check(text: str) -> bool:
+        with Metrics.korcen_duration.time():
+            return bool(Profanity._compiled_check(text))
+
+    @classmethod
+    def check(cls, text: str) -> bool:
+        """
+        문자열에 비속어가 포함되어 있는지 검사하는 함수
+
+        Parameter
+        ---
+        text: str, 검사할 문자열
+
+        Return
+        ---
+        bool, 비속어 포함 여부
+        """
+        return cls._cached_check(text)
+
+    @classmethod
+    def check_many(cls, text_list: list[str]) -> list[bool]:
+        """
+        여러 문자열을 한 번에 검사하는 함수 (중복 문자열은 한 번만 검사)
+
+        Parameter
+        ---
+        text_list: list[str], 검사할 문자열 리스트
+
+        Return
+        ---
+        list[bool], 입력 순서대로 비속어 포함 여부
+        """
+        results = {text: cls._cached_check(text) for text in set(text_list)}
+        return [results[text] for text in text_list]
+
+    @classmethod
+    def stats(cls) -> dict[str, int]:
+        info = cls._cached_check.cache_info()
+        return {
+            "hits": info.hits,
+            "misses": info.misses,
+            "size": info.currsize,
+            "max_size": info.maxsize or 0,
+        }
+
+
+# 프로세스 풀에서 실행되므로 pickle 가능한 모듈 최상위 함수로 정의
+def check_many(text_list: list[str]) -> list[bool]:
+    return Profanity.check_many(text_list)
@@ -0,0 +1,131 @@
+import asyncio
+from typing import Generic, Hashable, TypeVar
+
+from app.utils.metrics import Metrics
+
+K = TypeVar("K", bound=Hashable)
+T = TypeVar("T")
+
+
+class Subscription(Generic[K, T]):
+    """
+    PubSub의 구독 하나, 구독자마다 크기가 제한된 큐를 가짐
+    """
+
+    def __init__(self, topic: K, queue_size: int) -> None:
+        self.topic = topic
+        self.evicted = False
+        # None은 구독이 끊겼음을 알리는 표시
+        self._queue: asyncio.Queue[T | None] = asyncio.Queue(maxsize=queue_size)
+
+    async def get(self) -> T | None:
+        """
+        다음 메시지를 기다리는 함수
+
+        Return
+        ---
+        T | None, 구독이 끊긴 경우(느린 구독자로 제거) None
+        """
+        return await self._queue.get()
+
+    def _put(self, message: T) -> bool:
+        try:
+            self._queue.put_nowait(message)
+        except asyncio.QueueFull:
+            return False
+        return True
+
+    def _close(self) -> None:
+        # 가득 찬 큐를 비우고 종료 표시를 넣어 기다리던 get을 깨움
+        while not self._queue.empty():
+            self._queue.get_nowait()
+        self._queue.put_nowait(None)
+
+
+class PubSub(Generic[K, T]):
+    """
+    워커 프로세스 안에서 토픽별로 메시지를 여러 구독자에게 전달하는 클래스
+
+    - publish는 기다리지 않고 각 구독자의 큐에 바로 넣음
+    - 큐가 가득 찬 구독자(느린 구독자)는 다른 구독자를 막지 않도록 즉시 제거
+    - 연결 수, 전달/제거 횟수 통계를 제공
+    - name을 지정하면 같은 통계를 Prometheus 메트릭(pubsub_*)에도 기록
+    """
+
+    def __init__(self, queue_size: int, name: str | None = None) -> None:
+        self.queue_size = queue_size
+        self._subscribers: dict[K, set[Subscription[K, T]]] = {}
+        self.published = 0
+        self.delivered = 0
+        self.evicted = 0
+        self._metrics = _PubSubMetrics(name) if name is not None else None
+
+    def subscribe(self, topic: K) -> Subscription[K, T]:
+        subscription: Subscription[K, T] = Subscription(topic, self.queue_size)
+        self._subscribers.setdefault(topic, set()).add(subscription)
+        if self._metrics is not None:
+            self._metrics.connections.inc()
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription[K, T]) -> None:
+        subscribers = self._subscribers.get(subscription.topic)
+        if subscribers is None or subscription not in subscribers:
+            return
+
+        subscribers.remove(subscription)
+        if self._metrics is not None:
+            self._metrics.connections.dec()
+        if not subscribers:
+            del self._subscribers[subscription.topic]
+
+    def publish(self, topic: K, message: T) -> int:
+        """
+        토픽의 모든 구독자에게 메시지를 전달하는 함수
+
+        Parameters
+        ---
+        topic: K, 토픽
+        message: T, 메시지
+
+        Return
+        ---
+        int, 메시지를 받은 구독자 수
+        """
+        self.published += 1
+        delivered = 0
+        for subscription in list(self._subscribers.get(topic, ())):
+            if subscription._put(message):
+                delivered += 1
+                continue
+
+            subscription.evicted = True
+            subscription._close()
+            self.unsubscribe(subscription)
+            self.evicted += 1
+            if self._metrics is not None:
+                self._metrics.evicted.inc()
+
+        self.delivered += delivered
+        if self._metrics is not None and delivered:
+            self._metrics.delivered.inc(delivered)
+        return delivered
+
+    def connection_count(self) -> int:
+        return sum(len(subscribers) for subscribers in self._subscribers.values())
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "connections": self.connection_count(),
+            "topics": len(self._subscribers),
+            "published": self.published,
+            "delivered": self.delivered,
+            "evicted": self.evicted,
+        }
+
+
+class _PubSubMetrics:
+    # 메시지마다 라벨을 찾지 않도록 이름별 메트릭을 미리 만들어 둠
+    def __init__(self, name: str) -> None:
+        self.connections = Metrics.pubsub_connections.labels(name)
+        self.delivered = Metrics.pubsub_messages.labels(name, "delivered")
+        self.evicted = Metrics.pubsub_messages.labels(name, "evicted")
@@ -1,10 +1,18 @@
+import hashlib
+import hmac
+import os
+import time
 from typing import Optional, cast
 from passlib.context import CryptContext
 from datetime import datetime, timedelta, timezone
 from jose import jwt, exceptions
-from pydantic import BaseModel, ValidationError
+from pydantic import BaseModel, ConfigDict, ValidationError
 
 from app.base.settings import settings
+from app.utils.cache import TTLCache
+from app.utils.cpu_pool import CPUPool
+from app.utils.metrics import Metrics
+from app.utils.timing import ServerTiming
 from app.core.exception import (
     ExpiredTokenException,
     InvalidTokenDataException,
@@ -13,52 +21,319 @@ from app.core.exception import (
 
 
 class Security:
-    pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+    # 작업 비용(BCRYPT_ROUNDS)이 다른 해시는 needs_update 대상이 되어 로그인 시 재해싱됨
+    pwd_context = CryptContext(
+        schemes=["bcrypt"],
+        deprecated="auto",
+        bcrypt__default_rounds=settings.BCRYPT_ROUNDS,
+        bcrypt__min_rounds=settings.BCRYPT_ROUNDS,
+        bcrypt__max_rounds=settings.BCRYPT_ROUNDS,
+    )
 
     @classmethod
     async def hash_password(cls, password: str) -> str:
-        return str(cls.pwd_context.hash(password))
+        with ServerTiming.measure("bcrypt"):
+            return await CPUPool.run("bcrypt_hash", _hash_password, password)
 
     @classmethod
     async def verify_password(cls, plain_password: str, hashed_password: str) -> bool:
-        return cast(bool, cls.pwd_context.verify(plain_password, hashed_password))
+        with ServerTiming.measure("bcrypt"):
+            return await CPUPool.run(
+                "bcrypt_verify", _verify_password, plain_password, hashed_password
+            )
+
+    @classmethod
+    async def verify_and_update_password(
+        cls, plain_password: str, hashed_password: str
+    ) -> tuple[bool, str | None]:
+        with ServerTiming.measure("bcrypt"):
+            return await CPUPool.run(
+                "bcrypt_verify",
+                _verify_and_update_password,
+                plain_password,
+                hashed_password,
+            )
+
+    @classmethod
+    async def verify_login_password(
+        cls, board_id: str, plain_password: str, hashed_password: str
+    ) -> tuple[bool, str | None]:
+        """
+        로그인 비밀번호를 검증하는 함수
+
+        LOGIN_CACHE_ENABLED가 켜져 있으면 최근에 검증에 성공한 비밀번호는
+        bcrypt 없이 통과시키고, 틀린 비밀번호는 항상 bcrypt로 검증한다.
+        저장된 해시의 작업 비용이 설정과 다르면 새 해시를 함께 반환한다.
+
+        Parameters
+        ---
+        board_id: str, 칠판 ID
+        plain_password: str, 요청된 비밀번호
+        hashed_password: str, 저장된 비밀번호 해시
+
+        Return
+        ---
+        tuple[bool, str | None], 비밀번호 일치 여부, 재해싱된 해시(필요 없으면 None)
+        """
+        # 재해싱이 필요한 해시는 캐시가 있어도 bcrypt로 검증해 새 해시를 만듦
+        if (
+            settings.LOGIN_CACHE_ENABLED
+            and not cls.pwd_context.needs_update(hashed_password)
+            and CredentialCache.contains(board_id, plain_password, hashed_password)
+        ):
+            return True, None
+
+        started_at = time.perf_counter()
+        is_verified, new_hash = await cls.verify_and_update_password(
+            plain_password, hashed_password
+        )
+
+        if settings.LOGIN_CACHE_ENABLED:
+            CredentialCache.record_verify_time(time.perf_counter() - started_at)
+            if is_verified:
+                CredentialCache.add(
+                    board_id, plain_password, new_hash or hashed_password
+                )
+        return is_verified, new_hash
+
+
+class CredentialCache:
+    """
+    최근에 bcrypt 검증에 성공한 (칠판 ID, 비밀번호)를 짧은 시간 동안 보관하는 캐시
+
+    비밀번호는 프로세스마다 새로 만든 키로 HMAC한 값만 보관하며, 저장된 해시도
+    함께 HMAC하므로 비밀번호 해시가 바뀌면 기존 항목은 자동으로 무효가 된다.
+    (다른 워커에서 해시가 바뀐 경우도 같으므로 별도의 삭제 함수를 두지 않음)
+    해시가 다른 항목은 적중이 아니므로 조회 통계는 TTLCache 대신 직접 기록한다.
+    """
+
+    _key = os.urandom(32)
+    _cache: TTLCache[str, bytes] = TTLCache(
+        max_size=settings.LOGIN_CACHE_MAX_SIZE, ttl=settings.LOGIN_CACHE_TTL_SECONDS
+    )
+    _hits = 0
+    _misses = 0
+    _verify_count = 0
+    _verify_seconds = 0.0
+    _saved_seconds = 0.0
+    _hit_metric = Metrics.cache_lookups.labels("login_credential", "hit")
+    _miss_metric = Metrics.cache_lookups.labels("login_credential", "miss")
+    _entries_metric = Metrics.cache_entries.labels("login_credential")
+
+    @classmethod
+    def _digest(cls, plain_password: str, hashed_password: str) -> bytes:
+        message = plain_password.encode() + b"\0" + hashed_password.encode()
+        return hmac.new(cls._key, message, hashlib.sha256).digest()
+
+    @classmethod
+    def contains(cls, board_id: str, plain_password: str, hashed_password: str) -> bool:
+        digest = cls._cache.get(board_id)
+        # 만료된 항목은 조회 시 제거되므로 항목 수를 함께 갱신
+        cls._entries_metric.set(len(cls._cache))
+        if digest is None or not hmac.compare_digest(
+            digest, cls._digest(plain_password, hashed_password)
+        ):
+            cls._misses += 1
+            cls._miss_metric.inc()
+            return False
+
+        # 캐시 적중 시 bcrypt 평균 검증 시간만큼 절약한 것으로 계산
+        cls._hits += 1
+        cls._hit_metric.inc()
+        if cls._verify_count:
+            saved_seconds = cls._verify_seconds / cls._verify_count
+            cls._saved_seconds += saved_seconds
+            Metrics.login_cache_saved_seconds.inc(saved_seconds)
+        return True
+
+    @classmethod
+    def add(cls, board_id: str, plain_password: str, hashed_password: str) -> None:
+        cls._cache.set(board_id, cls._digest(plain_password, hashed_password))
+        cls._entries_metric.set(len(cls._cache))
+
+    @classmethod
+    def record_verify_time(cls, seconds: float) -> None:
+        cls._verify_count += 1
+        cls._verify_seconds += seconds
+
+    @classmethod
+    def stats(cls) -> dict[str, float]:
+        return {
+            "size": len(cls._cache),
+            "hits": cls._hits,
+            "misses": cls._misses,
+            "bcrypt_verify_count": cls._verify_count,
+            "bcrypt_verify_seconds": cls._verify_seconds,
+            "saved_seconds": cls._saved_seconds,
+        }
+
+
+# 프로세스 풀에서 실행되므로 pickle 가능한 모듈 최상위 함수로 정의
+def _hash_password(password: str) -> str:
+    with Metrics.bcrypt_duration.labels("hash").time():
+        return str(Security.pwd_context.hash(password))
+
+
+def _verify_password(plain_password: str, hashed_password: str) -> bool:
+    with Metrics.bcrypt_duration.labels("verify").time():
+        return cast(bool, Security.pwd_context.verify(plain_password, hashed_password))
+
+
+def _verify_and_update_password(
+    plain_password: str, hashed_password: str
+) -> tuple[bool, str | None]:
+    with Metrics.bcrypt_duration.labels("verify").time():
+        return cast(
+            tuple[bool, str | None],
+            Security.pwd_context.verify_and_update(plain_password, hashed_password),
+        )
 
 
 class JWT:
+    ACCESS = "access"
+    REFRESH = "refresh"
+    BOARD_NAME_RECEIPT = "board_name_receipt"
+
     class Payload(BaseModel):
+        # 디코딩 결과를 여러 요청이 공유하므로 변경 불가로 설정
+        model_config = ConfigDict(frozen=True)
+
         board_id: str
         exp: float
+        # token_type이 없는 기존 토큰은 엑세스 토큰으로 취급
+        token_type: str = "access"
+
+    # 검증에 성공한 토큰의 디코딩 결과, 각 항목은 토큰의 exp 시각에 만료됨
+    _payload_cache: TTLCache[str, Payload] = TTLCache(
+        max_size=settings.JWT_DECODE_CACHE_SIZE, ttl=0, name="jwt_payload"
+    )
 
     @classmethod
     async def create_access_token(cls, board_id: str) -> str:
+        return cls._create_token(
+            board_id=board_id,
+            token_type=cls.ACCESS,
+            expire_minutes=settings.JWT_ACCESS_TOKEN_EXPIRE_MINUTES,
+        )
 
-        KST = timezone(timedelta(hours=9))
-        expire = datetime.now(KST) + timedelta(
-            minutes=settings.JWT_ACCESS_TOKEN_EXPIRE_MINUTES
+    @classmethod
+    async def create_refresh_token(cls, board_id: str) -> str:
+        return cls._create_token(
+            board_id=board_id,
+            token_type=cls.REFRESH,
+            expire_minutes=settings.JWT_REFRESH_TOKEN_EXPIRE_MINUTES,
         )
 
-        to_encode = cls.Payload(board_id=board_id, exp=expire.timestamp()).model_dump()
+    @classmethod
+    def _create_token(cls, board_id: str, token_type: str, expire_minutes: int) -> str:
 
-        encoded_jwt = jwt.encode(
-            to_encode, settings.JWT_SECRET_KEY, algorithm=settings.JWT_ALGORITHM
-        )
+        KST = timezone(timedelta(hours=9))
+        expire = datetime.now(KST) + timedelta(minutes=expire_minutes)
+
+        to_encode = cls.Payload(
+            board_id=board_id, exp=expire.timestamp(), token_type=token_type
+        ).model_dump()
+
+        with ServerTiming.measure("jwt"):
+            encoded_jwt = jwt.encode(
+                to_encode, settings.JWT_SECRET_KEY, algorithm=settings.JWT_ALGORITHM
+            )
         return cast(str, encoded_jwt)
 
     @classmethod
     def decode_access_token(cls, token: str) -> Payload:
-        try:
-            decoded = jwt.decode(
-                token,
-                settings.JWT_SECRET_KEY,
-                algorithms=[settings.JWT_ALGORITHM],
+        return cls._decode_token(token=token, token_type=cls.ACCESS)
+
+    @classmethod
+    def decode_refresh_token(cls, token: str) -> Payload:
+        return cls._decode_token(token=token, token_type=cls.REFRESH)
+
+    @classmethod
+    def _decode_token(cls, token: str, token_type: str) -> Payload:
+        payload = cls._payload_cache.get(token)
+        if payload is None:
+            try:
+                with ServerTiming.measure("jwt"):
+                    decoded = jwt.decode(
+                        token,
+                        settings.JWT_SECRET_KEY,
+                        algorithms=[settings.JWT_ALGORITHM],
+                    )
+                payload = cls.Payload.model_validate(decoded)
+            except exceptions.ExpiredSignatureError:
+                raise ExpiredTokenException()
+            except exceptions.JWTError:
+                raise InvalidTokenException()
+            except ValidationError:
+                raise InvalidTokenDataException()
+
+            # 유효한 토큰만 만료 시각까지 캐싱
+            cls._payload_cache.set(token, payload, ttl=payload.exp - time.time())
+
+        # 엑세스 토큰과 리프레시 토큰은 서로 대신 사용할 수 없음
+        if payload.token_type != token_type:
+            raise InvalidTokenException()
+        return payload
+
+    @classmethod
+    def create_board_name_receipt(cls, board_name: str) -> str:
+        """
+        칠판 이름 검증을 통과했음을 증명하는 영수증을 발급하는 함수
+
+        Parameter
+        ---
+        board_name: str, 검증을 통과한 칠판 이름
+
+        Return
+        ---
+        str, 칠판 이름이 서명된 짧은 유효 시간의 토큰
+        """
+        expire = datetime.now(timezone.utc) + timedelta(
+            minutes=settings.BOARD_NAME_RECEIPT_EXPIRE_MINUTES
+        )
+        to_encode = {
+            "board_name": board_name,
+            "exp": expire.timestamp(),
+            "token_type": cls.BOARD_NAME_RECEIPT,
+        }
+
+        with ServerTiming.measure("jwt"):
+            encoded_jwt = jwt.encode(
+                to_encode, settings.JWT_SECRET_KEY, algorithm=settings.JWT_ALGORITHM
             )
-            return cls.Payload.model_validate(decoded)
-        except exceptions.ExpiredSignatureError:
-            raise ExpiredTokenException()
+        return cast(str, encoded_jwt)
+
+    @classmethod
+    def verify_board_name_receipt(cls, receipt: str, board_name: str) -> bool:
+        """
+        영수증이 유효하고 같은 칠판 이름에 대해 발급되었는지 확인하는 함수
+
+        영수증이 만료되었거나 위조된 경우 예외 대신 False를 반환해
+        호출하는 쪽이 전체 검증으로 돌아가도록 한다.
+
+        Parameters
+        ---
+        receipt: str, create_board_name_receipt로 발급된 영수증
+        board_name: str, 확인할 칠판 이름
+
+        Return
+        ---
+        bool, 영수증 유효 여부
+        """
+        try:
+            with ServerTiming.measure("jwt"):
+                decoded = jwt.decode(
+                    receipt,
+                    settings.JWT_SECRET_KEY,
+                    algorithms=[settings.JWT_ALGORITHM],
+                )
         except exceptions.JWTError:
-            raise InvalidTokenException()
-        except ValidationError:
-            raise InvalidTokenDataException()
+            return False
+
+        return bool(
+            decoded.get("token_type") == cls.BOARD_NAME_RECEIPT
+            and decoded.get("board_name") == board_name
+        )
 
     @classmethod
     def optional_token(cls, token: Optional[str] = None) -> Optional[Payload]:
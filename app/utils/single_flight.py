@@ -0,0 +1,61 @@
+import asyncio
+from typing import Awaitable, Callable, Generic, Hashable, TypeVar
+
+from app.utils.metrics import Metrics
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class SingleFlight(Generic[K, V]):
+    """
+    같은 키로 동시에 들어온 조회를 하나의 실행으로 합치는 클래스
+
+    먼저 들어온 요청이 조회를 시작하면, 끝나기 전에 들어온 같은 키의 요청은
+    새로 조회하지 않고 같은 결과(또는 같은 예외)를 기다린다.
+    조회는 별도 Task에서 실행되므로 먼저 들어온 요청이 취소되어도
+    기다리던 다른 요청에는 영향이 없다.
+    name을 지정하면 실행/합류 횟수를 Prometheus 메트릭(single_flight_calls)에도 기록한다.
+    """
+
+    def __init__(self, name: str | None = None) -> None:
+        self._calls: dict[K, asyncio.Task[V]] = {}
+        self.executions = 0
+        self.coalesced = 0
+        self._executed_metric = (
+            Metrics.single_flight_calls.labels(name, "executed") if name else None
+        )
+        self._coalesced_metric = (
+            Metrics.single_flight_calls.labels(name, "coalesced") if name else None
+        )
+
+    async def do(self, key: K, fn: Callable[[], Awaitable[V]]) -> V:
+        task = self._calls.get(key)
+        if task is None:
+            self.executions += 1
+            if self._executed_metric is not None:
+                self._executed_metric.inc()
+            task = asyncio.ensure_future(fn())
+            self._calls[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+        else:
+            self.coalesced += 1
+            if self._coalesced_metric is not None:
+                self._coalesced_metric.inc()
+
+        return await asyncio.shield(task)
+
+    def _forget(self, key: K, task: asyncio.Task[V]) -> None:
+        if self._calls.get(key) is task:
+            del self._calls[key]
+
+        # 기다리던 요청이 모두 취소된 경우에도 예외가 경고로 남지 않도록 확인
+        if not task.cancelled():
+            task.exception()
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "in_flight": len(self._calls),
+            "executions": self.executions,
+            "coalesced": self.coalesced,
+        }
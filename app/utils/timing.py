@@ -0,0 +1,85 @@
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from typing import Iterator
+
+# (단계 이름, 걸린 시간(초)) 목록, motor의 스레드에도 같은 리스트가 전달됨
+_timings: ContextVar[list[tuple[str, float]] | None] = ContextVar(
+    "server_timing", default=None
+)
+
+
+class ServerTiming:
+    """
+    요청 단위로 단계별(bcrypt, korcen, mongo 등) 실행 시간을 모으는 클래스
+
+    서비스 코드는 measure/add로 시간을 기록하고, ServerTimingMiddleware가
+    요청이 끝날 때 Server-Timing 헤더로 내보낸다.
+    요청 밖(start가 호출되지 않은 컨텍스트)에서는 아무것도 기록하지 않는다.
+    """
+
+    @classmethod
+    def start(cls) -> Token[list[tuple[str, float]] | None]:
+        return _timings.set([])
+
+    @classmethod
+    def reset(cls, token: Token[list[tuple[str, float]] | None]) -> None:
+        _timings.reset(token)
+
+    @classmethod
+    def add(cls, name: str, seconds: float) -> None:
+        """
+        단계 실행 시간을 기록하는 함수
+
+        Parameters
+        ---
+        name: str, 단계 이름
+        seconds: float, 걸린 시간(초)
+        """
+        timings = _timings.get()
+        if timings is not None:
+            # list.append는 스레드에서 호출되어도 안전
+            timings.append((name, seconds))
+
+    @classmethod
+    @contextmanager
+    def measure(cls, name: str) -> Iterator[None]:
+        """
+        with 블록의 실행 시간을 기록하는 함수 (await를 포함해도 됨)
+
+        Parameter
+        ---
+        name: str, 단계 이름
+        """
+        started_at = time.perf_counter()
+        try:
+            yield
+        finally:
+            cls.add(name, time.perf_counter() - started_at)
+
+    @classmethod
+    def summary(cls) -> dict[str, float]:
+        """
+        단계별 걸린 시간 합계(ms)를 반환하는 함수
+        """
+        result: dict[str, float] = {}
+        for name, seconds in _timings.get() or ():
+            result[name] = result.get(name, 0.0) + seconds * 1000
+        return result
+
+    @classmethod
+    def header(cls, total_ms: float) -> str:
+        """
+        Server-Timing 헤더 값을 만드는 함수
+
+        Parameter
+        ---
+        total_ms: float, 요청 전체 처리 시간(ms)
+
+        Return
+        ---
+        str, 예: "bcrypt;dur=251.3, mongo;dur=3.2, total;dur=260.1"
+        """
+        entries = [f"{name};dur={ms:.1f}" for name, ms in cls.summary().items()]
+        entries.append(f"total;dur={total_ms:.1f}")
+        return ", ".join(entries)
@@ -0,0 +1,167 @@
+import dataclasses
+import re
+import time
+from typing import Callable
+
+from app.base.base_exception import BaseHTTPException
+from app.utils.profanity import Profanity
+from app.utils.timing import ServerTiming
+
+
+class Cost:
+    """
+    검사 규칙의 상대적인 비용, 값이 작은 규칙부터 실행됨
+    """
+
+    LENGTH = 0
+    CHAR = 1
+    REGEX = 2
+    PROFANITY = 3
+
+
+@dataclasses.dataclass(kw_only=True, frozen=True)
+class Rule:
+    name: str
+    check: Callable[[str], bool]
+    # 인자 없이 생성되는 app/core/exception.py의 예외 클래스
+    exception: Callable[[], BaseHTTPException]
+    cost: int
+    # Server-Timing에 기록될 단계 이름
+    stage: str = "validate"
+
+
+class Validator:
+    """
+    필드마다 검사 규칙을 한 번 선언해두고 재사용하는 검증기
+
+    - 정규식은 규칙을 만들 때 한 번만 컴파일
+    - 규칙은 비용이 낮은 순서로 정렬되며, 비용이 같으면 선언 순서를 유지
+    - 처음 실패한 규칙의 예외(app/core/exception.py)를 그대로 발생시킴
+    """
+
+    def __init__(self, rules: list[Rule]) -> None:
+        self.rules = tuple(sorted(rules, key=lambda rule: rule.cost))
+
+    def validate(self, value: str, max_cost: int = Cost.PROFANITY) -> None:
+        """
+        값이 모든 규칙을 통과하는지 검사하는 함수
+
+        Parameters
+        ---
+        value: str, 검사할 값
+        max_cost: int, 이 비용 이하의 규칙만 실행 (비속어 검사를 생략할 때 사용)
+
+        Exception
+        ---
+        400: 처음으로 실패한 규칙의 예외
+        """
+        error = self.first_error(value, max_cost=max_cost)
+        if error is not None:
+            raise error
+
+    def first_error(
+        self, value: str, max_cost: int = Cost.PROFANITY
+    ) -> BaseHTTPException | None:
+        """
+        처음으로 실패한 규칙의 예외를 발생시키지 않고 반환하는 함수
+
+        Parameters
+        ---
+        value: str, 검사할 값
+        max_cost: int, 이 비용 이하의 규칙만 실행
+
+        Return
+        ---
+        BaseHTTPException | None, 모든 규칙을 통과하면 None
+        """
+        for rule in self.rules:
+            if rule.cost > max_cost:
+                break
+            started_at = time.perf_counter()
+            passed = rule.check(value)
+            ServerTiming.add(rule.stage, time.perf_counter() - started_at)
+            if not passed:
+                return rule.exception()
+        return None
+
+    def rule(self, name: str) -> Rule:
+        """
+        이름으로 규칙을 찾는 함수
+
+        Parameter
+        ---
+        name: str, 규칙 이름
+        """
+        return next(rule for rule in self.rules if rule.name == name)
+
+    def without(self, *names: str) -> "Validator":
+        """
+        일부 규칙을 제외한 새 검증기를 반환하는 함수
+
+        Parameter
+        ---
+        names: str, 제외할 규칙 이름
+        """
+        return Validator([rule for rule in self.rules if rule.name not in names])
+
+
+def min_length(length: int, exception: Callable[[], BaseHTTPException]) -> Rule:
+    return Rule(
+        name="min_length",
+        check=lambda value: len(value) >= length,
+        exception=exception,
+        cost=Cost.LENGTH,
+    )
+
+
+def max_length(
+    length: Callable[[str], int] | int, exception: Callable[[], BaseHTTPException]
+) -> Rule:
+    # 값에 따라 최대 길이가 달라지는 경우 함수로 전달
+    get_length = length if callable(length) else (lambda _: length)
+    return Rule(
+        name="max_length",
+        check=lambda value: len(value) <= get_length(value),
+        exception=exception,
+        cost=Cost.LENGTH,
+    )
+
+
+def no_space_front_back(exception: Callable[[], BaseHTTPException]) -> Rule:
+    # 빈 문자열은 min_length 규칙이 먼저 걸러냄
+    return Rule(
+        name="no_space_front_back",
+        check=lambda value: not value or (value[0] != " " and value[-1] != " "),
+        exception=exception,
+        cost=Cost.LENGTH,
+    )
+
+
+def not_contains(char: str, exception: Callable[[], BaseHTTPException]) -> Rule:
+    return Rule(
+        name="not_contains",
+        check=lambda value: char not in value,
+        exception=exception,
+        cost=Cost.CHAR,
+    )
+
+
+def fullmatch(pattern: str, exception: Callable[[], BaseHTTPException]) -> Rule:
+    compiled = re.compile(pattern)
+    return Rule(
+        name="fullmatch",
+        check=lambda value: compiled.fullmatch(value) is not None,
+        exception=exception,
+        cost=Cost.REGEX,
+    )
+
+
+def no_profanity(exception: Callable[[], BaseHTTPException]) -> Rule:
+    # Reference: https://github.com/Tanat05/korcen
+    return Rule(
+        name="no_profanity",
+        check=lambda value: not Profanity.check(value),
+        exception=exception,
+        cost=Cost.PROFANITY,
+        stage="korcen",
+    )
@@ -0,0 +1,42 @@
+"""
+bcrypt 작업 비용(rounds)별 해싱/검증 지연 시간과 코어당 최대 로그인 처리량을 측정하는 벤치마크
+
+실행: poetry run python -m benchmarks.bcrypt_cost [최소 rounds] [최대 rounds]
+"""
+
+import sys
+import time
+
+from passlib.context import CryptContext
+
+PASSWORD = "0000"
+
+
+def _measure(context: CryptContext, repeat: int) -> tuple[float, float]:
+    started_at = time.perf_counter()
+    for _ in range(repeat):
+        hashed = context.hash(PASSWORD)
+    hash_time = (time.perf_counter() - started_at) / repeat
+
+    started_at = time.perf_counter()
+    for _ in range(repeat):
+        context.verify(PASSWORD, hashed)
+    verify_time = (time.perf_counter() - started_at) / repeat
+    return hash_time, verify_time
+
+
+def main(min_rounds: int = 10, max_rounds: int = 14) -> None:
+    print(f"{'rounds':>6} | {'hash':>10} | {'verify':>10} | {'login/s/core':>12}")
+    for rounds in range(min_rounds, max_rounds + 1):
+        context = CryptContext(schemes=["bcrypt"], bcrypt__default_rounds=rounds)
+        # 비용이 1 오를 때마다 시간이 2배가 되므로 반복 횟수를 줄여 측정 시간을 맞춤
+        repeat = max(1, 2 ** (max_rounds - rounds))
+        hash_time, verify_time = _measure(context, repeat)
+        print(
+            f"{rounds:>6} | {hash_time * 1000:7.1f} ms | {verify_time * 1000:7.1f} ms"
+            f" | {1 / verify_time:12.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:3]))
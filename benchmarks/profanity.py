@@ -0,0 +1,72 @@
+"""
+korcen.check와 Profanity.check의 결과 일치 여부와 처리 속도를 비교하는 벤치마크
+
+실행: poetry run python -m benchmarks.profanity
+"""
+
+import time
+from typing import Callable
+
+from korcen import korcen
+
+from app.utils.profanity import Profanity
+
+CORPUS = [
+    "인규",
+    "민서",
+    "졸업 축하해",
+    "너는 좋은 개발자가 되렴",
+    "졸업 축하해 앞으로도 화이팅!",
+    "안녕하세요 반갑습니다 오늘 날씨가 참 좋네요",
+    "그동안 고마웠어 대학 가서도 연락하자",
+    "우리 반 최고! 3년 동안 정말 즐거웠다",
+    "선생님 감사합니다 건강하세요",
+    "고양이새끼 너무 귀엽다",
+    "개발남아 화이팅",
+    "전염병 조심하고 마스크 꼭 써",
+    "테스트욕할거야 시 발",
+    "ㅅㅂ 졸업이다",
+    "병신같은 소리 하지마",
+    "꺼져 진짜",
+    "개새끼야",
+    "씨발 드디어 졸업",
+    "좆같은 시험 끝",
+    "닥쳐 그냥 축하나 해",
+    "Congrats on graduating!",
+    "fuck yeah we made it",
+    "ㅋㅋㅋㅋㅋ 졸업 ㅊㅋㅊㅋ",
+    "🎉🎉 졸업 축하 🎓",
+    "오랫동안 같이 지내서 정말 좋았어 " * 3,
+]
+
+
+def _measure(check: Callable[[str], bool], texts: list[str], repeat: int) -> float:
+    started_at = time.perf_counter()
+    for _ in range(repeat):
+        for text in texts:
+            check(text)
+    return (time.perf_counter() - started_at) / (repeat * len(texts))
+
+
+def main(repeat: int = 20) -> None:
+    expected = [bool(korcen.check(text)) for text in CORPUS]
+    actual = [Profanity._compiled_check(text) for text in CORPUS]
+    mismatches = [
+        text for text, a, b in zip(CORPUS, expected, actual) if bool(a) != bool(b)
+    ]
+    if mismatches:
+        raise SystemExit(f"결과 불일치: {mismatches}")
+
+    korcen_time = _measure(korcen.check, CORPUS, repeat)
+    compiled_time = _measure(Profanity._compiled_check, CORPUS, repeat)
+    cached_time = _measure(Profanity.check, CORPUS, repeat)
+
+    print(f"corpus: {len(CORPUS)}개, 비속어 {sum(expected)}개, 결과 일치")
+    print(f"korcen.check              : {korcen_time * 1000:8.3f} ms/회")
+    print(f"Profanity (precompiled)   : {compiled_time * 1000:8.3f} ms/회")
+    print(f"Profanity (precompiled+LRU): {cached_time * 1000:8.3f} ms/회")
+    print(f"속도 향상 (precompiled)   : {korcen_time / compiled_time:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""
+필드별 검증 규칙의 초당 처리량을 측정하는 벤치마크
+
+비속어 검사는 LRU 캐시를 거치므로, 같은 문자열을 반복해 캐시가 적중한 값과
+매 회 캐시를 비워 korcen 검사까지 실행한 값을 함께 출력한다.
+
+실행: poetry run python -m benchmarks.validation
+"""
+
+import time
+
+from app.base.base_exception import BaseHTTPException
+from app.domain.board.validator import BoardValidator
+from app.domain.memo.validator import MemoValidator
+from app.utils.profanity import Profanity
+from app.utils.validator import Cost, Validator
+
+CASES: list[tuple[str, Validator, str]] = [
+    ("board_name 통과", BoardValidator.board_name, "인규"),
+    ("board_name 길이 실패", BoardValidator.board_name, "닉"),
+    ("board_name 문자 실패", BoardValidator.board_name, "인규\t"),
+    ("password 통과", BoardValidator.password, "password1"),
+    ("password 공백 실패", BoardValidator.password, "pass word"),
+    ("author 통과", MemoValidator.author, "민서"),
+    ("content 통과", MemoValidator.content, "졸업 축하해 앞으로도 화이팅!"),
+]
+
+
+def _measure(
+    validator: Validator, value: str, repeat: int, max_cost: int, cached: bool = True
+) -> float:
+    started_at = time.perf_counter()
+    for _ in range(repeat):
+        if not cached:
+            Profanity._cached_check.cache_clear()
+        try:
+            validator.validate(value, max_cost=max_cost)
+        except BaseHTTPException:
+            pass
+    return repeat / (time.perf_counter() - started_at)
+
+
+def main(repeat: int = 2000) -> None:
+    print(f"{'case':<22} | {'규칙만':>12} | {'+비속어(캐시)':>12} | {'+비속어':>10}")
+    for name, validator, value in CASES:
+        rules_only = _measure(validator, value, repeat, Cost.PROFANITY - 1)
+        cached = _measure(validator, value, repeat, Cost.PROFANITY)
+        uncached = _measure(
+            validator, value, repeat // 20, Cost.PROFANITY, cached=False
+        )
+        print(
+            f"{name:<22} | {rules_only:10.0f}/s | {cached:10.0f}/s | {uncached:8.0f}/s"
+        )
+
+
+if __name__ == "__main__":
+    main()
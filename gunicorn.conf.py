@@ -0,0 +1,40 @@
+import os
+import re
+import shutil
+import tempfile
+from typing import Any
+
+# 같은 서버에서 dev, prod 배포가 함께 실행되므로 워커들이 공유하는 파일은
+# bind 주소별 디렉터리에 둔다. (환경 변수로 직접 지정한 경우 그 값을 사용)
+# 마스터에서 app 모듈을 import하면 워커가 설정을 물려받으므로 import하지 않는다.
+
+
+def _deployment_dir(server: Any) -> str:
+    name = re.sub(r"[^0-9A-Za-z]+", "_", "-".join(server.cfg.bind)).strip("_")
+    return os.path.join(tempfile.gettempdir(), f"memory-page-{name}")
+
+
+def on_starting(server: Any) -> None:
+    deployment_dir = _deployment_dir(server)
+
+    # 워커 간 이벤트 버스 소켓, 다른 배포의 워커에 이벤트가 전달되지 않도록 분리
+    event_bus_dir = os.environ.setdefault(
+        "EVENT_BUS_SOCKET_DIR", os.path.join(deployment_dir, "event-bus")
+    )
+    # 이전 실행에서 남은 소켓 파일 삭제
+    shutil.rmtree(event_bus_dir, ignore_errors=True)
+
+    # prometheus_client는 import 시점에 이 환경 변수를 읽으므로 워커를 만들기 전에 설정
+    metrics_dir = os.environ.setdefault(
+        "PROMETHEUS_MULTIPROC_DIR", os.path.join(deployment_dir, "metrics")
+    )
+    # 이전 실행에서 남은 메트릭 파일 삭제
+    shutil.rmtree(metrics_dir, ignore_errors=True)
+    os.makedirs(metrics_dir)
+
+
+def child_exit(server: Any, worker: Any) -> None:
+    from prometheus_client import multiprocess
+
+    # 종료된 워커의 livesum 게이지(처리 중인 요청 수 등) 제거
+    multiprocess.mark_process_dead(worker.pid)  # type: ignore[no-untyped-call]
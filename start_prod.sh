@@ -15,6 +15,7 @@ echo "새로운 웹 서버를 시작합니다..."
 
 /home/hadoop/anaconda3/bin/poetry install --no-root
 /home/hadoop/anaconda3/bin/poetry run gunicorn app.main:app \
+    --config gunicorn.conf.py \
     --name "gunicorn-main" \
     -w 7 \
     -k uvicorn.workers.UvicornWorker \